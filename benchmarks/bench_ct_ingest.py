@@ -0,0 +1,117 @@
+"""Compare peak memory of whole-document and streamed crt.sh ingestion.
+
+A crt.sh-shaped fixture is generated, served from a local HTTP server and ingested in a
+fresh interpreter per mode so that peak RSS reflects only that mode. The legacy
+baseline needs ``requests`` (pip install requests).
+
+Usage: python benchmarks/bench_ct_ingest.py --certificates 300000 --unique-names 5000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from neurosploit.core import AsyncNeuroRecon, ScanConfig  # noqa: E402
+from stubs import StubFileServer  # noqa: E402
+
+ZONE = "bench.test"
+
+
+def write_fixture(path: Path, certificates: int, unique_names: int) -> None:
+    rng = random.Random(7)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("[")
+        for index in range(certificates):
+            host = f"host{rng.randrange(unique_names)}.{ZONE}"
+            entry = {
+                "issuer_ca_id": 183267,
+                "issuer_name": "C=US, O=Let's Encrypt, CN=R3",
+                "common_name": host,
+                "name_value": f"{host}\n*.{host}",
+                "id": 9000000000 + index,
+                "entry_timestamp": "2024-05-01T10:00:00.000",
+                "not_before": "2024-05-01T09:00:00",
+                "not_after": "2024-07-30T09:00:00",
+                "serial_number": f"{rng.getrandbits(128):032x}",
+                "result_count": 2,
+            }
+            if index:
+                handle.write(",")
+            handle.write(json.dumps(entry))
+        handle.write("]")
+
+
+def ingest_legacy(url: str) -> int:
+    import requests
+
+    names = set()
+    for cert in requests.get(url, timeout=60).json():
+        for entry in cert.get("name_value", "").splitlines():
+            clean = entry.strip().lower().lstrip("*.")
+            if clean.endswith(f".{ZONE}") and "*" not in clean:
+                names.add(clean)
+    return len(names)
+
+
+async def ingest_streaming(url: str) -> int:
+    recon = AsyncNeuroRecon(ZONE, config=ScanConfig(ct_log_url=url, dns_cache_enabled=False))
+    try:
+        return len(await recon.crt_sh_enum())
+    finally:
+        await recon.close()
+
+
+def run_worker(mode: str, url: str) -> None:
+    started = time.perf_counter()
+    names = ingest_legacy(url) if mode == "legacy" else asyncio.run(ingest_streaming(url))
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"names": names, "seconds": elapsed, "peak_rss_mb": peak_kb / 1024}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--certificates", type=int, default=200000)
+    parser.add_argument("--unique-names", type=int, default=5000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "URL"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(*args.worker)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        fixture = Path(directory) / "crtsh.json"
+        write_fixture(fixture, args.certificates, args.unique_names)
+        size_mb = fixture.stat().st_size / (1024 * 1024)
+        print(f"fixture: {args.certificates} certificates, {size_mb:.1f} MB")
+
+        with StubFileServer(directory) as server:
+            url = f"http://127.0.0.1:{server.port}/crtsh.json?q={{domain}}"
+            modes = ["streaming"] if args.skip_legacy else ["legacy", "streaming"]
+            for mode in modes:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--worker", mode, url],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output)
+                print(
+                    f"{mode:<10} names={result['names']:<7} {result['seconds']:6.2f}s  "
+                    f"peak RSS {result['peak_rss_mb']:7.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
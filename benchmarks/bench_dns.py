@@ -0,0 +1,95 @@
+"""Compare DNS brute-force throughput of the legacy thread-pool lookup and AsyncDNSEngine.
+
+Usage: python benchmarks/bench_dns.py --names 20000 --concurrency 500
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import dns.resolver  # noqa: E402
+
+from neurosploit.core import AsyncNeuroRecon, ScanConfig  # noqa: E402
+from stubs import StubDNSServer  # noqa: E402
+
+ZONE = "bench.test"
+
+
+def legacy_lookup(full_domain: str, port: int, timeout: float):
+    # Mirrors the previous implementation: a fresh Resolver per name, run in a worker thread.
+    try:
+        resolver = dns.resolver.Resolver()
+        resolver.nameservers = ["127.0.0.1"]
+        resolver.port = port
+        resolver.timeout = timeout
+        resolver.lifetime = timeout
+        answers = resolver.resolve(full_domain, "A")
+        return full_domain, str(answers[0])
+    except Exception:
+        return None
+
+
+async def run_legacy(words, port: int, concurrency: int, timeout: float) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(word: str):
+        async with semaphore:
+            return await asyncio.to_thread(legacy_lookup, f"{word}.{ZONE}", port, timeout)
+
+    results = await asyncio.gather(*(one(word) for word in words))
+    return sum(1 for item in results if item)
+
+
+async def run_engine(words, port: int, concurrency: int, timeout: float) -> int:
+    config = ScanConfig(
+        max_concurrency=concurrency,
+        timeout=timeout,
+        dns_nameservers=["127.0.0.1"],
+        dns_port=port,
+        dns_cache_enabled=False,
+    )
+    recon = AsyncNeuroRecon(ZONE, config=config)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(word: str):
+        async with semaphore:
+            return await recon.dns_bruteforce(word)
+
+    try:
+        results = await asyncio.gather(*(one(word) for word in words))
+    finally:
+        await recon.close()
+    return sum(1 for item in results if item)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=5000)
+    parser.add_argument("--hit-ratio", type=float, default=0.1)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    words = [f"host{i}" for i in range(args.names)]
+    hits = int(args.names * args.hit_ratio)
+    records = {f"{word}.{ZONE}": "127.0.0.1" for word in words[:hits]}
+
+    with StubDNSServer(ZONE, records, latency=args.latency_ms / 1000.0) as server:
+        runners = [("async-engine", run_engine)]
+        if not args.skip_legacy:
+            runners.insert(0, ("legacy-threads", run_legacy))
+        for label, runner in runners:
+            started = time.perf_counter()
+            found = asyncio.run(runner(words, server.port, args.concurrency, args.timeout))
+            elapsed = time.perf_counter() - started
+            print(f"{label:<16} {args.names} names in {elapsed:6.2f}s  {args.names / elapsed:9.0f} q/s  found={found}")
+
+
+if __name__ == "__main__":
+    main()
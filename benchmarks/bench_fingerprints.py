@@ -0,0 +1,92 @@
+"""Per-page fingerprint matching cost as the signature count grows.
+
+Compares the compiled FingerprintEngine with the previous approach of one ``in`` scan
+per body literal. The corpus is a set of synthetic pages shaped like saved landing
+pages (inline scripts, asset URLs, prose); pass --corpus DIR to use real saved pages.
+
+Usage: python benchmarks/bench_fingerprints.py --pages 100 --signatures 45 500 2000 5000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from neurosploit.fingerprints import DEFAULT_FINGERPRINTS_PATH, FingerprintEngine  # noqa: E402
+
+WORDS = (
+    "account revenue platform secure cloud dashboard pricing customers enterprise support "
+    "analytics deploy release console status login careers privacy terms developer api"
+).split()
+
+
+def synthetic_page(rng: random.Random, size: int) -> str:
+    parts = ["<!doctype html><html><head><title>Example</title>"]
+    for _ in range(8):
+        parts.append(f'<script src="/static/js/chunk-{rng.getrandbits(32):08x}.js"></script>')
+    parts.append('<link rel="stylesheet" href="/assets/bootstrap.min.css"></head><body>')
+    while sum(len(part) for part in parts) < size:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(14))
+        parts.append(f'<p class="text-{rng.choice(WORDS)}">{sentence}.</p>')
+    parts.append('<script>window.__APP__={"theme":"dark"};</script></body></html>')
+    return "".join(parts)
+
+
+def load_corpus(directory: Path) -> List[str]:
+    return [path.read_text(encoding="utf-8", errors="replace") for path in sorted(directory.glob("*.htm*"))]
+
+
+def signatures(count: int, rng: random.Random) -> Dict[str, Dict[str, List[str]]]:
+    base = json.loads(DEFAULT_FINGERPRINTS_PATH.read_text(encoding="utf-8"))["technologies"]
+    technologies = dict(base)
+    while len(technologies) < count:
+        name = f"lib{len(technologies)}"
+        technologies[name] = {"body": [f"{name}-{rng.getrandbits(24):06x}.min.js", f"data-{name}"]}
+    return technologies
+
+
+def legacy_match(literals: List[str], body: str) -> int:
+    content = body.lower()
+    return sum(1 for literal in literals if literal in content)
+
+
+def per_page_us(func, pages: List[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            func(page)
+    return (time.perf_counter() - started) / (rounds * len(pages)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=64 * 1024)
+    parser.add_argument("--corpus", type=Path, help="Directory of saved .html pages")
+    parser.add_argument("--signatures", type=int, nargs="+", default=[45, 500, 2000, 5000])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    pages = load_corpus(args.corpus) if args.corpus else [synthetic_page(rng, args.page_size) for _ in range(args.pages)]
+    print(f"corpus: {len(pages)} pages, avg {sum(map(len, pages)) // len(pages)} chars")
+    print(f"{'signatures':>10} {'literals':>9} {'compile ms':>11} {'engine us/page':>15} {'legacy us/page':>15}")
+
+    for count in args.signatures:
+        technologies = signatures(count, rng)
+        literals = [literal for rules in technologies.values() for literal in rules.get("body", [])]
+        started = time.perf_counter()
+        engine = FingerprintEngine(technologies)
+        compile_ms = (time.perf_counter() - started) * 1000
+        engine_cost = per_page_us(lambda page: engine.match({}, page), pages, args.rounds)
+        legacy_cost = per_page_us(lambda page: legacy_match(literals, page), pages, args.rounds)
+        print(f"{count:>10} {len(literals):>9} {compile_ms:>11.1f} {engine_cost:>15.0f} {legacy_cost:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
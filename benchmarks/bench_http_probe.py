@@ -0,0 +1,107 @@
+"""Compare HTTP probe throughput of the legacy per-host requests.Session and the pooled aiohttp client.
+
+The legacy baseline needs ``requests`` (pip install requests).
+
+Usage: python benchmarks/bench_http_probe.py --hosts 2000 --concurrency 200 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import requests  # noqa: E402
+
+from neurosploit.core import AsyncNeuroRecon, ScanConfig  # noqa: E402
+from stubs import StubHTTPServer  # noqa: E402
+
+ZONE = "bench.test"
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def legacy_probe(subdomain: str, http_port: int, https_port: int, timeout: float):
+    # Mirrors the previous implementation: one Session per host, full body read, https then http.
+    with requests.Session() as session:
+        session.verify = False
+        for protocol, port in (("https", https_port), ("http", http_port)):
+            try:
+                response = session.get(
+                    f"{protocol}://127.0.0.1:{port}",
+                    headers={"Host": subdomain},
+                    timeout=(timeout, max(2, timeout * 2)),
+                    allow_redirects=True,
+                )
+                return response.status_code, len(response.content), response.text[:64]
+            except Exception:
+                continue
+    return None
+
+
+async def run_legacy(hosts, http_port: int, https_port: int, concurrency: int, timeout: float) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(host: str):
+        async with semaphore:
+            return await asyncio.to_thread(legacy_probe, host, http_port, https_port, timeout)
+
+    results = await asyncio.gather(*(one(host) for host in hosts))
+    return sum(1 for item in results if item)
+
+
+async def run_pooled(hosts, http_port: int, https_port: int, concurrency: int, timeout: float) -> int:
+    config = ScanConfig(
+        max_concurrency=concurrency,
+        timeout=timeout,
+        http_port=http_port,
+        https_port=https_port,
+        dns_cache_enabled=False,
+    )
+    recon = AsyncNeuroRecon(ZONE, config=config)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(host: str):
+        async with semaphore:
+            return await recon.check_subdomain_alive((host, "127.0.0.1"))
+
+    try:
+        results = await asyncio.gather(*(one(host) for host in hosts))
+    finally:
+        await recon.close()
+    return sum(1 for item in results if item)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--body-size", type=int, default=4096)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    hosts = [f"host{i}.{ZONE}" for i in range(args.hosts)]
+    https_port = closed_port()
+
+    with StubHTTPServer(latency=args.latency_ms / 1000.0, body_size=args.body_size) as server:
+        runners = [("pooled-aiohttp", run_pooled)]
+        if not args.skip_legacy:
+            runners.insert(0, ("legacy-requests", run_legacy))
+        for label, runner in runners:
+            started = time.perf_counter()
+            live = asyncio.run(runner(hosts, server.port, https_port, args.concurrency, args.timeout))
+            elapsed = time.perf_counter() - started
+            print(f"{label:<16} {args.hosts} hosts in {elapsed:6.2f}s  {args.hosts / elapsed:8.0f} probes/s  live={live}")
+
+
+if __name__ == "__main__":
+    main()
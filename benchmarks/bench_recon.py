@@ -0,0 +1,317 @@
+"""Benchmark a full reconnaissance run against local stand-in DNS and HTTP/HTTPS servers.
+
+Each scale brute-forces a generated wordlist of N candidate labels through stub
+authoritative DNS servers. A fraction of the candidates resolve to a fleet of stub web
+servers on 127.0.0.x addresses (Linux routes all of 127/8 to loopback; use
+``--servers 1 --dns-servers 1`` elsewhere) that serve HTTP and, when ``openssl`` is on
+the PATH, HTTPS with a throwaway self-signed certificate. CT log lookups and nmap are
+disabled, so nothing leaves the machine. Every scale runs in a fresh process so its
+peak memory is measured on its own.
+
+Results are written to ``--output``. With ``--baseline`` pointing at an earlier output,
+throughput, peak memory and per-phase wall time are compared and changes worse than
+``--tolerance`` are flagged; ``--fail-on-regression`` turns them into a non-zero exit.
+
+Usage: python benchmarks/bench_recon.py --scales 100 10000 100000 --servers 8 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from neurosploit.core import AsyncNeuroRecon, ScanConfig  # noqa: E402
+from stubs import StubDNSServer, StubHTTPServer  # noqa: E402
+
+ZONE = "bench.test"
+
+# (path into a scale result, True when larger is better)
+COMPARED_METRICS = [
+    (("candidates_per_second",), True),
+    (("elapsed_seconds",), False),
+    (("peak_rss_mb",), False),
+]
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def loopback_addresses(count: int) -> List[str]:
+    return [f"127.0.0.{index + 1}" for index in range(max(1, min(254, count)))]
+
+
+def self_signed_certificate(directory: str) -> Optional[str]:
+    """Write a PEM key and certificate for ``*.bench.test`` into ``directory``, or return None."""
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        return None
+    path = Path(directory) / "stub.pem"
+    key = Path(directory) / "stub.key"
+    try:
+        subprocess.run(
+            [
+                openssl, "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "2",
+                "-subj", f"/CN=*.{ZONE}", "-keyout", str(key), "-out", str(path),
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    path.write_text(path.read_text() + key.read_text())
+    return str(path)
+
+
+def start_fleet(stack: ExitStack, args: argparse.Namespace, certfile: Optional[str]) -> Tuple[List[str], int, int]:
+    """Start one HTTP (and HTTPS) stub per address, all on the same ports; return ``(ips, http, https)``."""
+    ips = loopback_addresses(args.servers)
+    ports = {"http": 0, "https": 0}
+    for index, ip in enumerate(ips):
+        body_size = args.body_sizes[index % len(args.body_sizes)]
+        for scheme, cert in (("http", None), ("https", certfile)):
+            if scheme == "https" and cert is None:
+                continue
+            server = stack.enter_context(
+                StubHTTPServer(
+                    latency=args.latency_ms / 1000.0,
+                    body_size=body_size,
+                    failure_rate=args.failure_rate,
+                    host=ip,
+                    port=ports[scheme],
+                    certfile=cert,
+                )
+            )
+            ports[scheme] = server.port
+    # Without TLS every HTTPS attempt is refused at once and the probe falls back to HTTP.
+    return ips, ports["http"], ports["https"] or closed_port()
+
+
+def build_targets(candidates: int, live_fraction: float, ips: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    labels = [f"c{index:07d}" for index in range(candidates)]
+    step = max(1, round(1 / live_fraction)) if live_fraction > 0 else 0
+    records: Dict[str, str] = {}
+    if step:
+        for position, label in enumerate(labels[::step]):
+            records[f"{label}.{ZONE}"] = ips[position % len(ips)]
+    return labels, records
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _summarize(report: Dict[str, Any], candidates: int, expected_live: int, elapsed: float, rss_before: float) -> Dict[str, Any]:
+    phases = {}
+    for name, phase in report.get("metrics", {}).get("phases", {}).items():
+        phases[name] = {
+            "wall_seconds": phase["wall_seconds"],
+            "items": phase["items"],
+            "items_per_second": phase["items_per_second"],
+            "p50_ms": phase["latency"]["p50_ms"],
+            "p95_ms": phase["latency"]["p95_ms"],
+            "p99_ms": phase["latency"]["p99_ms"],
+            "queue_wait_p95_ms": phase["queue_wait"]["p95_ms"],
+            "timeouts": phase["timeouts"],
+            "errors": phase["errors"],
+        }
+    peak = _peak_rss_mb()
+    return {
+        "candidates": candidates,
+        "expected_live": expected_live,
+        "resolved": report.get("total_subdomains_found", 0),
+        "live_found": report.get("live_subdomains_count", 0),
+        "elapsed_seconds": round(elapsed, 3),
+        "candidates_per_second": round(candidates / elapsed, 1) if elapsed > 0 else 0.0,
+        "peak_rss_mb": peak,
+        "rss_growth_mb": round(peak - rss_before, 1),
+        "phases": phases,
+        "concurrency": {
+            name: {"final": limiter["final"], "peak": limiter["peak"], "decreases": limiter["decreases"]}
+            for name, limiter in report.get("concurrency", {}).items()
+            if isinstance(limiter, dict)
+        },
+    }
+
+
+def _scale_worker(config: ScanConfig, candidates: int, expected_live: int, conn) -> None:
+    rss_before = _peak_rss_mb()
+    started = time.perf_counter()
+    report = asyncio.run(AsyncNeuroRecon(ZONE, config=config).run_full_recon())
+    elapsed = time.perf_counter() - started
+    conn.send(_summarize(report, candidates, expected_live, elapsed, rss_before))
+    conn.close()
+
+
+def run_scale(
+    candidates: int,
+    args: argparse.Namespace,
+    ips: List[str],
+    http_port: int,
+    https_port: int,
+    workdir: str,
+) -> Dict[str, Any]:
+    labels, records = build_targets(candidates, args.live_fraction, ips)
+    wordlist = Path(workdir) / f"wordlist-{candidates}.txt"
+    wordlist.write_text("\n".join(labels) + "\n", encoding="utf-8")
+
+    with ExitStack() as stack:
+        dns_ips = loopback_addresses(args.dns_servers)
+        dns_port = 0
+        for ip in dns_ips:
+            dns_port = stack.enter_context(
+                StubDNSServer(ZONE, records, latency=args.dns_latency_ms / 1000.0, host=ip, port=dns_port)
+            ).port
+        config = ScanConfig(
+            max_concurrency=args.threads,
+            timeout=args.timeout,
+            adaptive_concurrency=not args.fixed_concurrency,
+            enable_ct_logs=False,
+            enable_nmap=False,
+            dns_nameservers=dns_ips,
+            dns_port=dns_port,
+            dns_cache_enabled=False,
+            wordlist_path=str(wordlist),
+            http_port=http_port,
+            https_port=https_port,
+            ports=[http_port, https_port],
+        )
+        parent, child = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(target=_scale_worker, args=(config, candidates, len(records), child))
+        worker.start()
+        child.close()
+        try:
+            summary = parent.recv()
+        except EOFError:
+            raise SystemExit(f"scan of {candidates} candidates exited with code {worker.exitcode}") from None
+        finally:
+            worker.join()
+    return summary
+
+
+def _lookup(result: Dict[str, Any], path: Tuple[str, ...]) -> Optional[float]:
+    value: Any = result
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print the change of every compared metric and return the ones that regressed."""
+    regressions: List[str] = []
+    for scale, result in results.items():
+        previous = baseline.get("results", {}).get(scale)
+        if previous is None:
+            print(f"{scale:>8}  no baseline")
+            continue
+        metrics = list(COMPARED_METRICS)
+        metrics += [(("phases", name, "wall_seconds"), False) for name in result.get("phases", {})]
+        for path, higher_is_better in metrics:
+            current, before = _lookup(result, path), _lookup(previous, path)
+            if current is None or not before:
+                continue
+            change = (current - before) / before
+            worse = -change if higher_is_better else change
+            label = ".".join(path)
+            flag = "  REGRESSION" if worse > tolerance else ""
+            print(f"{scale:>8}  {label:<36} {before:>10.2f} -> {current:>10.2f}  {change:+7.1%}{flag}")
+            if flag:
+                regressions.append(f"{scale}:{label}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 10000, 100000])
+    parser.add_argument("--live-fraction", type=float, default=0.02, help="Share of candidates that resolve")
+    parser.add_argument("--servers", type=int, default=8, help="Stub web servers, one per loopback address")
+    parser.add_argument("--dns-servers", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument("--dns-latency-ms", type=float, default=1.0)
+    parser.add_argument("--body-sizes", type=int, nargs="+", default=[2048, 16384, 131072])
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests the web stubs abort")
+    parser.add_argument("--no-https", action="store_true")
+    parser.add_argument("--threads", type=int, default=40)
+    parser.add_argument("--timeout", type=int, default=5)
+    parser.add_argument("--fixed-concurrency", action="store_true")
+    parser.add_argument("--output", type=Path, default=Path("bench_recon.json"))
+    parser.add_argument("--baseline", type=Path, help="Earlier --output file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    parameters = {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()}
+    for key in ("output", "baseline", "tolerance", "fail_on_regression"):
+        parameters.pop(key)
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as workdir, ExitStack() as stack:
+        certfile = None if args.no_https else self_signed_certificate(workdir)
+        if certfile is None and not args.no_https:
+            print("openssl not found; benchmarking HTTP only")
+        ips, http_port, https_port = start_fleet(stack, args, certfile)
+        parameters["https"] = certfile is not None
+        for candidates in args.scales:
+            summary = run_scale(candidates, args, ips, http_port, https_port, workdir)
+            results[str(candidates)] = summary
+            phases = "  ".join(
+                f"{name}={phase['wall_seconds']:.2f}s" for name, phase in summary["phases"].items()
+            )
+            print(
+                f"{candidates:>8} candidates in {summary['elapsed_seconds']:7.2f}s "
+                f"{summary['candidates_per_second']:9.0f}/s  live={summary['live_found']}/{summary['expected_live']}  "
+                f"peak_rss={summary['peak_rss_mb']:.0f}MiB  {phases}"
+            )
+
+    output = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": multiprocessing.cpu_count(),
+        },
+        "parameters": parameters,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(output, indent=2) + "\n", encoding="utf-8")
+    print(f"wrote {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        recorded = {key: value for key, value in baseline.get("parameters", {}).items() if key != "scales"}
+        if recorded != {key: value for key, value in parameters.items() if key != "scales"}:
+            print("warning: baseline was recorded with different parameters")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions and args.fail_on_regression:
+            raise SystemExit(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
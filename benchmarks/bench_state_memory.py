@@ -0,0 +1,107 @@
+"""Compare the memory held by plain and compact scan state.
+
+Builds the candidate set and live-host list of a large scan twice: as a set of
+``(name, ip)`` tuples plus a list of dicts (the previous layout), and as the
+``CandidateSet`` and ``LiveHost`` records now kept in ``ReconState``. Every address,
+server and technology string is created afresh per record, as parsed DNS answers and
+HTTP headers are. Memory is measured with ``tracemalloc`` and includes the names.
+
+Usage: python benchmarks/bench_state_memory.py --candidates 1000000 --live 100000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from neurosploit.records import CandidateSet, LiveHost  # noqa: E402
+
+ZONE = "bench.test"
+SERVERS = ("nginx", "Apache", "cloudflare", "Microsoft-IIS/10.0", "gunicorn")
+TECHNOLOGIES = ("Nginx", "PHP", "WordPress", "jQuery", "Cloudflare", "React", "Missing security headers")
+
+
+def fresh(text: str) -> str:
+    """A new copy of ``text``, as a decoded header or answer would be."""
+    return text.encode().decode()
+
+
+def candidates(count: int, addresses: int) -> List[Tuple[str, str]]:
+    rng = random.Random(11)
+    pairs = []
+    for index in range(count):
+        address = rng.randrange(addresses)
+        pairs.append((f"host{index}.{ZONE}", f"10.{address >> 16 & 255}.{address >> 8 & 255}.{address & 255}"))
+    return pairs
+
+
+def probe_record(index: int, rng: random.Random) -> Dict[str, Any]:
+    address = rng.randrange(4096)
+    size = rng.randrange(100000)
+    return {
+        "subdomain": f"host{index}.{ZONE}",
+        "ip": f"10.0.{address >> 8}.{address & 255}",
+        "status_code": rng.choice((200, 301, 403, 404)),
+        "protocol": fresh(rng.choice(("https", "http"))),
+        "title": f"Welcome to host{index}",
+        "server": fresh(rng.choice(SERVERS)),
+        "technology": [fresh(name) for name in rng.sample(TECHNOLOGIES, 3)],
+        "favicon": None,
+        "canonical_url": None,
+        "response_time": rng.random(),
+        "content_length": size,
+        "declared_length": size,
+        "body_bytes_read": min(size, 65536),
+        "body_truncated": size > 65536,
+        "etag": None,
+        "last_modified": None,
+        "open_ports": [80, 443],
+    }
+
+
+def measure(build: Callable[[], Any]) -> Tuple[int, float]:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    state = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del state
+    return size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=1000000)
+    parser.add_argument("--live", type=int, default=100000)
+    parser.add_argument("--addresses", type=int, default=20000, help="distinct IPs behind the candidates")
+    args = parser.parse_args()
+
+    def plain() -> Any:
+        found = set(candidates(args.candidates, args.addresses))
+        rng = random.Random(13)
+        return found, [probe_record(index, rng) for index in range(args.live)]
+
+    def compact() -> Any:
+        found = CandidateSet(candidates(args.candidates, args.addresses))
+        rng = random.Random(13)
+        return found, [LiveHost.from_dict(probe_record(index, rng)) for index in range(args.live)]
+
+    print(f"{args.candidates} candidates over {args.addresses} IPs, {args.live} live hosts")
+    results = {}
+    for label, build in (("plain", plain), ("compact", compact)):
+        size, elapsed = measure(build)
+        results[label] = size
+        print(f"{label:<8} {size / (1024 * 1024):8.1f} MB  {elapsed:6.2f}s")
+    print(f"reduction: {1 - results['compact'] / results['plain']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Local stand-in servers used by the benchmark scripts.
+
+Every server runs in its own process so that measurements of the engine are not
+skewed by the stand-in competing for the benchmark's event loop.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import random
+import ssl
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+
+
+def _serve_dns(
+    zone: str,
+    records: Dict[str, str],
+    latency: float,
+    drop_rate: float,
+    host: str,
+    port: int,
+    ready,
+) -> None:
+    zone = zone.lower().rstrip(".")
+
+    class StubDNSProtocol(asyncio.DatagramProtocol):
+        def connection_made(self, transport: asyncio.BaseTransport) -> None:
+            self.transport = transport
+
+        def datagram_received(self, data: bytes, addr) -> None:
+            if drop_rate and random.random() < drop_rate:
+                return
+            try:
+                query = dns.message.from_wire(data)
+            except Exception:
+                return
+            response = dns.message.make_response(query)
+            response.flags |= dns.flags.AA
+            question = query.question[0]
+            name = question.name.to_text().lower().rstrip(".")
+            address = records.get(name)
+            if address is None and name.endswith(zone) and name != zone:
+                address = records.get(f"*.{zone}")
+            if address is not None and question.rdtype == dns.rdatatype.A:
+                response.answer.append(dns.rrset.from_text(question.name, 300, "IN", "A", address))
+            elif address is None or not name.endswith(zone):
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            wire = response.to_wire()
+            if latency:
+                asyncio.get_running_loop().call_later(latency, self.transport.sendto, wire, addr)
+            else:
+                self.transport.sendto(wire, addr)
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(StubDNSProtocol, local_addr=(host, port))
+        ready.send(transport.get_extra_info("sockname")[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def _serve_http(
+    latency: float,
+    body_size: int,
+    failure_rate: float,
+    host: str,
+    port: int,
+    certfile: Optional[str],
+    ready,
+) -> None:
+    body = b"<html><head><title>stub</title></head><body>" + b"x" * body_size + b"</body></html>"
+    head = (
+        b"HTTP/1.1 200 OK\r\nServer: stub\r\nContent-Type: text/html; charset=utf-8\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+    )
+
+    class StubHTTPProtocol(asyncio.Protocol):
+        def connection_made(self, transport: asyncio.BaseTransport) -> None:
+            self.transport = transport
+            self.buffer = b""
+
+        def data_received(self, data: bytes) -> None:
+            self.buffer += data
+            while b"\r\n\r\n" in self.buffer:
+                request, _, self.buffer = self.buffer.partition(b"\r\n\r\n")
+                close = b"connection: close" in request.lower()
+                if latency:
+                    asyncio.get_running_loop().call_later(latency, self.respond, close)
+                else:
+                    self.respond(close)
+
+        def respond(self, close: bool) -> None:
+            if self.transport.is_closing():
+                return
+            if failure_rate and random.random() < failure_rate:
+                self.transport.abort()
+                return
+            connection = b"Connection: close\r\n\r\n" if close else b"Connection: keep-alive\r\n\r\n"
+            self.transport.write(head + connection + body)
+            if close:
+                self.transport.close()
+
+    context = None
+    if certfile:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile)
+
+    async def main() -> None:
+        server = await asyncio.get_running_loop().create_server(
+            StubHTTPProtocol, host, port, backlog=4096, ssl=context
+        )
+        ready.send(server.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+class _StubProcess:
+    def _start(self, target, *args) -> int:
+        parent, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=target, args=(*args, child), daemon=True)
+        self._process.start()
+        return parent.recv()
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+
+class StubHTTPServer(_StubProcess):
+    """Keep-alive HTTP/1.1 server answering every request with the same page.
+
+    Binds ``host`` (127.0.0.1 by default) on ``port`` (0 picks a free one); with a
+    ``certfile`` holding a PEM certificate and key it serves HTTPS instead.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        body_size: int = 2048,
+        failure_rate: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        certfile: Optional[str] = None,
+    ):
+        self.latency = latency
+        self.body_size = body_size
+        self.failure_rate = failure_rate
+        self.host = host
+        self.port: Optional[int] = port or None
+        self.certfile = certfile
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "StubHTTPServer":
+        self.port = self._start(
+            _serve_http,
+            self.latency,
+            self.body_size,
+            self.failure_rate,
+            self.host,
+            self.port or 0,
+            self.certfile,
+        )
+        return self
+
+
+class _QuietFileHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve_files(directory: str, ready) -> None:
+    handler = functools.partial(_QuietFileHandler, directory=directory)
+    with ThreadingHTTPServer(("127.0.0.1", 0), handler) as server:
+        ready.send(server.server_address[1])
+        server.serve_forever()
+
+
+class StubFileServer(_StubProcess):
+    """Serves recorded fixtures from ``directory`` over plain HTTP."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "StubFileServer":
+        self.port = self._start(_serve_files, self.directory)
+        return self
+
+
+class StubDNSServer(_StubProcess):
+    """Authoritative stub for ``zone`` answering A queries from ``records``; everything else is NXDOMAIN.
+
+    A ``*.<zone>`` entry in ``records`` turns the zone into a wildcard zone. ``host`` and
+    ``port`` work as for :class:`StubHTTPServer`.
+    """
+
+    def __init__(
+        self,
+        zone: str,
+        records: Dict[str, str],
+        latency: float = 0.0,
+        drop_rate: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.zone = zone
+        self.records = {name.lower(): ip for name, ip in records.items()}
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.host = host
+        self.port: Optional[int] = port or None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "StubDNSServer":
+        self.port = self._start(
+            _serve_dns, self.zone, self.records, self.latency, self.drop_rate, self.host, self.port or 0
+        )
+        return self
@@ -0,0 +1,130 @@
+"""Batch mode: scan many targets concurrently under one global concurrency budget."""
+
+import asyncio
+import dataclasses
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .concurrency import FairShareBudget
+from .core import ScanConfig, ScanResources, export_report, run_enhanced_recon_async
+from .ndjson import NDJSONWriter
+from .targets import is_valid_domain, normalize_domain
+
+
+def read_targets(path: Path) -> List[str]:
+    """Read one domain per line, skipping blank lines, ``#`` comments and duplicates.
+
+    Raises ``ValueError`` naming the first line that is not a valid domain.
+    """
+    targets: Dict[str, None] = {}
+    with Path(path).open(encoding="utf-8") as handle:
+        for number, line in enumerate(handle, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            domain = normalize_domain(line)
+            if not is_valid_domain(domain):
+                raise ValueError(f"{path}:{number}: invalid target domain: {line!r}")
+            targets[domain] = None
+    return list(targets)
+
+
+async def _scan_target(
+    domain: str,
+    config: ScanConfig,
+    resources: ScanResources,
+    output_dir: Path,
+    output_format: str,
+) -> Dict[str, Any]:
+    suffix = "ndjson" if output_format == "ndjson" else "json"
+    path = output_dir / f"{domain}.{suffix}"
+    if config.journal_path:
+        # In batch mode ``journal_path`` is a directory holding one journal per target.
+        config = dataclasses.replace(config, journal_path=str(Path(config.journal_path) / f"{domain}.ndjson"))
+
+    if output_format == "ndjson":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            writer = NDJSONWriter(handle)
+            report = await run_enhanced_recon_async(
+                domain=domain, config=config, record_callback=writer, resources=resources
+            )
+            writer.write_summary(report)
+        return report
+
+    report = await run_enhanced_recon_async(domain=domain, config=config, resources=resources)
+    await asyncio.to_thread(export_report, report, path, 2 if output_format == "json" else None)
+    return report
+
+
+async def run_batch(
+    targets: List[str],
+    config: ScanConfig,
+    output_dir: Path,
+    parallel_targets: int = 4,
+    budget: int = 500,
+    output_format: str = "json",
+) -> Dict[str, Any]:
+    """Scan ``targets`` and write one report per target plus ``index.json`` to ``output_dir``.
+
+    Up to ``parallel_targets`` scans run at once. They share DNS sockets and cache, the
+    HTTP connection pool and the port scanner, and together never have more than
+    ``budget`` DNS queries, probes and analyses in flight; the budget is split fairly
+    between the active targets. A failing target is recorded in the index and does not
+    stop the batch.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    shared_budget = FairShareBudget(budget)
+    resources = ScanResources(config, budget=shared_budget)
+    active = asyncio.Semaphore(max(1, parallel_targets))
+    suffix = "ndjson" if output_format == "ndjson" else "json"
+    started_at = datetime.now(timezone.utc).isoformat()
+    started = time.monotonic()
+
+    async def scan(domain: str) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"domain": domain, "status": "pending"}
+        async with active:
+            entry["started_at"] = datetime.now(timezone.utc).isoformat()
+            target_started = time.monotonic()
+            try:
+                report = await _scan_target(domain, config, resources, output_dir, output_format)
+            except Exception as exc:
+                entry.update(status="failed", error=f"{type(exc).__name__}: {exc}")
+            else:
+                entry.update(
+                    status="completed",
+                    report=f"{domain}.{suffix}",
+                    total_subdomains_found=report.get("total_subdomains_found", 0),
+                    live_subdomains_count=report.get("live_subdomains_count", 0),
+                )
+            entry["duration_seconds"] = round(time.monotonic() - target_started, 3)
+        return entry
+
+    try:
+        entries = await asyncio.gather(*(scan(domain) for domain in targets))
+        shared = resources.stats()
+    finally:
+        await resources.close()
+
+    index = {
+        "started_at": started_at,
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "targets": len(entries),
+        "completed": sum(1 for entry in entries if entry["status"] == "completed"),
+        "failed": sum(1 for entry in entries if entry["status"] == "failed"),
+        "total_subdomains_found": sum(entry.get("total_subdomains_found", 0) for entry in entries),
+        "live_subdomains_count": sum(entry.get("live_subdomains_count", 0) for entry in entries),
+        "parallel_targets": max(1, parallel_targets),
+        "budget": shared_budget.report(),
+        # Per-target reports leave these out: the pools are shared, so only totals exist.
+        "shared_resources": shared,
+        "results": list(entries),
+    }
+    with (output_dir / "index.json").open("w", encoding="utf-8") as handle:
+        json.dump(index, handle, indent=2)
+    return index
@@ -1,10 +1,37 @@
 import argparse
 import asyncio
 import json
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from .journal import DEFAULT_JOURNAL_DIR, default_journal_path
+from .ndjson import NDJSONWriter
 from .targets import is_valid_domain, normalize_domain
 
+if TYPE_CHECKING:
+    from .core import ScanConfig
+
+
+def _port_list(value: str) -> List[int]:
+    ports: List[int] = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        start, _, end = item.partition("-")
+        try:
+            low, high = int(start), int(end or start)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid port: {item!r}") from None
+        if not 0 < low <= high <= 65535:
+            raise argparse.ArgumentTypeError(f"port out of range: {item!r}")
+        ports.extend(range(low, high + 1))
+    if not ports:
+        raise argparse.ArgumentTypeError("no ports given")
+    return list(dict.fromkeys(ports))
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="NeuroSploit interactive recon framework")
@@ -30,6 +57,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default=40,
         help="Max concurrency for headless mode",
     )
+    parser.add_argument(
+        "--fixed-concurrency",
+        action="store_true",
+        help="Keep --threads as a fixed limit instead of adapting concurrency per phase",
+    )
     parser.add_argument(
         "--timeout",
         type=int,
@@ -41,15 +73,105 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable nmap enrichment in headless mode",
     )
+    parser.add_argument(
+        "--nmap-processes",
+        type=int,
+        default=2,
+        help="Maximum concurrent nmap processes",
+    )
+    parser.add_argument(
+        "--nmap-batch-size",
+        type=int,
+        default=64,
+        help="Maximum IPs handed to one nmap process",
+    )
+    parser.add_argument(
+        "--ports",
+        type=_port_list,
+        help="Comma-separated TCP ports or ranges to scan on live hosts (example: 22,80,443,8000-8100)",
+    )
+    parser.add_argument(
+        "--wordlist",
+        type=Path,
+        help="Subdomain wordlist for DNS brute-force, one label per line (replaces the built-in list)",
+    )
+    parser.add_argument(
+        "--no-dns-cache",
+        action="store_true",
+        help="Bypass the persistent DNS resolution cache",
+    )
+    parser.add_argument(
+        "--purge-dns-cache",
+        action="store_true",
+        help="Empty the DNS resolution cache before scanning",
+    )
+    parser.add_argument(
+        "--dns-cache-path",
+        type=Path,
+        help="Location of the DNS resolution cache (default: ~/.cache/neurosploit/dns_cache.sqlite3)",
+    )
+    parser.add_argument(
+        "--negative-ttl",
+        type=int,
+        default=300,
+        help="Seconds to cache NXDOMAIN answers",
+    )
+    parser.add_argument(
+        "--previous",
+        type=Path,
+        help="Earlier JSON report of the same target; unchanged work is reused and a delta section is added",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        help="Journal completed work to this file (a directory of per-target journals in batch mode) so an interrupted scan can be resumed",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the unfinished scan recorded in --journal (default: ~/.cache/neurosploit/journals/<target>.ndjson)",
+    )
+    parser.add_argument(
+        "--targets-file",
+        type=Path,
+        help="Scan every domain listed in this file (one per line, '#' comments allowed) instead of a single target",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("reports"),
+        help="Directory for per-target reports and index.json in batch mode",
+    )
+    parser.add_argument(
+        "--parallel-targets",
+        type=int,
+        default=4,
+        help="Targets scanned at the same time in batch mode",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=500,
+        help="Global cap on DNS queries, probes and analyses in flight across all targets in batch mode",
+    )
     parser.add_argument(
         "--output",
         type=Path,
-        help="Optional output path to export JSON report",
+        help="Optional output path to export the report ('-' or omitted writes to stdout)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "compact", "ndjson"],
+        default="json",
+        help="Report format: indented JSON, single-line JSON, or one JSON record per host streamed during the scan",
     )
     return parser
 
 
 def _run_headless(args: argparse.Namespace) -> int:
+    if args.targets_file:
+        return _run_batch(args)
+
     target = normalize_domain(args.target or "")
     if not target:
         print("error: target domain is required in headless mode")
@@ -68,24 +190,141 @@ def _run_headless(args: argparse.Namespace) -> int:
         )
         return 2
 
-    config = ScanConfig(
+    config = _scan_config(args, ScanConfig)
+    if args.journal or args.resume:
+        config.journal_path = str(args.journal or default_journal_path(target))
+
+    previous_report = None
+    if args.previous:
+        try:
+            previous_report = json.loads(args.previous.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"error: cannot read previous report {args.previous}: {exc}")
+            return 2
+        if not isinstance(previous_report, dict) or normalize_domain(str(previous_report.get("domain", ""))) != target:
+            print(f"error: previous report {args.previous} is not a report for {target}")
+            return 2
+
+    to_stdout = args.output is None or str(args.output) == "-"
+    try:
+        if args.format == "ndjson":
+            return _run_streaming(target, config, previous_report, None if to_stdout else args.output)
+
+        report = asyncio.run(run_enhanced_recon_async(domain=target, config=config, previous_report=previous_report))
+        indent = 2 if args.format == "json" else None
+        if to_stdout:
+            json.dump(report, sys.stdout, indent=indent, separators=None if indent else (",", ":"), default=str)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+        else:
+            output_path = export_report(report, args.output, indent=indent)
+            print(f"exported report to {output_path}")
+    except BrokenPipeError:
+        _discard_stdout()
+    return 0
+
+
+def _scan_config(args: argparse.Namespace, config_class: "type[ScanConfig]") -> "ScanConfig":
+    config = config_class(
         mode=args.mode,
         max_concurrency=max(1, min(200, args.threads)),
         timeout=max(1, min(60, args.timeout)),
+        adaptive_concurrency=not args.fixed_concurrency,
         enable_nmap=args.nmap,
+        nmap_processes=max(1, args.nmap_processes),
+        nmap_batch_size=max(1, args.nmap_batch_size),
+        dns_cache_enabled=not args.no_dns_cache,
+        dns_cache_path=str(args.dns_cache_path or ""),
+        dns_cache_purge=args.purge_dns_cache,
+        dns_negative_ttl=max(0, args.negative_ttl),
+        wordlist_path=str(args.wordlist or ""),
+        resume=args.resume,
+    )
+    if args.ports:
+        config.ports = args.ports
+    return config
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    if args.target:
+        print("error: give either a target or --targets-file, not both")
+        return 2
+    if args.previous:
+        print("error: --previous is not supported with --targets-file")
+        return 2
+
+    try:
+        from .batch import read_targets, run_batch
+        from .core import ScanConfig
+    except ModuleNotFoundError as exc:
+        print(
+            "error: missing runtime dependency for headless scan. "
+            "Install requirements with: pip install -r requirements.txt\n"
+            f"details: {exc}"
+        )
+        return 2
+
+    try:
+        targets = read_targets(args.targets_file)
+    except (OSError, ValueError) as exc:
+        print(f"error: cannot read targets file: {exc}")
+        return 2
+    if not targets:
+        print(f"error: no targets in {args.targets_file}")
+        return 2
+
+    config = _scan_config(args, ScanConfig)
+    if args.journal or args.resume:
+        # One journal per target inside this directory.
+        config.journal_path = str(args.journal or DEFAULT_JOURNAL_DIR)
+
+    index = asyncio.run(
+        run_batch(
+            targets,
+            config,
+            args.output_dir,
+            parallel_targets=max(1, args.parallel_targets),
+            budget=max(1, args.budget),
+            output_format=args.format,
+        )
+    )
+    print(
+        f"scanned {index['completed']}/{index['targets']} targets "
+        f"({index['failed']} failed); index written to {args.output_dir / 'index.json'}"
     )
+    return 0 if not index["failed"] else 1
 
-    report = asyncio.run(run_enhanced_recon_async(domain=target, config=config))
 
-    if args.output:
-        output_path = export_report(report, args.output)
-        print(f"exported report to {output_path}")
-    else:
-        print(json.dumps(report, indent=2, default=str))
+def _run_streaming(target: str, config: "ScanConfig", previous_report: Optional[Dict[str, Any]], output: Optional[Path]) -> int:
+    from .core import run_enhanced_recon_async
 
+    if output is None:
+        writer = NDJSONWriter(sys.stdout)
+        report = asyncio.run(
+            run_enhanced_recon_async(domain=target, config=config, previous_report=previous_report, record_callback=writer)
+        )
+        writer.write_summary(report)
+        if writer.broken:
+            _discard_stdout()
+        return 0
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as handle:
+        writer = NDJSONWriter(handle)
+        report = asyncio.run(
+            run_enhanced_recon_async(domain=target, config=config, previous_report=previous_report, record_callback=writer)
+        )
+        writer.write_summary(report)
+    print(f"streamed {writer.records} records to {output}")
     return 0
 
 
+def _discard_stdout() -> None:
+    # The reader closed the pipe (e.g. `| head`); keep the interpreter from failing on its final flush.
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+
 def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
@@ -93,6 +332,9 @@ def main() -> None:
     if args.target and not args.headless:
         parser.error("target argument is only supported with --headless")
         return
+    if args.targets_file and not args.headless:
+        parser.error("--targets-file is only supported with --headless")
+        return
 
     if args.headless:
         raise SystemExit(_run_headless(args))
@@ -0,0 +1,340 @@
+"""Adaptive concurrency limits for the worker pools of a scan."""
+
+import asyncio
+import contextvars
+import statistics
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+
+class SlotOutcome:
+    """What happened to the operation that held a limiter slot."""
+
+    __slots__ = ("generation", "timed_out", "failed", "started")
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.timed_out = False
+        self.failed = False
+        self.started = time.monotonic()
+
+    def start_clock(self) -> None:
+        """Measure latency from now, e.g. once other resources the operation waits on are held."""
+        self.started = time.monotonic()
+
+
+_CURRENT_OUTCOME: "contextvars.ContextVar[Optional[SlotOutcome]]" = contextvars.ContextVar(
+    "neurosploit_limiter_outcome", default=None
+)
+
+
+def note_timeout() -> None:
+    """Mark the operation running under the current limiter slot as timed out.
+
+    Workers swallow their own errors, so network code calls this where it sees a timeout
+    and the limiter picks it up when the slot is released.
+    """
+    outcome = _CURRENT_OUTCOME.get()
+    if outcome is not None:
+        outcome.timed_out = True
+
+
+async def gather_or_cancel(*awaitables: Awaitable[Any]) -> List[Any]:
+    """Like ``asyncio.gather``, but the first failure cancels every other awaitable.
+
+    Pipeline stages block on each other's queues, so a stage left running after a
+    sibling failed would wait forever. This is ``asyncio.TaskGroup`` for Python < 3.11:
+    the remaining tasks are cancelled and awaited before the error is raised, and
+    cancelling the caller cancels them all as well.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if task in done and not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
+
+
+class WorkerPool:
+    """Copies of one worker coroutine, started as the pool's target size grows.
+
+    ``run`` starts ``size()`` workers and waits until all of them return; ``grow`` starts
+    more whenever ``size()`` has risen, so a pool following an adaptive limit does not
+    create its ceiling's worth of tasks up front. As with ``gather_or_cancel``, the first
+    worker to fail cancels the rest and its error is raised, and cancelling ``run``
+    cancels every worker.
+    """
+
+    def __init__(self, worker: Callable[[], Awaitable[None]], size: Callable[[], int]):
+        self._worker = worker
+        self._size = size
+        self._tasks: List["asyncio.Future[None]"] = []
+        self._finished: Optional["asyncio.Future[None]"] = None
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def grow(self) -> None:
+        finished = self._finished
+        if finished is None:
+            return
+        while len(self._tasks) < max(1, self._size()) and not finished.done():
+            task = asyncio.ensure_future(self._worker())
+            task.add_done_callback(self._task_done)
+            self._tasks.append(task)
+
+    def _task_done(self, task: "asyncio.Future[None]") -> None:
+        finished = self._finished
+        if finished is None or finished.done():
+            return
+        if not task.cancelled() and task.exception() is not None:
+            finished.set_exception(task.exception())
+        elif all(other.done() for other in self._tasks):
+            finished.set_result(None)
+
+    async def run(self) -> None:
+        self._finished = asyncio.get_running_loop().create_future()
+        try:
+            self.grow()
+            await self._finished
+        finally:
+            for task in self._tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit between ``floor`` and ``ceiling``.
+
+    Every window of roughly ``limit`` completions is judged as a whole. A window with
+    more than ``timeout_tolerance`` timed-out (or ``error_tolerance`` failed) operations
+    halves the limit. A healthy window doubles it during slow start and adds one
+    afterwards; a window whose median latency exceeds ``latency_tolerance`` times the
+    best median seen so far holds the limit and ends slow start. Operations started
+    before a decrease are left out of later windows, so one burst of timeouts only
+    halves the limit once.
+    """
+
+    MIN_WINDOW = 8
+
+    def __init__(
+        self,
+        floor: int,
+        ceiling: int,
+        initial: Optional[int] = None,
+        latency_tolerance: float = 2.0,
+        timeout_tolerance: float = 0.05,
+        error_tolerance: float = 0.2,
+        max_trace: int = 256,
+    ):
+        self.floor = max(1, floor)
+        self.ceiling = max(self.floor, ceiling)
+        self.limit = min(self.ceiling, max(self.floor, initial or self.floor))
+        self.latency_tolerance = latency_tolerance
+        self.timeout_tolerance = timeout_tolerance
+        self.error_tolerance = error_tolerance
+        self.max_trace = max(2, max_trace)
+        self.in_flight = 0
+        self.peak = self.limit
+        self.stats: Dict[str, int] = {"completed": 0, "timeouts": 0, "errors": 0, "increases": 0, "decreases": 0}
+        self._slow_start = True
+        self._generation = 0
+        self._baseline: Optional[float] = None
+        self._window: List[float] = []
+        self._window_timeouts = 0
+        self._window_errors = 0
+        self._waiters: Deque["asyncio.Future[int]"] = deque()
+        self._started = time.monotonic()
+        self._trace: List[Dict[str, Any]] = []
+        self._record("initial")
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[SlotOutcome]:
+        outcome = SlotOutcome(await self._acquire())
+        token = _CURRENT_OUTCOME.set(outcome)
+        try:
+            yield outcome
+        except Exception:
+            outcome.failed = True
+            raise
+        finally:
+            _CURRENT_OUTCOME.reset(token)
+            self._release(time.monotonic() - outcome.started, outcome)
+
+    async def _acquire(self) -> int:
+        """Take a slot; returns the generation the slot was granted in."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return self._generation
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # ``_wake`` reserves the slot, and records its generation, before resolving the
+            # waiter; the waiting task may only resume after a later decrease.
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                # ``_wake`` may already have dropped the cancelled waiter.
+                self._waiters.remove(waiter)
+            raise
+
+    def _wake(self) -> None:
+        # Wake only as many waiters as there are free slots.
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(self._generation)
+
+    def _release(self, latency: float, outcome: SlotOutcome) -> None:
+        self.in_flight -= 1
+        self.stats["completed"] += 1
+        if outcome.timed_out:
+            self.stats["timeouts"] += 1
+        elif outcome.failed:
+            self.stats["errors"] += 1
+        if outcome.generation == self._generation:
+            self._window.append(latency)
+            self._window_timeouts += outcome.timed_out
+            self._window_errors += outcome.failed and not outcome.timed_out
+            if len(self._window) >= max(self.MIN_WINDOW, self.limit):
+                self._adjust()
+        self._wake()
+
+    def _adjust(self) -> None:
+        size = len(self._window)
+        median = statistics.median(self._window)
+        congested = (
+            self._window_timeouts > self.timeout_tolerance * size
+            or self._window_errors > self.error_tolerance * size
+        )
+        self._window = []
+        self._window_timeouts = 0
+        self._window_errors = 0
+
+        if congested:
+            self._slow_start = False
+            self._generation += 1
+            self._set_limit(max(self.floor, self.limit // 2), "decrease")
+            return
+        if self._baseline is None or median < self._baseline:
+            self._baseline = median
+        if median > self.latency_tolerance * self._baseline:
+            self._slow_start = False
+            return
+        grown = self.limit * 2 if self._slow_start else self.limit + 1
+        self._set_limit(min(self.ceiling, grown), "increase")
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        if limit == self.limit:
+            return
+        self.stats["increases" if limit > self.limit else "decreases"] += 1
+        self.limit = limit
+        self.peak = max(self.peak, limit)
+        self._record(reason)
+
+    def _record(self, reason: str) -> None:
+        if len(self._trace) >= self.max_trace:
+            # Keep the first point and thin the rest so long scans stay readable.
+            self._trace = self._trace[:1] + self._trace[2::2]
+        self._trace.append(
+            {"t": round(time.monotonic() - self._started, 3), "limit": self.limit, "reason": reason}
+        )
+
+    def report(self) -> Dict[str, Any]:
+        final = {"t": round(time.monotonic() - self._started, 3), "limit": self.limit, "reason": "final"}
+        return {
+            "floor": self.floor,
+            "ceiling": self.ceiling,
+            "final": self.limit,
+            "peak": self.peak,
+            **self.stats,
+            "trace": self._trace + [final],
+        }
+
+
+class FairShareBudget:
+    """Global cap on in-flight operations shared by several scans.
+
+    Scans acquire slots under their own key. While the budget is exhausted, each freed
+    slot goes to the waiting key that currently holds the fewest slots, so every active
+    scan converges on an equal share however many workers it runs.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self.in_flight = 0
+        self.peak = 0
+        self.stats: Dict[str, int] = {"granted": 0, "waited": 0}
+        self._held: Dict[str, int] = {}
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {}
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        await self._acquire(key)
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    async def _acquire(self, key: str) -> None:
+        if self.in_flight < self.capacity and not self._waiters:
+            self._grant(key)
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(waiter)
+        self.stats["waited"] += 1
+        try:
+            # ``_wake`` grants the slot before resolving the waiter.
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(key)
+            else:
+                queue = self._waiters.get(key)
+                if queue is not None and waiter in queue:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._waiters[key]
+            raise
+
+    def _grant(self, key: str) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self._held[key] = self._held.get(key, 0) + 1
+        self.stats["granted"] += 1
+
+    def _release(self, key: str) -> None:
+        self.in_flight -= 1
+        held = self._held.get(key, 0) - 1
+        if held > 0:
+            self._held[key] = held
+        else:
+            self._held.pop(key, None)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.capacity:
+            key = min(self._waiters, key=lambda waiting: self._held.get(waiting, 0))
+            queue = self._waiters[key]
+            waiter = queue.popleft()
+            if not queue:
+                del self._waiters[key]
+            if not waiter.done():
+                self._grant(key)
+                waiter.set_result(None)
+
+    def report(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "peak": self.peak, **self.stats}
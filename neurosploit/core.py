@@ -1,38 +1,93 @@
 import asyncio
+import codecs
+import hashlib
 import json
-import re
+import secrets
 import socket
+import sqlite3
 import ssl
-import subprocess
+import time
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urljoin
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Sized,
+    Tuple,
+)
 
 try:
-    import requests
+    import aiohttp
 except ModuleNotFoundError:
-    requests = None
-
-try:
-    import urllib3
-except ModuleNotFoundError:
-    urllib3 = None
+    aiohttp = None
 
 try:
     import dns.resolver as dns_resolver
 except ModuleNotFoundError:
     dns_resolver = None
 
+from .concurrency import AdaptiveLimiter, FairShareBudget, SlotOutcome, WorkerPool, gather_or_cancel, note_timeout
+from .delta import PreviousScan, compute_delta
+from .dns_cache import ResolutionCache
+from .dns_engine import AsyncDNSEngine, DNSAnswer
+from .fingerprints import load_fingerprint_engine
+from .htmlmeta import HEAD_SCAN_LIMIT, extract_head_metadata
+from .http_client import PinnedResolver, create_probe_session, response_ssl_object
+from .journal import ScanJournal
+from .jsonstream import JSONArrayStream
+from .metrics import MetricsCollector, TimedQueue
+from .nmap import NmapRunner
+from .portscan import DEFAULT_PORTS, AsyncPortScanner
+from .progress import ProgressCallback, ProgressCoalescer
+from .records import CandidateSet, LiveHost
 from .targets import SUBDOMAIN_LABEL_PATTERN, is_valid_domain, normalize_domain
-
-# Disable SSL warnings for reconnaissance purposes.
-if urllib3 is not None:
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
+from .x509 import peer_certificate
+
+# Marks the end of a stage's input queue.
+_STAGE_DONE = object()
+
+# ScanConfig fields that only affect pacing, caching or journaling, not scan results.
+_FINGERPRINT_EXCLUDED = frozenset(
+    (
+        "max_concurrency",
+        "port_scan_sockets",
+        "nmap_batch_size",
+        "nmap_processes",
+        "nmap_parallelism",
+        "dns_cache_enabled",
+        "dns_cache_path",
+        "dns_cache_purge",
+        "http_per_host_limit",
+        "journal_path",
+        "resume",
+        "resume_max_age",
+        "progress_interval",
+        "pipeline_queue_size",
+        "adaptive_concurrency",
+        "dns_concurrency_floor",
+        "dns_concurrency_ceiling",
+        "probe_concurrency_floor",
+        "probe_concurrency_ceiling",
+        "analysis_concurrency_floor",
+        "analysis_concurrency_ceiling",
+    )
+)
 
 LogCallback = Callable[[str], Optional[Awaitable[None]]]
-ProgressCallback = Callable[[str, int, int, str], Optional[Awaitable[None]]]
+RecordCallback = Callable[[Dict[str, Any]], Optional[Awaitable[None]]]
 
 
 @dataclass
@@ -41,26 +96,208 @@ class ScanConfig:
     max_concurrency: int = 40
     timeout: int = 5
     enable_ct_logs: bool = True
+    ct_log_url: str = "https://crt.sh/?q=%.{domain}&output=json"
     enable_dns_bruteforce: bool = True
     enable_http_probe: bool = True
     enable_deep_analysis: bool = True
     enable_nmap: bool = False
     nmap_top_ports: int = 100
+    nmap_path: str = "nmap"
+    nmap_batch_size: int = 64
+    nmap_processes: int = 2
+    nmap_parallelism: int = 8
+    ports: List[int] = field(default_factory=lambda: list(DEFAULT_PORTS))
+    port_scan_sockets: int = 512
+    port_scan_timeout: float = 1.5
+    dns_nameservers: List[str] = field(default_factory=list)
+    dns_port: int = 53
+    dns_retries: int = 2
+    dns_cache_enabled: bool = True
+    dns_cache_path: str = ""
+    dns_cache_purge: bool = False
+    dns_negative_ttl: int = 300
+    http_per_host_limit: int = 4
+    probe_body_limit: int = 64 * 1024
+    probe_head_limit: int = HEAD_SCAN_LIMIT
+    probe_max_redirects: int = 5
+    fingerprints_path: str = ""
+    wordlist_path: str = ""
+    journal_path: str = ""
+    resume: bool = False
+    # Journals older than this many seconds are started afresh instead of resumed; 0 never expires them.
+    resume_max_age: float = 24 * 3600
+    # Minimum seconds between progress events of one phase; 0 reports every completed item.
+    progress_interval: float = 0.1
+    pipeline_queue_size: int = 256
+    adaptive_concurrency: bool = True
+    dns_concurrency_floor: int = 16
+    dns_concurrency_ceiling: int = 1000
+    probe_concurrency_floor: int = 30
+    probe_concurrency_ceiling: int = 400
+    analysis_concurrency_floor: int = 12
+    analysis_concurrency_ceiling: int = 200
+    wildcard_detection: bool = True
+    wildcard_probes: int = 3
+    http_port: int = 80
+    https_port: int = 443
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def fingerprint(self) -> str:
+        """Hash of the settings that decide which work a scan does and what it finds.
+
+        Pacing, caching and journaling options are left out, so changing them does not
+        prevent resuming a journal.
+        """
+        settings = {key: value for key, value in self.to_dict().items() if key not in _FINGERPRINT_EXCLUDED}
+        return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
 
 @dataclass
 class ReconState:
-    found_subdomains: Set[Tuple[str, str]] = field(default_factory=set)
-    live_subdomains: List[Dict[str, Any]] = field(default_factory=list)
+    # Compact forms of the report's ``subdomains`` and ``live_subdomains``, which can hold
+    # millions of entries; they are converted to the report layout once, when it is built.
+    found_subdomains: CandidateSet = field(default_factory=CandidateSet)
+    live_subdomains: List[LiveHost] = field(default_factory=list)
+    wildcard_addresses: Set[str] = field(default_factory=set)
+    wildcard_cnames: Set[str] = field(default_factory=set)
+    wildcard_filtered: int = 0
+    # Whether detect_wildcard ran and got at least one answer; the report's "checked".
+    wildcard_checked: bool = False
+    hosts_analyzed: int = 0
+    ip_results_shared: int = 0
+    tls_certs_captured: int = 0
+    tls_handshakes: int = 0
+    names_revalidated: int = 0
+    probes_not_modified: int = 0
+    enrichment_reused: int = 0
+
+    @property
+    def wildcard_detected(self) -> bool:
+        return bool(self.wildcard_addresses or self.wildcard_cnames)
+
+
+class ScanResources:
+    """Network pools and caches used by scans, created on first use.
+
+    Each scan builds its own by default. Batch mode hands one instance to every target,
+    so they share the DNS sockets and cache, the HTTP connection pool, the port scanner's
+    socket budget, nmap batches and the global concurrency ``budget``.
+    """
+
+    def __init__(self, config: ScanConfig, budget: Optional[FairShareBudget] = None):
+        self.config = config
+        self.budget = budget
+        self.http_resolver: Optional[PinnedResolver] = None
+        self._dns_engine: Optional[AsyncDNSEngine] = None
+        self._dns_cache: Optional[ResolutionCache] = None
+        self._http_session: Optional["aiohttp.ClientSession"] = None
+        self._port_scanner: Optional[AsyncPortScanner] = None
+        self._nmap_runner: Optional[NmapRunner] = None
+
+    def dns_engine(self) -> AsyncDNSEngine:
+        if self._dns_engine is None:
+            self._dns_engine = AsyncDNSEngine(
+                timeout=self.config.timeout,
+                retries=self.config.dns_retries,
+                nameservers=self.config.dns_nameservers or None,
+                port=self.config.dns_port,
+                cache=self._open_dns_cache(),
+            )
+        return self._dns_engine
+
+    def _open_dns_cache(self) -> Optional[ResolutionCache]:
+        if not self.config.dns_cache_enabled:
+            return None
+        if self._dns_cache is None:
+            try:
+                self._dns_cache = ResolutionCache(
+                    path=self.config.dns_cache_path or None,
+                    negative_ttl=self.config.dns_negative_ttl,
+                )
+                if self.config.dns_cache_purge:
+                    self._dns_cache.purge()
+            except (OSError, sqlite3.Error):
+                self._dns_cache = None
+        return self._dns_cache
+
+    def dns_cache_stats(self) -> Dict[str, Any]:
+        if self._dns_cache is None:
+            return {"enabled": False, "hits": 0, "misses": 0}
+        self._dns_cache.flush()
+        return self._dns_cache.stats()
+
+    def http_session(self) -> "aiohttp.ClientSession":
+        if self._http_session is None:
+            self.http_resolver = PinnedResolver(self.dns_engine if dns_resolver is not None else None)
+            self._http_session = create_probe_session(
+                timeout=self.config.timeout,
+                # The probe limiter, not the connector, decides how many requests are in flight.
+                pool_size=max(self.config.max_concurrency, self.config.probe_concurrency_ceiling)
+                if self.config.adaptive_concurrency
+                else self.config.max_concurrency,
+                per_host_limit=self.config.http_per_host_limit,
+                resolver=self.http_resolver,
+            )
+        return self._http_session
+
+    def port_scanner(self) -> AsyncPortScanner:
+        if self._port_scanner is None:
+            self._port_scanner = AsyncPortScanner(
+                max_sockets=self.config.port_scan_sockets,
+                max_timeout=self.config.port_scan_timeout,
+            )
+        return self._port_scanner
+
+    def port_scan_stats(self) -> Dict[str, int]:
+        return dict(self._port_scanner.stats) if self._port_scanner is not None else {}
+
+    def nmap_runner(self) -> NmapRunner:
+        if self._nmap_runner is None:
+            self._nmap_runner = NmapRunner(
+                top_ports=self.config.nmap_top_ports,
+                batch_size=self.config.nmap_batch_size,
+                processes=self.config.nmap_processes,
+                parallelism=self.config.nmap_parallelism,
+                binary=self.config.nmap_path,
+            )
+        return self._nmap_runner
+
+    def nmap_processes(self) -> int:
+        return self._nmap_runner.stats["processes"] if self._nmap_runner is not None else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters of the shared pools, covering every scan that used them."""
+        return {
+            "dns_cache": self.dns_cache_stats(),
+            "port_scan": self.port_scan_stats(),
+            "nmap_processes": self.nmap_processes(),
+        }
+
+    async def close(self) -> None:
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        if self.http_resolver is not None:
+            await self.http_resolver.close()
+            self.http_resolver = None
+        if self._dns_engine is not None:
+            await self._dns_engine.close()
+            self._dns_engine = None
+        if self._dns_cache is not None:
+            self._dns_cache.close()
+            self._dns_cache = None
+        if self._nmap_runner is not None:
+            await self._nmap_runner.close()
+            self._nmap_runner = None
 
 
 class AsyncNeuroRecon:
     """Async-first reconnaissance engine with progress hooks for TUI integration."""
 
-    COMMON_PORTS = [80, 443, 21, 22, 25, 53, 110, 143, 993, 995]
+    # Kept for callers that read the old default; the scan itself uses ``ScanConfig.ports``.
+    COMMON_PORTS = list(DEFAULT_PORTS)
 
     DEFAULT_SUBDOMAIN_WORDLIST = [
         "www", "mail", "ftp", "localhost", "webmail", "smtp", "pop", "ns1", "webdisk",
@@ -77,6 +314,9 @@ class AsyncNeuroRecon:
         config: Optional[ScanConfig] = None,
         log_callback: Optional[LogCallback] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        metrics: Optional[MetricsCollector] = None,
+        record_callback: Optional[RecordCallback] = None,
+        resources: Optional[ScanResources] = None,
     ):
         normalized_domain = normalize_domain(domain)
         if not is_valid_domain(normalized_domain):
@@ -85,7 +325,18 @@ class AsyncNeuroRecon:
         self.config = config or ScanConfig()
         self.log_callback = log_callback
         self.progress_callback = progress_callback
+        self._progress = ProgressCoalescer(progress_callback, self.config.progress_interval)
+        self.record_callback = record_callback
+        self.metrics = metrics or MetricsCollector()
         self.state = ReconState()
+        self._fingerprints = load_fingerprint_engine(self.config.fingerprints_path or None)
+        # Shared resources belong to whoever passed them in and outlive this scan.
+        self._owns_resources = resources is None
+        self.resources = resources or ScanResources(self.config)
+        self._ip_analysis: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._previous: Optional[PreviousScan] = None
+        self._journal: Optional[ScanJournal] = None
 
     async def _emit_log(self, message: str) -> None:
         if not self.log_callback:
@@ -95,112 +346,202 @@ class AsyncNeuroRecon:
             await maybe_awaitable
 
     async def _emit_progress(self, phase: str, current: int, total: int, message: str) -> None:
-        if not self.progress_callback:
+        await self._progress.emit(phase, current, total, message)
+
+    async def _emit_record(self, kind: str, data: Dict[str, Any]) -> None:
+        """Hand one report record to ``record_callback`` as soon as it is produced."""
+        if not self.record_callback:
             return
-        maybe_awaitable = self.progress_callback(phase, current, total, message)
+        maybe_awaitable = self.record_callback({"type": kind, **data})
         if maybe_awaitable:
             await maybe_awaitable
 
     def load_subdomain_wordlist(self) -> List[str]:
-        packaged_path = Path(__file__).resolve().parent / "data" / "subdomains.txt"
-        file_words: List[str] = []
-        if packaged_path.exists():
-            for line in packaged_path.read_text(encoding="utf-8").splitlines():
+        return list(self.iter_subdomain_wordlist())
+
+    def iter_subdomain_wordlist(self) -> Iterator[str]:
+        """Yield each brute-force label once, in file order, reading the file as it goes.
+
+        Only the set of labels already yielded is kept, not the file or a sorted copy.
+        """
+        if self.config.wordlist_path:
+            # A custom wordlist replaces the built-in one instead of extending it.
+            sources: List[Iterable[str]] = [self._read_wordlist(Path(self.config.wordlist_path))]
+        else:
+            packaged_path = Path(__file__).resolve().parent / "data" / "subdomains.txt"
+            sources = [(word.lower() for word in self.DEFAULT_SUBDOMAIN_WORDLIST)]
+            if packaged_path.exists():
+                sources.append(self._read_wordlist(packaged_path))
+        seen: Set[str] = set()
+        for source in sources:
+            for word in source:
+                if word not in seen:
+                    seen.add(word)
+                    yield word
+
+    @staticmethod
+    def _read_wordlist(path: Path) -> Iterator[str]:
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
                 candidate = line.strip().lower()
                 if not candidate or candidate.startswith("#"):
                     continue
                 if SUBDOMAIN_LABEL_PATTERN.fullmatch(candidate):
-                    file_words.append(candidate)
-        deduped = {word.lower() for word in self.DEFAULT_SUBDOMAIN_WORDLIST + file_words}
-        return sorted(deduped)
+                    yield candidate
+
+    def _port_scan_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"ports": list(self.config.ports), "max_sockets": self.config.port_scan_sockets}
+        if self._owns_resources:
+            stats.update(self.resources.port_scan_stats())
+        else:
+            # Pools shared with other scans only have totals; their owner reports them.
+            stats["shared"] = True
+        return stats
+
+    def _dns_cache_stats(self) -> Dict[str, Any]:
+        if self._owns_resources:
+            return self.resources.dns_cache_stats()
+        return {"enabled": self.config.dns_cache_enabled, "shared": True}
+
+    async def close(self) -> None:
+        for task in self._ip_analysis.values():
+            task.cancel()
+        if self._owns_resources:
+            await self.resources.close()
+        self._progress.cancel()
+        if self._journal is not None:
+            await self._journal.close()
 
-    def _dns_bruteforce_blocking(self, subdomain: str) -> Optional[Tuple[str, str]]:
+    async def dns_bruteforce(self, subdomain: str) -> Optional[Tuple[str, str]]:
         if dns_resolver is None:
             return None
         full_domain = f"{subdomain}.{self.domain}"
         try:
-            resolver = dns_resolver.Resolver()
-            resolver.timeout = self.config.timeout
-            resolver.lifetime = self.config.timeout
-            answers = resolver.resolve(full_domain, "A")
-            ip = str(answers[0])
-            return full_domain, ip
+            answer = await self.resources.dns_engine().resolve(full_domain, "A")
         except Exception:
             return None
+        if not answer.addresses:
+            return None
+        if self._matches_wildcard(answer):
+            self.state.wildcard_filtered += 1
+            return None
+        return full_domain, answer.addresses[0]
 
-    async def dns_bruteforce(self, subdomain: str) -> Optional[Tuple[str, str]]:
-        return await asyncio.to_thread(self._dns_bruteforce_blocking, subdomain)
-
-    def _crt_sh_enum_blocking(self) -> Set[Tuple[str, str]]:
-        discovered: Set[Tuple[str, str]] = set()
-        if requests is None:
-            return discovered
-        url = f"https://crt.sh/?q=%.{self.domain}&output=json"
+    async def resolve_known_name(self, name: str) -> Optional[Tuple[str, str]]:
+        """Re-resolve a name found by a previous scan (which may have come from CT logs)."""
+        if dns_resolver is None:
+            return None
+        try:
+            answer = await self.resources.dns_engine().resolve(name, "A")
+        except Exception:
+            return None
+        self.state.names_revalidated += 1
+        if not answer.addresses or self._matches_wildcard(answer):
+            return None
+        return name, answer.addresses[0]
+
+    async def detect_wildcard(self) -> bool:
+        """Resolve random labels under the domain and record any catch-all answer set."""
+        engine = self.resources.dns_engine()
+        probes = [f"{secrets.token_hex(10)}.{self.domain}" for _ in range(max(1, self.config.wildcard_probes))]
+        # Random labels are never looked up again, so keep them out of the persistent cache.
+        answers = await asyncio.gather(
+            *(engine.resolve(name, "A", use_cache=False) for name in probes),
+            return_exceptions=True,
+        )
+        for answer in answers:
+            if isinstance(answer, BaseException) or answer.rcode not in ("NOERROR", "NXDOMAIN"):
+                continue
+            self.state.wildcard_checked = True
+            if not answer.addresses:
+                continue
+            self.state.wildcard_addresses.update(answer.addresses)
+            self.state.wildcard_cnames.update(answer.cnames)
+        return self.state.wildcard_detected
+
+    def _matches_wildcard(self, answer: DNSAnswer) -> bool:
+        if not self.state.wildcard_detected:
+            return False
+        if self.state.wildcard_cnames.intersection(answer.cnames):
+            return True
+        return bool(self.state.wildcard_addresses) and self.state.wildcard_addresses.issuperset(answer.addresses)
+
+    async def _replay_ct_names(self) -> AsyncIterator[str]:
+        for name in list(self._journal.replay.get("ct_logs", {})):
+            self._journal.replayed += 1
+            yield name
+
+    async def iter_ct_names(self) -> AsyncIterator[str]:
+        """Yield unique CT log names for the domain while the crt.sh response is still downloading."""
+        if aiohttp is None:
+            return
+        url = self.config.ct_log_url.format(domain=self.domain)
         headers = {
             "User-Agent": "Mozilla/5.0 (NeuroSploit Async Recon)",
             "Accept": "application/json",
         }
-        response = requests.get(url, headers=headers, timeout=20, verify=False)
-        if response.status_code != 200:
-            return discovered
-
-        try:
-            certificates = response.json()
-        except ValueError:
-            return discovered
-
-        for cert in certificates:
-            name_value = cert.get("name_value", "")
-            if not name_value:
-                continue
-            for entry in name_value.splitlines():
-                clean = entry.strip().lower().lstrip("*.")
-                if clean.endswith(f".{self.domain}") and "*" not in clean:
-                    discovered.add((clean, "Unknown"))
-        return discovered
+        suffix = f".{self.domain}"
+        seen: Set[str] = set()
+        session = self.resources.http_session()
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=20, sock_read=20)
+
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            if response.status != 200:
+                return
+            text_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            certificates = JSONArrayStream()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                for cert in certificates.feed(text_decoder.decode(chunk)):
+                    for name in self._ct_entry_names(cert, suffix):
+                        if name not in seen:
+                            seen.add(name)
+                            yield name
+            certificates.feed(text_decoder.decode(b"", final=True))
+            for cert in certificates.close():
+                for name in self._ct_entry_names(cert, suffix):
+                    if name not in seen:
+                        seen.add(name)
+                        yield name
+
+    @staticmethod
+    def _ct_entry_names(cert: Any, suffix: str) -> Iterator[str]:
+        if not isinstance(cert, dict):
+            return
+        name_value = cert.get("name_value", "")
+        if not name_value:
+            return
+        for entry in name_value.splitlines():
+            clean = entry.strip().lower().lstrip("*.")
+            if clean.endswith(suffix) and "*" not in clean:
+                yield clean
 
     async def crt_sh_enum(self) -> Set[Tuple[str, str]]:
+        discovered: Set[Tuple[str, str]] = set()
         try:
-            return await asyncio.to_thread(self._crt_sh_enum_blocking)
+            async for name in self.iter_ct_names():
+                discovered.add((name, "Unknown"))
         except Exception as exc:
             await self._emit_log(f"[crt.sh] lookup failed: {exc}")
-            return set()
-
-    def _extract_title(self, html: str) -> str:
-        match = re.search(r"<title>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-        if not match:
-            return "No Title"
-        return " ".join(match.group(1).split())[:160]
-
-    def _detect_technology(self, headers: Dict[str, str], body_text: str) -> List[str]:
-        tech: List[str] = []
-        server = headers.get("Server", "").lower()
-        content = body_text.lower()
-
-        if "nginx" in server:
-            tech.append("Nginx")
-        elif "apache" in server:
-            tech.append("Apache")
-        elif "iis" in server:
-            tech.append("IIS")
+        return discovered
+
+    @staticmethod
+    def _cookie_names(headers: Mapping[str, str]) -> List[str]:
+        getall = getattr(headers, "getall", None)
+        values = getall("Set-Cookie", []) if getall else [headers.get("Set-Cookie", "")]
+        return [value.split("=", 1)[0].strip() for value in values if "=" in value]
+
+    def _detect_technology(
+        self,
+        headers: Mapping[str, str],
+        body_text: str,
+        meta_generator: Optional[str] = None,
+    ) -> List[str]:
+        tech = self._fingerprints.match(headers, body_text, self._cookie_names(headers), meta_generator)
 
         powered_by = headers.get("X-Powered-By")
         if powered_by:
             tech.append(f"Powered by: {powered_by}")
 
-        if "react" in content or "react-dom" in content:
-            tech.append("React")
-        if "angular" in content:
-            tech.append("Angular")
-        if "vue" in content:
-            tech.append("Vue.js")
-        if "wordpress" in content or "wp-content" in content:
-            tech.append("WordPress")
-        if "drupal" in content:
-            tech.append("Drupal")
-        if "joomla" in content:
-            tech.append("Joomla")
-
         security_headers = ["X-Frame-Options", "X-Content-Type-Options", "Content-Security-Policy"]
         missing = [header for header in security_headers if header not in headers]
         if missing:
@@ -208,102 +549,140 @@ class AsyncNeuroRecon:
 
         return tech
 
-    def _probe_subdomain_blocking(self, subdomain: str, ip: str) -> Optional[Dict[str, Any]]:
-        if requests is None:
+    def _probe_url(self, protocol: str, subdomain: str) -> str:
+        port = self.config.https_port if protocol == "https" else self.config.http_port
+        default_port = 443 if protocol == "https" else 80
+        if port == default_port:
+            return f"{protocol}://{subdomain}"
+        return f"{protocol}://{subdomain}:{port}"
+
+    @staticmethod
+    def _body_encoding(response: "aiohttp.ClientResponse") -> str:
+        # get_encoding() refuses to guess for bodies read through the stream, so fall back to UTF-8.
+        charset = response.charset
+        if charset:
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                pass
+        return "utf-8"
+
+    @staticmethod
+    async def _read_capped(response: "aiohttp.ClientResponse", limit: int) -> Tuple[bytes, bool]:
+        """Read at most ``limit`` body bytes; the rest is never downloaded."""
+        chunks: List[bytes] = []
+        size = 0
+        while size < limit:
+            chunk = await response.content.read(min(64 * 1024, limit - size))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        truncated = size >= limit and not response.content.at_eof()
+        return b"".join(chunks), truncated
+
+    def _served_by(self, response: "aiohttp.ClientResponse", subdomain: str) -> bool:
+        """Whether ``response`` came over TLS from ``subdomain`` itself.
+
+        A redirect to another origin (an SSO provider, a ``www`` host) ends on a
+        connection carrying that origin's certificate, which must not be reported for
+        ``subdomain``; enrichment then makes its own handshake instead.
+        """
+        url = response.url
+        if url.scheme != "https":
+            return False
+        if not response.history:
+            return True
+        return (url.host or "").lower() == subdomain.lower() and url.port == self.config.https_port
+
+    def _probe_certificate(self, response: "aiohttp.ClientResponse") -> Optional[Dict[str, Any]]:
+        cert = peer_certificate(response_ssl_object(response))
+        if cert:
+            self.state.tls_certs_captured += 1
+        return cert
+
+    async def check_subdomain_alive(self, subdomain_info: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        if aiohttp is None:
             return None
-        with requests.Session() as session:
-            session.verify = False
-            session.headers.update({"User-Agent": "Mozilla/5.0 (NeuroSploit Async Probe)"})
-
-            for protocol in ("https", "http"):
-                try:
-                    response = session.get(
-                        f"{protocol}://{subdomain}",
-                        timeout=(self.config.timeout, max(2, self.config.timeout * 2)),
-                        allow_redirects=True,
-                    )
-                    headers = dict(response.headers)
-                    tech_info = self._detect_technology(headers, response.text)
+        subdomain, ip = subdomain_info
+        session = self.resources.http_session()
+        if ip and ip != "Unknown":
+            self.resources.http_resolver.pin(subdomain, ip)
+
+        previous = self._previous.host(subdomain) if self._previous is not None else None
+        timed_out = False
+        for protocol in ("https", "http"):
+            conditional: Dict[str, str] = {}
+            if previous is not None and previous.get("protocol") == protocol:
+                conditional = self._previous.conditional_headers(subdomain, ip)
+            started = time.perf_counter()
+            try:
+                async with session.get(
+                    self._probe_url(protocol, subdomain),
+                    headers=conditional or None,
+                    allow_redirects=True,
+                    max_redirects=self.config.probe_max_redirects,
+                ) as response:
+                    response_time = time.perf_counter() - started
+                    ssl_cert = self._probe_certificate(response) if self._served_by(response, subdomain) else None
+                    if response.status == 304 and conditional:
+                        # Same page as last time: keep the previous probe result without downloading it.
+                        self.state.probes_not_modified += 1
+                        record = {key: value for key, value in previous.items() if key not in ("open_ports", "nmap")}
+                        record["response_time"] = response_time
+                        if ssl_cert:
+                            record["ssl_cert"] = ssl_cert
+                        return record
+                    body, truncated = await self._read_capped(response, self.config.probe_body_limit)
+                    text = body.decode(self._body_encoding(response), errors="replace")
+                    headers = response.headers
+                    meta = extract_head_metadata(text, self.config.probe_head_limit)
                     return {
                         "subdomain": subdomain,
-                        "ip": ip,
-                        "status_code": response.status_code,
+                        "ip": ip if ip != "Unknown" else self.resources.http_resolver.address_for(subdomain) or ip,
+                        "status_code": response.status,
                         "protocol": protocol,
-                        "title": self._extract_title(response.text),
+                        "title": meta.title or "No Title",
                         "server": headers.get("Server", "Unknown"),
-                        "technology": tech_info,
-                        "response_time": response.elapsed.total_seconds(),
-                        "content_length": len(response.content),
+                        "technology": self._detect_technology(headers, text, meta.generator),
+                        "favicon": urljoin(str(response.url), meta.favicon) if meta.favicon else None,
+                        "canonical_url": urljoin(str(response.url), meta.canonical) if meta.canonical else None,
+                        "response_time": response_time,
+                        # The size of the body: its Content-Length when announced, otherwise the
+                        # bytes read, which is a lower bound when ``body_truncated`` is set.
+                        "content_length": len(body) if response.content_length is None else response.content_length,
+                        # The Content-Length header, if any; None for chunked or unannounced bodies.
+                        "declared_length": response.content_length,
+                        "body_bytes_read": len(body),
+                        "body_truncated": truncated,
+                        "etag": headers.get("ETag"),
+                        "last_modified": headers.get("Last-Modified"),
+                        **({"ssl_cert": ssl_cert} if ssl_cert else {}),
                     }
-                except Exception:
-                    continue
-        return None
-
-    async def check_subdomain_alive(self, subdomain_info: Tuple[str, str]) -> Optional[Dict[str, Any]]:
-        subdomain, ip = subdomain_info
-        return await asyncio.to_thread(self._probe_subdomain_blocking, subdomain, ip)
-
-    def _port_scan_blocking(self, ip: str, ports: Sequence[int]) -> List[int]:
-        open_ports: List[int] = []
-        for port in ports:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            try:
-                sock.settimeout(1.5)
-                if sock.connect_ex((ip, port)) == 0:
-                    open_ports.append(port)
+            except asyncio.TimeoutError:
+                # Includes aiohttp's socket timeouts.
+                timed_out = True
+                continue
             except Exception:
-                pass
-            finally:
-                sock.close()
-        return open_ports
+                continue
+        if timed_out:
+            # Only a host that answered on no protocol tells the probe limiter to back off;
+            # a filtered HTTPS port in front of a working HTTP site is not congestion.
+            note_timeout()
+        return None
 
     def _check_ssl_cert_blocking(self, domain: str) -> Optional[Dict[str, Any]]:
         try:
             context = ssl.create_default_context()
             context.check_hostname = False
             context.verify_mode = ssl.CERT_NONE
-            with socket.create_connection((domain, 443), timeout=5) as sock:
+            with socket.create_connection((domain, self.config.https_port), timeout=5) as sock:
                 with context.wrap_socket(sock, server_hostname=domain) as secure_sock:
-                    cert = secure_sock.getpeercert()
-                    if not cert:
-                        return None
-                    return {
-                        "issuer": cert.get("issuer"),
-                        "subject": cert.get("subject"),
-                        "serialNumber": cert.get("serialNumber"),
-                        "notBefore": cert.get("notBefore"),
-                        "notAfter": cert.get("notAfter"),
-                    }
+                    # Unverified peers only expose the DER form, so decode it ourselves.
+                    return peer_certificate(secure_sock)
         except Exception:
             return None
 
-    def _run_nmap_blocking(self, ip: str) -> Optional[Dict[str, Any]]:
-        try:
-            process = subprocess.run(
-                ["nmap", "-Pn", f"--top-ports={self.config.nmap_top_ports}", ip],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                check=False,
-            )
-        except FileNotFoundError:
-            return {"error": "nmap not installed"}
-        except Exception as exc:
-            return {"error": str(exc)}
-
-        output = process.stdout or ""
-        open_ports = []
-        for line in output.splitlines():
-            match = re.search(r"(\d+)/tcp\s+open\s+([\w\-]+)", line)
-            if match:
-                open_ports.append({"port": int(match.group(1)), "service": match.group(2)})
-
-        return {
-            "exit_code": process.returncode,
-            "open_ports": open_ports,
-            "snippet": "\n".join(output.splitlines()[:18]),
-        }
-
     async def _bounded_run(
         self,
         phase: str,
@@ -311,45 +690,221 @@ class AsyncNeuroRecon:
         worker: Callable[[Any], Awaitable[Any]],
         concurrency: int,
         progress_prefix: str,
+        on_result: Optional[Callable[[Any], Awaitable[None]]] = None,
     ) -> List[Any]:
-        item_list = list(items)
-        total = len(item_list)
-        if not item_list:
-            await self._emit_progress(phase, 0, 0, f"{progress_prefix}: no items")
-            return []
-
-        semaphore = asyncio.Semaphore(max(concurrency, 1))
-
-        async def run_one(item: Any) -> Any:
-            async with semaphore:
-                return await worker(item)
-
-        tasks = [asyncio.create_task(run_one(item)) for item in item_list]
+        """Stream ``items`` through ``worker`` with at most ``concurrency`` in flight.
+
+        Items are fed through a bounded queue, so memory depends on the queue size rather
+        than on the number of items; pass a generator to avoid materializing them at all.
+        Progress totals of unsized ``items`` count the items fed so far. Results go to
+        ``on_result`` when given, otherwise they are collected and returned.
+        """
+        size = len(items) if isinstance(items, Sized) else None
+        fed = 0
+        inbox = TimedQueue(maxsize=max(1, self.config.pipeline_queue_size))
         results: List[Any] = []
 
-        for current, task in enumerate(asyncio.as_completed(tasks), start=1):
-            try:
-                result = await task
-            except Exception as exc:
-                await self._emit_log(f"[{phase}] worker failed: {exc}")
-                result = None
+        async def feed() -> None:
+            nonlocal fed
+            for item in items:
+                fed += 1
+                await inbox.put(item)
+            await inbox.put(_STAGE_DONE)
+
+        async def collect(result: Any) -> None:
             results.append(result)
-            await self._emit_progress(phase, current, total, f"{progress_prefix}: {current}/{total}")
 
+        def total() -> int:
+            return fed if size is None else size
+
+        await gather_or_cancel(
+            feed(),
+            self._run_stage(phase, inbox, worker, concurrency, on_result or collect, progress_prefix, total),
+        )
         return results
 
+    async def _run_stage(
+        self,
+        phase: str,
+        inbox: TimedQueue,
+        worker: Callable[[Any], Awaitable[Any]],
+        concurrency: int,
+        on_result: Callable[[Any], Awaitable[None]],
+        progress_prefix: str,
+        total: Callable[[], int],
+    ) -> int:
+        """Drain ``inbox`` until the upstream sends ``_STAGE_DONE``.
+
+        ``concurrency`` is the starting limit; the phase's adaptive limiter moves it
+        between the floor and ceiling configured for the phase. Workers are started up to
+        the current limit and added as it grows.
+        """
+        completed = 0
+        limiter = self._limiter_for(phase, concurrency)
+        metrics = self.metrics.phase(phase)
+
+        async def run_worker() -> None:
+            nonlocal completed
+            while True:
+                queued_for, item = await inbox.get()
+                if item is _STAGE_DONE:
+                    # Hand the marker on so sibling workers stop as well.
+                    inbox.put_nowait(_STAGE_DONE)
+                    return
+                replayed, result = self._replay(phase, item)
+                if not replayed:
+                    metrics.start()
+                    dequeued = started = time.perf_counter()
+                    outcome: Optional[SlotOutcome] = None
+                    crashed = False
+                    try:
+                        async with limiter.slot() as outcome, self._budget_slot():
+                            # Waiting for the shared batch budget is contention between scans,
+                            # not latency of this phase's targets.
+                            outcome.start_clock()
+                            started = time.perf_counter()
+                            result = await worker(item)
+                    except Exception as exc:
+                        await self._emit_log(f"[{phase}] worker failed: {exc}")
+                        result = None
+                        crashed = True
+                    # Time spent waiting in the inbox plus waiting for a limiter slot.
+                    metrics.queue_wait.add(queued_for + started - dequeued)
+                    metrics.record(
+                        time.perf_counter() - started,
+                        has_result=bool(result),
+                        timed_out=outcome is not None and outcome.timed_out,
+                        failed=outcome is None or outcome.failed,
+                    )
+                    if self._journal is not None and not crashed:
+                        # Work that crashed is left out so a resumed scan retries it.
+                        self._journal.record(phase, self._journal_key(item), result)
+                completed += 1
+                expected = max(total(), completed)
+                await self._emit_progress(phase, completed, expected, f"{progress_prefix}: {completed}/{expected}")
+                if result:
+                    await on_result(result)
+                # The limiter may have raised the limit; add workers to use it.
+                workers.grow()
+
+        workers = WorkerPool(run_worker, lambda: limiter.limit)
+        await workers.run()
+        metrics.finish()
+        await self._progress.flush(phase)
+        if not completed:
+            await self._emit_progress(phase, 0, 0, f"{progress_prefix}: no items")
+        return completed
+
+    @asynccontextmanager
+    async def _budget_slot(self) -> AsyncIterator[None]:
+        """Hold a slot of the shared batch budget, if there is one, for one unit of work."""
+        if self.resources.budget is None:
+            yield
+            return
+        async with self.resources.budget.slot(self.domain):
+            yield
+
+    @staticmethod
+    def _journal_key(item: Any) -> str:
+        if isinstance(item, dict):
+            return str(item.get("subdomain", ""))
+        if isinstance(item, tuple):
+            return str(item[0])
+        return str(item)
+
+    def _replay(self, phase: str, item: Any) -> Tuple[bool, Any]:
+        """Return the journaled result of ``item`` when resuming a scan that already did it."""
+        if self._journal is None:
+            return False, None
+        found, result = self._journal.lookup(phase, self._journal_key(item))
+        # JSON turns the (name, ip) tuples of the DNS phases into lists.
+        return found, tuple(result) if isinstance(result, list) else result
+
+    def _phase_bounds(self, phase: str, concurrency: int) -> Tuple[int, int]:
+        bounds = {
+            "dns_bruteforce": (self.config.dns_concurrency_floor, self.config.dns_concurrency_ceiling),
+            "dns_revalidate": (self.config.dns_concurrency_floor, self.config.dns_concurrency_ceiling),
+            "http_probe": (self.config.probe_concurrency_floor, self.config.probe_concurrency_ceiling),
+            "deep_analysis": (self.config.analysis_concurrency_floor, self.config.analysis_concurrency_ceiling),
+        }
+        if not self.config.adaptive_concurrency or phase not in bounds:
+            return concurrency, concurrency
+        return bounds[phase]
+
+    def _limiter_for(self, phase: str, concurrency: int) -> AdaptiveLimiter:
+        limiter = self._limiters.get(phase)
+        if limiter is None:
+            floor, ceiling = self._phase_bounds(phase, max(1, concurrency))
+            limiter = AdaptiveLimiter(floor=floor, ceiling=ceiling, initial=concurrency)
+            self._limiters[phase] = limiter
+        return limiter
+
+    async def _analyze_ip(self, ip: str, seed_port: int) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "open_ports": await self.resources.port_scanner().scan(ip, self.config.ports, seed_ports=[seed_port]),
+        }
+        if self.config.enable_nmap:
+            result["nmap"] = await self.resources.nmap_runner().scan(ip)
+        return result
+
+    async def _shared_ip_analysis(self, ip: str, seed_port: int) -> Dict[str, Any]:
+        """Analyze each IP once per scan; hosts behind the same address share the result."""
+        task = self._ip_analysis.get(ip)
+        if task is None:
+            task = asyncio.ensure_future(self._analyze_ip(ip, seed_port))
+            self._ip_analysis[ip] = task
+        else:
+            self.state.ip_results_shared += 1
+        return await asyncio.shield(task)
+
+    def _delta(self) -> Dict[str, Any]:
+        delta = compute_delta(self._previous, self.state.live_subdomains, self.state.found_subdomains)
+        delta["work_reused"] = {
+            "names_revalidated": self.state.names_revalidated,
+            "probes_not_modified": self.state.probes_not_modified,
+            "enrichment_reused": self.state.enrichment_reused,
+            "enrichment_repeated": self.state.hosts_analyzed,
+        }
+        return delta
+
+    def _deep_analysis_stats(self) -> Dict[str, Any]:
+        shared = self.state.ip_results_shared
+        return {
+            "hosts_analyzed": self.state.hosts_analyzed,
+            "unique_ips": len(self._ip_analysis),
+            "shared_results": shared,
+            "port_probes_avoided": shared * len(self.config.ports),
+            "nmap_runs_avoided": shared if self.config.enable_nmap else 0,
+            "nmap_processes": self.resources.nmap_processes() if self._owns_resources else None,
+            "tls_certs_from_probe": self.state.tls_certs_captured,
+            "tls_extra_handshakes": self.state.tls_handshakes,
+        }
+
     async def _enrich_live_subdomain(self, subdomain_data: Dict[str, Any]) -> Dict[str, Any]:
         enriched = dict(subdomain_data)
         ip = enriched.get("ip")
+        if self._previous is not None:
+            previous = self._previous.reusable_enrichment(enriched, self.config.ports, self.config.enable_nmap)
+            if previous is not None:
+                self.state.enrichment_reused += 1
+                enriched["open_ports"] = list(previous["open_ports"])
+                if "nmap" in previous:
+                    enriched["nmap"] = dict(previous["nmap"])
+                if enriched.get("protocol") == "https" and not enriched.get("ssl_cert") and previous.get("ssl_cert"):
+                    enriched["ssl_cert"] = previous["ssl_cert"]
+                return enriched
+        self.state.hosts_analyzed += 1
 
         if ip and ip != "Unknown":
-            ports = await asyncio.to_thread(self._port_scan_blocking, ip, self.COMMON_PORTS)
-            enriched["open_ports"] = ports
-
-            if self.config.enable_nmap:
-                enriched["nmap"] = await asyncio.to_thread(self._run_nmap_blocking, ip)
-
-        if enriched.get("protocol") == "https":
+            probed_port = self.config.https_port if enriched.get("protocol") == "https" else self.config.http_port
+            analysis = await self._shared_ip_analysis(ip, probed_port)
+            enriched["open_ports"] = list(analysis["open_ports"])
+            if "nmap" in analysis:
+                enriched["nmap"] = dict(analysis["nmap"])
+
+        if enriched.get("protocol") == "https" and not enriched.get("ssl_cert"):
+            # Only hosts whose probe ended on plain HTTP (or lost its connection) need a separate handshake.
+            self.state.tls_handshakes += 1
             enriched["ssl_cert"] = await asyncio.to_thread(self._check_ssl_cert_blocking, enriched["subdomain"])
 
         return enriched
@@ -396,9 +951,24 @@ class AsyncNeuroRecon:
             "Schedule recurring external attack-surface scans",
         ]
 
-    async def run_full_recon(self) -> Dict[str, Any]:
+    async def run_full_recon(self, previous_report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run every enabled phase and return the report.
+
+        With ``previous_report`` (an earlier report of the same domain) names it found are
+        re-resolved directly, unchanged pages are revalidated with conditional requests,
+        unchanged hosts keep their port scan, nmap and certificate results, and the report
+        gains a ``delta`` section listing new, disappeared and changed hosts.
+
+        With ``config.journal_path`` every completed unit of work is appended to a journal;
+        ``config.resume`` replays an unfinished journal and only runs outstanding work.
+        """
         if not self.domain:
             raise ValueError("Domain cannot be empty")
+        if previous_report is not None:
+            previous_domain = normalize_domain(str(previous_report.get("domain", "")))
+            if previous_domain != self.domain:
+                raise ValueError(f"Previous report is for {previous_domain!r}, not {self.domain!r}")
+            self._previous = PreviousScan(previous_report)
 
         started = datetime.now(timezone.utc)
         await self._emit_log(f"Starting reconnaissance for {self.domain}")
@@ -406,69 +976,196 @@ class AsyncNeuroRecon:
         if self.config.mode == "mock":
             await self._emit_progress("mock", 1, 1, "Generated mock recon data")
             report = run_mock_recon(self.domain)
+            for name, ip in report["subdomains"]:
+                await self._emit_record("subdomain", {"subdomain": name, "ip": ip})
+            for record in report["live_subdomains"]:
+                await self._emit_record("live", record)
             await self._emit_log(f"Mock scan complete for {self.domain}")
             return report
 
+        try:
+            return await self._run_recon_phases(started)
+        finally:
+            await self.close()
+
+    async def _announce_stages(self, probe_enabled: bool, enrich_enabled: bool) -> None:
+        # Stages run concurrently, so announce them up front in pipeline order.
         if self.config.enable_ct_logs:
-            if requests is None:
-                await self._emit_log("Step 1/4: Skipping CT logs lookup (requests not installed)")
+            if aiohttp is None:
+                await self._emit_log("Step 1/4: Skipping CT logs lookup (aiohttp not installed)")
             else:
                 await self._emit_log("Step 1/4: Enumerating Certificate Transparency logs")
-                ct_subdomains = await self.crt_sh_enum()
-                self.state.found_subdomains.update(ct_subdomains)
-                await self._emit_progress(
-                    "ct_logs",
-                    len(ct_subdomains),
-                    len(ct_subdomains),
-                    f"CT enumeration discovered {len(ct_subdomains)} entries",
-                )
-
-        if self.config.enable_dns_bruteforce and dns_resolver is None:
-            await self._emit_log("Step 2/4: Skipping DNS brute-force (dnspython not installed)")
-        elif self.config.enable_dns_bruteforce:
-            await self._emit_log("Step 2/4: Running DNS brute-force")
-            wordlist = self.load_subdomain_wordlist()
-            dns_results = await self._bounded_run(
-                phase="dns_bruteforce",
-                items=wordlist,
-                worker=self.dns_bruteforce,
-                concurrency=self.config.max_concurrency,
-                progress_prefix="DNS brute-force",
-            )
-            self.state.found_subdomains.update(item for item in dns_results if item)
-
-        await self._emit_log(f"Discovered {len(self.state.found_subdomains)} candidate subdomains")
-
-        if self.config.enable_http_probe:
-            if requests is None:
-                await self._emit_log("Step 3/4: Skipping HTTP probing (requests not installed)")
-                self.state.live_subdomains = []
+        if self.config.enable_dns_bruteforce:
+            if dns_resolver is None:
+                await self._emit_log("Step 2/4: Skipping DNS brute-force (dnspython not installed)")
             else:
+                await self._emit_log("Step 2/4: Running DNS brute-force")
+        if self.config.enable_http_probe:
+            if probe_enabled:
                 await self._emit_log("Step 3/4: Probing discovered hosts for live HTTP services")
-                probe_results = await self._bounded_run(
-                    phase="http_probe",
-                    items=sorted(self.state.found_subdomains),
-                    worker=self.check_subdomain_alive,
-                    concurrency=max(8, min(30, self.config.max_concurrency)),
-                    progress_prefix="HTTP probe",
+            else:
+                await self._emit_log("Step 3/4: Skipping HTTP probing (aiohttp not installed)")
+        if enrich_enabled:
+            await self._emit_log("Step 4/4: Running port, SSL, and optional nmap analysis")
+
+    async def _stream_ct_logs(self, accept: Callable[[Tuple[str, str]], Awaitable[None]]) -> None:
+        if not self.config.enable_ct_logs or aiohttp is None:
+            return
+        discovered = 0
+        metrics = self.metrics.phase("ct_logs")
+        metrics.start()
+        try:
+            replaying = self._journal is not None and self._journal.completed("ct_logs")
+            names = self._replay_ct_names() if replaying else self.iter_ct_names()
+            async for name in names:
+                discovered += 1
+                metrics.items = metrics.results = discovered
+                if self._journal is not None and not replaying:
+                    self._journal.record("ct_logs", name, None)
+                await accept((name, "Unknown"))
+            if self._journal is not None and not replaying:
+                self._journal.mark_complete("ct_logs")
+        except Exception as exc:
+            metrics.errors += 1
+            await self._emit_log(f"[crt.sh] lookup failed: {exc}")
+        finally:
+            metrics.finish()
+        await self._emit_progress(
+            "ct_logs",
+            discovered,
+            discovered,
+            f"CT enumeration discovered {discovered} entries",
+        )
+
+    async def _stream_dns_bruteforce(self, accept: Callable[[Tuple[str, str]], Awaitable[None]]) -> None:
+        known = [
+            name
+            for name in sorted(self._previous.names if self._previous is not None else ())
+            if name == self.domain or name.endswith(f".{self.domain}")
+        ]
+        if dns_resolver is None or not (self.config.enable_dns_bruteforce or known):
+            return
+        if self.config.wildcard_detection and await self.detect_wildcard():
+            await self._emit_log(
+                f"Wildcard DNS detected for *.{self.domain} "
+                f"({', '.join(sorted(self.state.wildcard_addresses | self.state.wildcard_cnames))}); "
+                "filtering matching brute-force results"
+            )
+        runs = []
+        if known:
+            runs.append(
+                self._bounded_run(
+                    phase="dns_revalidate",
+                    items=known,
+                    worker=self.resolve_known_name,
+                    concurrency=self.config.max_concurrency,
+                    progress_prefix="DNS revalidation",
+                    on_result=accept,
                 )
-                self.state.live_subdomains = [item for item in probe_results if item]
-        else:
-            self.state.live_subdomains = []
+            )
+        if self.config.enable_dns_bruteforce:
+            # Names the previous scan found are already re-resolved above.
+            known_names = set(known)
+            words = (word for word in self.iter_subdomain_wordlist() if f"{word}.{self.domain}" not in known_names)
+            runs.append(
+                self._bounded_run(
+                    phase="dns_bruteforce",
+                    items=words,
+                    worker=self.dns_bruteforce,
+                    concurrency=self.config.max_concurrency,
+                    progress_prefix="DNS brute-force",
+                    on_result=accept,
+                )
+            )
+        await gather_or_cancel(*runs)
 
-        await self._emit_log(f"Detected {len(self.state.live_subdomains)} live hosts")
+    async def _open_journal(self) -> None:
+        if not self.config.journal_path:
+            return
+        self._journal = await ScanJournal(
+            Path(self.config.journal_path).expanduser(),
+            self.domain,
+            fingerprint=self.config.fingerprint(),
+            max_age=self.config.resume_max_age,
+        ).open(resume=self.config.resume)
+        if self._journal.stale:
+            await self._emit_log(f"Not resuming {self._journal.path} ({self._journal.stale}); starting a new journal")
+        if self._journal.resumed:
+            completed = sum(len(entries) for entries in self._journal.replay.values())
+            await self._emit_log(f"Resuming from {self._journal.path}: {completed} completed work items to replay")
+
+    async def _run_recon_phases(self, started: datetime) -> Dict[str, Any]:
+        # Stages are connected by bounded queues: a name is probed as soon as it is found
+        # and a live host is enriched as soon as it answers.
+        queue_size = max(1, self.config.pipeline_queue_size)
+        probe_enabled = self.config.enable_http_probe and aiohttp is not None
+        enrich_enabled = probe_enabled and self.config.enable_deep_analysis
+        probe_inbox = TimedQueue(maxsize=queue_size)
+        enrich_inbox = TimedQueue(maxsize=queue_size)
+        queued_names: Set[str] = set()
+        live_seen = 0
+        await self._open_journal()
+
+        async def accept_candidate(candidate: Tuple[str, str]) -> None:
+            if candidate not in self.state.found_subdomains:
+                self.state.found_subdomains.add(candidate)
+                await self._emit_record("subdomain", {"subdomain": candidate[0], "ip": candidate[1]})
+            if probe_enabled and candidate[0] not in queued_names:
+                queued_names.add(candidate[0])
+                await probe_inbox.put(candidate)
+
+        async def accept_live(result: Dict[str, Any]) -> None:
+            nonlocal live_seen
+            live_seen += 1
+            await self._emit_record("live", result)
+            if enrich_enabled:
+                await enrich_inbox.put(result)
+            else:
+                self.state.live_subdomains.append(LiveHost.from_dict(result))
+
+        async def accept_enriched(result: Dict[str, Any]) -> None:
+            self.state.live_subdomains.append(LiveHost.from_dict(result))
+            await self._emit_record("enriched", result)
+
+        async def discover() -> None:
+            await gather_or_cancel(self._stream_ct_logs(accept_candidate), self._stream_dns_bruteforce(accept_candidate))
+            await self._emit_log(f"Discovered {len(self.state.found_subdomains)} candidate subdomains")
+            await probe_inbox.put(_STAGE_DONE)
+
+        async def probe() -> None:
+            if not probe_enabled:
+                return
+            await self._run_stage(
+                phase="http_probe",
+                inbox=probe_inbox,
+                worker=self.check_subdomain_alive,
+                concurrency=self.config.max_concurrency,
+                on_result=accept_live,
+                progress_prefix="HTTP probe",
+                total=lambda: len(queued_names),
+            )
+            await self._emit_log(f"Detected {live_seen} live hosts")
+            await enrich_inbox.put(_STAGE_DONE)
 
-        if self.config.enable_deep_analysis and self.state.live_subdomains:
-            await self._emit_log("Step 4/4: Running port, SSL, and optional nmap analysis")
-            enriched = await self._bounded_run(
+        async def enrich() -> None:
+            if not enrich_enabled:
+                return
+            await self._run_stage(
                 phase="deep_analysis",
-                items=self.state.live_subdomains,
+                inbox=enrich_inbox,
                 worker=self._enrich_live_subdomain,
-                concurrency=max(4, min(12, self.config.max_concurrency)),
+                # Port probes share the scanner's socket budget and nmap batches its own processes.
+                concurrency=self.config.max_concurrency,
+                on_result=accept_enriched,
                 progress_prefix="Deep analysis",
+                total=lambda: live_seen,
             )
-            self.state.live_subdomains = [item for item in enriched if item]
-            self.state.live_subdomains.sort(key=lambda item: str(item.get("subdomain", "")))
+
+        await self._announce_stages(probe_enabled, enrich_enabled)
+        # A failing stage cancels the others instead of leaving them blocked on full queues.
+        await gather_or_cancel(discover(), probe(), enrich())
+        self.state.live_subdomains.sort(key=lambda host: str(host.get("subdomain", "")))
+        live_subdomains = [host.to_dict() for host in self.state.live_subdomains]
 
         report = {
             "domain": self.domain,
@@ -478,15 +1175,36 @@ class AsyncNeuroRecon:
             "scan_config": self.config.to_dict(),
             "total_subdomains_found": len(self.state.found_subdomains),
             "live_subdomains_count": len(self.state.live_subdomains),
-            "subdomains": sorted(list(self.state.found_subdomains), key=lambda x: x[0]),
-            "live_subdomains": self.state.live_subdomains,
+            "subdomains": self.state.found_subdomains.sorted_pairs(),
+            "live_subdomains": live_subdomains,
+            "wildcard_dns": {
+                "checked": self.state.wildcard_checked,
+                "detected": self.state.wildcard_detected,
+                "filtering_applied": self.state.wildcard_detected,
+                "addresses": sorted(self.state.wildcard_addresses),
+                "cnames": sorted(self.state.wildcard_cnames),
+                "filtered_results": self.state.wildcard_filtered,
+            },
+            "dns_cache": self._dns_cache_stats(),
+            "port_scan": self._port_scan_stats(),
+            "deep_analysis": self._deep_analysis_stats(),
+            **({"delta": self._delta()} if self._previous is not None else {}),
+            **({"journal": self._journal.stats()} if self._journal is not None else {}),
+            "metrics": self.metrics.snapshot(),
+            "concurrency": {
+                "adaptive": self.config.adaptive_concurrency,
+                **{phase: limiter.report() for phase, limiter in self._limiters.items()},
+            },
             "summary": {
-                "technologies": self.get_technology_summary(self.state.live_subdomains),
-                "security_issues": self.identify_security_issues(self.state.live_subdomains),
+                "technologies": self.get_technology_summary(live_subdomains),
+                "security_issues": self.identify_security_issues(live_subdomains),
                 "recommendations": self.generate_recommendations(),
             },
         }
 
+        if self._journal is not None:
+            self._journal.mark_complete("scan")
+        await self._progress.flush()
         await self._emit_progress("complete", 1, 1, f"Completed scan for {self.domain}")
         await self._emit_log(f"Reconnaissance complete for {self.domain}")
         return report
@@ -497,14 +1215,21 @@ async def run_enhanced_recon_async(
     config: Optional[ScanConfig] = None,
     log_callback: Optional[LogCallback] = None,
     progress_callback: Optional[ProgressCallback] = None,
+    metrics: Optional[MetricsCollector] = None,
+    previous_report: Optional[Dict[str, Any]] = None,
+    record_callback: Optional[RecordCallback] = None,
+    resources: Optional[ScanResources] = None,
 ) -> Dict[str, Any]:
     recon = AsyncNeuroRecon(
         domain=domain,
         config=config,
         log_callback=log_callback,
         progress_callback=progress_callback,
+        metrics=metrics,
+        record_callback=record_callback,
+        resources=resources,
     )
-    return await recon.run_full_recon()
+    return await recon.run_full_recon(previous_report=previous_report)
 
 
 def run_enhanced_recon(domain: str) -> Dict[str, Any]:
@@ -634,7 +1359,10 @@ AI ANALYSIS REQUEST:
     return prompt
 
 
-def export_report(report: Dict[str, Any], output_path: Path) -> Path:
+def export_report(report: Dict[str, Any], output_path: Path, indent: Optional[int] = 2) -> Path:
+    """Write ``report`` as JSON; ``indent=None`` writes compact JSON."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as handle:
+        # json.dump encodes in chunks instead of building the whole document as one string.
+        json.dump(report, handle, indent=indent, separators=None if indent is not None else (",", ":"), default=str)
     return output_path
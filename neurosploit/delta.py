@@ -0,0 +1,98 @@
+"""Differential rescans: reuse unchanged work from a previous report and describe what changed."""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# A live host whose probe agrees with the previous scan on all of these keeps its enrichment.
+PROBE_FIELDS = ("ip", "status_code", "protocol", "title", "server", "technology")
+# Fields compared when describing a changed host.
+DELTA_FIELDS = PROBE_FIELDS + ("open_ports", "certificate_serial")
+
+
+def _field(record: Dict[str, Any], name: str) -> Any:
+    if name == "certificate_serial":
+        return (record.get("ssl_cert") or {}).get("serialNumber")
+    value = record.get(name)
+    if name in ("technology", "open_ports"):
+        return sorted(value or [])
+    return value
+
+
+class PreviousScan:
+    """Index over a previous report of the same domain."""
+
+    def __init__(self, report: Dict[str, Any]):
+        self.timestamp: Optional[str] = report.get("timestamp")
+        self.hosts: Dict[str, Dict[str, Any]] = {
+            str(record["subdomain"]).lower(): record
+            for record in report.get("live_subdomains") or []
+            if record.get("subdomain")
+        }
+        # JSON turns the (name, ip) tuples into lists.
+        self.names: Dict[str, str] = {
+            str(entry[0]).lower(): str(entry[1]) for entry in report.get("subdomains") or [] if len(entry) == 2
+        }
+        config = report.get("scan_config") or {}
+        self.ports = sorted(config.get("ports") or [])
+        self.nmap = bool(config.get("enable_nmap"))
+
+    def host(self, subdomain: str) -> Optional[Dict[str, Any]]:
+        return self.hosts.get(subdomain.lower())
+
+    def conditional_headers(self, subdomain: str, ip: str) -> Dict[str, str]:
+        """Validators that let the server answer ``304 Not Modified`` for an unchanged page."""
+        previous = self.host(subdomain)
+        if previous is None or previous.get("ip") != ip:
+            return {}
+        headers: Dict[str, str] = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+        return headers
+
+    def unchanged(self, record: Dict[str, Any]) -> bool:
+        previous = self.host(str(record.get("subdomain", "")))
+        return previous is not None and all(_field(previous, name) == _field(record, name) for name in PROBE_FIELDS)
+
+    def reusable_enrichment(self, record: Dict[str, Any], ports: Sequence[int], nmap: bool) -> Optional[Dict[str, Any]]:
+        """Return the previous record of an unchanged host if its enrichment covers this scan's settings."""
+        if not self.unchanged(record) or self.ports != sorted(ports):
+            return None
+        previous = self.host(str(record["subdomain"]))
+        if "open_ports" not in previous or (nmap and "nmap" not in previous):
+            return None
+        if nmap and "state" not in (previous["nmap"] or {}):
+            # Reports from before the XML runner hold the old ``snippet`` layout; rescan those.
+            return None
+        return previous
+
+
+def compute_delta(
+    previous: PreviousScan,
+    live_subdomains: Iterable[Dict[str, Any]],
+    subdomains: Iterable[Tuple[str, str]],
+) -> Dict[str, Any]:
+    """Describe new, disappeared and changed hosts relative to ``previous``."""
+    current = {str(record.get("subdomain", "")).lower(): record for record in live_subdomains}
+    names = {name.lower() for name, _ in subdomains}
+
+    changed: List[Dict[str, Any]] = []
+    for name in sorted(current.keys() & previous.hosts.keys()):
+        before, after = previous.hosts[name], current[name]
+        changes = {
+            field: {"before": _field(before, field), "after": _field(after, field)}
+            for field in DELTA_FIELDS
+            if _field(before, field) != _field(after, field)
+        }
+        if changes:
+            changed.append({"subdomain": name, "changes": changes})
+
+    return {
+        "previous_scan": previous.timestamp,
+        "new_hosts": sorted(current.keys() - previous.hosts.keys()),
+        "disappeared_hosts": sorted(previous.hosts.keys() - current.keys()),
+        "changed_hosts": changed,
+        "unchanged_hosts": len(current.keys() & previous.hosts.keys()) - len(changed),
+        "new_names": sorted(names - previous.names.keys()),
+        "disappeared_names": sorted(previous.names.keys() - names),
+    }
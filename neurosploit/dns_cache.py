@@ -0,0 +1,126 @@
+"""Persistent, TTL-aware DNS answer cache shared across scans."""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .dns_engine import DNSAnswer
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "neurosploit" / "dns_cache.sqlite3"
+
+
+class ResolutionCache:
+    """SQLite store of DNS answers keyed by FQDN and record type.
+
+    Positive answers live for the record TTL (capped at ``max_ttl``); NXDOMAIN and
+    empty answers live for ``negative_ttl``. Writes are buffered and committed in
+    batches so the cache never becomes the bottleneck of a brute-force run.
+    """
+
+    FLUSH_EVERY = 512
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        negative_ttl: int = 300,
+        max_ttl: int = 86400,
+    ):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.negative_ttl = max(0, negative_ttl)
+        self.max_ttl = max(0, max_ttl)
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.purged = False
+        self._pending: Dict[Tuple[str, str], Tuple[str, str, str, str, str, float]] = {}
+        self._conn = sqlite3.connect(str(self.path), timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " fqdn TEXT NOT NULL, rdtype TEXT NOT NULL, rcode TEXT NOT NULL,"
+            " addresses TEXT NOT NULL, cnames TEXT NOT NULL, expires_at REAL NOT NULL,"
+            " PRIMARY KEY (fqdn, rdtype)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def get(self, fqdn: str, rdtype: str) -> Optional[DNSAnswer]:
+        now = time.time()
+        row = self._pending.get((fqdn, rdtype))
+        if row is None:
+            try:
+                row = self._conn.execute(
+                    "SELECT fqdn, rdtype, rcode, addresses, cnames, expires_at FROM answers"
+                    " WHERE fqdn = ? AND rdtype = ?",
+                    (fqdn, rdtype),
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+        if row is None or row[5] <= now:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return DNSAnswer(
+            name=row[0],
+            rdtype=row[1],
+            rcode=row[2],
+            addresses=tuple(filter(None, row[3].split(","))),
+            cnames=tuple(filter(None, row[4].split(","))),
+            ttl=int(row[5] - now),
+        )
+
+    def put(self, answer: DNSAnswer) -> None:
+        if answer.addresses:
+            ttl = min(answer.ttl, self.max_ttl)
+        elif answer.rcode in ("NXDOMAIN", "NOERROR"):
+            ttl = self.negative_ttl
+        else:
+            # SERVFAIL, REFUSED and friends are transient; ask again next time.
+            return
+        if ttl <= 0:
+            return
+        self._pending[(answer.name, answer.rdtype)] = (
+            answer.name,
+            answer.rdtype,
+            answer.rcode,
+            ",".join(answer.addresses),
+            ",".join(answer.cnames),
+            time.time() + ttl,
+        )
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        rows = list(self._pending.values())
+        self._pending.clear()
+        try:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.stored += len(rows)
+        except sqlite3.Error:
+            # The cache is an optimization; a locked or broken database must not fail the scan.
+            pass
+
+    def purge(self) -> None:
+        self._pending.clear()
+        with self._conn:
+            self._conn.execute("DELETE FROM answers")
+        self.purged = True
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored": self.stored,
+            "purged": self.purged,
+        }
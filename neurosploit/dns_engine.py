@@ -0,0 +1,258 @@
+"""Asyncio DNS resolution engine used by the brute-force phase."""
+
+import asyncio
+import ipaddress
+import socket
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import dns.asyncquery as dns_asyncquery
+    import dns.exception as dns_exception
+    import dns.flags as dns_flags
+    import dns.message as dns_message
+    import dns.rcode as dns_rcode
+    import dns.rdatatype as dns_rdatatype
+    import dns.resolver as dns_resolver
+except ModuleNotFoundError:
+    dns_asyncquery = None
+    dns_exception = None
+    dns_flags = None
+    dns_message = None
+    dns_rcode = None
+    dns_rdatatype = None
+    dns_resolver = None
+
+from .concurrency import note_timeout
+
+if TYPE_CHECKING:
+    from .dns_cache import ResolutionCache
+
+
+@dataclass(frozen=True)
+class DNSAnswer:
+    name: str
+    rdtype: str
+    rcode: str
+    addresses: Tuple[str, ...] = ()
+    cnames: Tuple[str, ...] = ()
+    ttl: int = 0
+
+
+def _host_key(host: str) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address, str]:
+    """Comparable form of a socket address host, so equivalent IPv6 spellings match."""
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return host
+    # Dual-stack sockets report IPv4 peers as IPv4-mapped IPv6 addresses.
+    mapped = getattr(address, "ipv4_mapped", None)
+    return mapped or address
+
+
+class _DNSDatagramProtocol(asyncio.DatagramProtocol):
+    """One UDP socket shared by many in-flight queries, demultiplexed by query id.
+
+    Each pending query remembers the nameserver it was sent to; a datagram with a
+    matching id from any other address is dropped, so an off-path sender has to guess
+    the source as well as the 16-bit id to inject an answer.
+    """
+
+    def __init__(self) -> None:
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.pending: Dict[int, Tuple[asyncio.Future, Tuple[Any, int]]] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def expect(self, query_id: int, nameserver: str, port: int) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[query_id] = (future, (_host_key(nameserver), port))
+        return future
+
+    def datagram_received(self, data: bytes, addr: Tuple[Any, ...]) -> None:
+        if len(data) < 2:
+            return
+        entry = self.pending.get(int.from_bytes(data[:2], "big"))
+        if entry is None:
+            return
+        future, source = entry
+        if not future.done() and (_host_key(addr[0]), addr[1]) == source:
+            future.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors are not attributable to a single query; the per-query timeout handles them.
+        pass
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        for future, _ in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("DNS socket closed"))
+        self.pending.clear()
+
+
+class AsyncDNSEngine:
+    """Shared asyncio resolver with query coalescing, retries and per-attempt timeouts.
+
+    The nameserver configuration is read once, queries are multiplexed over a small
+    pool of UDP sockets, and concurrent lookups for the same name share one query.
+    When a ``ResolutionCache`` is attached it is consulted before any network query.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        retries: int = 2,
+        nameservers: Optional[Sequence[str]] = None,
+        port: int = 53,
+        sockets_per_family: int = 4,
+        cache: Optional["ResolutionCache"] = None,
+    ):
+        if dns_message is None:
+            raise RuntimeError("dnspython is required for DNS resolution")
+        self.nameservers: List[str] = list(nameservers or dns_resolver.Resolver().nameservers)
+        if not self.nameservers:
+            raise RuntimeError("No DNS nameservers configured")
+        self.port = port
+        self.retries = max(0, retries)
+        # Keep the overall lifetime of a lookup close to ``timeout`` across all attempts.
+        self.attempt_timeout = max(0.2, timeout / (self.retries + 1))
+        self.sockets_per_family = max(1, sockets_per_family)
+        self.cache = cache
+        self.stats: Dict[str, int] = {
+            "queries": 0,
+            "retries": 0,
+            "timeouts": 0,
+            "coalesced": 0,
+            "tcp_fallbacks": 0,
+        }
+        self._endpoints: Dict[int, List[_DNSDatagramProtocol]] = {}
+        self._endpoint_cursor = 0
+        self._endpoint_lock = asyncio.Lock()
+        self._nameserver_cursor = 0
+        self._inflight: Dict[Tuple[str, str], "asyncio.Task[DNSAnswer]"] = {}
+
+    async def __aenter__(self) -> "AsyncDNSEngine":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for protocols in self._endpoints.values():
+            for protocol in protocols:
+                if protocol.transport is not None:
+                    protocol.transport.close()
+        self._endpoints.clear()
+
+    async def resolve(self, name: str, rdtype: str = "A", use_cache: bool = True) -> DNSAnswer:
+        """Resolve ``name``; raises ``asyncio.TimeoutError`` if every attempt timed out."""
+        key = (name.lower().rstrip("."), rdtype.upper())
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(*key)
+            if cached is not None:
+                return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve_with_retries(*key, store=use_cache))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish_inflight(key, done))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: Tuple[str, str], task: "asyncio.Task[DNSAnswer]") -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved when the original caller went away.
+            task.exception()
+
+    async def _resolve_with_retries(self, name: str, rdtype: str, store: bool) -> DNSAnswer:
+        last_answer: Optional[DNSAnswer] = None
+        start = self._nameserver_cursor
+        self._nameserver_cursor = (self._nameserver_cursor + 1) % len(self.nameservers)
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.stats["retries"] += 1
+            nameserver = self.nameservers[(start + attempt) % len(self.nameservers)]
+            try:
+                response = await self._exchange(name, rdtype, nameserver)
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                note_timeout()
+                continue
+            except (ConnectionError, OSError, dns_exception.DNSException):
+                continue
+
+            last_answer = self._to_answer(name, rdtype, response)
+            if response.rcode() not in (dns_rcode.SERVFAIL, dns_rcode.REFUSED):
+                if store:
+                    self.cache.put(last_answer)
+                return last_answer
+
+        if last_answer is not None:
+            return last_answer
+        raise asyncio.TimeoutError(f"DNS lookup timed out for {name}")
+
+    async def _exchange(self, name: str, rdtype: str, nameserver: str) -> "dns_message.Message":
+        query = dns_message.make_query(name, rdtype)
+        protocol = await self._endpoint_for(nameserver)
+        while query.id in protocol.pending:
+            query.id = (query.id + 1) & 0xFFFF
+
+        future = protocol.expect(query.id, nameserver, self.port)
+        self.stats["queries"] += 1
+        try:
+            protocol.transport.sendto(query.to_wire(), (nameserver, self.port))
+            wire = await asyncio.wait_for(future, self.attempt_timeout)
+        finally:
+            entry = protocol.pending.get(query.id)
+            if entry is not None and entry[0] is future:
+                del protocol.pending[query.id]
+
+        response = dns_message.from_wire(wire)
+        if not query.is_response(response):
+            raise dns_exception.FormError("DNS response does not match query")
+        if response.flags & dns_flags.TC:
+            self.stats["tcp_fallbacks"] += 1
+            response = await dns_asyncquery.tcp(query, nameserver, timeout=self.attempt_timeout, port=self.port)
+        return response
+
+    async def _endpoint_for(self, nameserver: str) -> _DNSDatagramProtocol:
+        family = socket.AF_INET6 if ":" in nameserver else socket.AF_INET
+        protocols = self._endpoints.get(family)
+        if protocols is None:
+            async with self._endpoint_lock:
+                protocols = self._endpoints.get(family)
+                if protocols is None:
+                    loop = asyncio.get_running_loop()
+                    protocols = []
+                    for _ in range(self.sockets_per_family):
+                        _, protocol = await loop.create_datagram_endpoint(_DNSDatagramProtocol, family=family)
+                        protocols.append(protocol)
+                    self._endpoints[family] = protocols
+        self._endpoint_cursor = (self._endpoint_cursor + 1) % len(protocols)
+        return protocols[self._endpoint_cursor]
+
+    def _to_answer(self, name: str, rdtype: str, response: "dns_message.Message") -> DNSAnswer:
+        wanted = dns_rdatatype.from_text(rdtype)
+        addresses: List[str] = []
+        cnames: List[str] = []
+        ttls: List[int] = []
+        for rrset in response.answer:
+            ttls.append(rrset.ttl)
+            if rrset.rdtype == dns_rdatatype.CNAME:
+                cnames.extend(str(record.target).rstrip(".").lower() for record in rrset)
+            elif rrset.rdtype == wanted:
+                addresses.extend(record.to_text() for record in rrset)
+        return DNSAnswer(
+            name=name,
+            rdtype=rdtype,
+            rcode=dns_rcode.to_text(response.rcode()),
+            addresses=tuple(addresses),
+            cnames=tuple(cnames),
+            ttl=min(ttls) if ttls else 0,
+        )
@@ -0,0 +1,189 @@
+"""Data-driven technology fingerprinting compiled into single-pass matchers."""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+DEFAULT_FINGERPRINTS_PATH = Path(__file__).resolve().parent / "data" / "fingerprints.json"
+
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    branches: List[str] = []
+    for char in sorted(child for child in node if child != ""):
+        branches.append(re.escape(char) + _trie_pattern(node[char]))
+    if "" in node:
+        branches.append("")
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def _starts_pattern(trie: Dict[str, Any]) -> str:
+    """Regex matching the first character of each occurrence of a literal in ``trie``.
+
+    Only the first character is consumed and the rest is a lookahead, so ``finditer``
+    resumes at the next position and overlapping occurrences are all found. Starting
+    with a plain alternation of literal characters lets ``re`` skip ahead to candidate
+    positions in C instead of entering the pattern at every character.
+    """
+    branches = []
+    for char in sorted(child for child in trie if child != ""):
+        rest = _trie_pattern(trie[char])
+        branches.append(re.escape(char) + ("(?=" + rest + ")" if rest else ""))
+    return "|".join(branches)
+
+
+class LiteralMatcher:
+    """Finds every literal of a set in lowercase text, including overlapping ones.
+
+    Literals are merged into a prefix tree: a regex built from the tree finds, in one
+    pass, each position where some literal starts, and the tree is walked from there to
+    collect every literal ending at a later position, so the cost stops growing with the
+    number of literals. Sets of at most ``trie_threshold`` literals, such as the few per
+    header, are searched with one ``str.find`` per literal instead, which is cheaper for
+    them. Either
+    way literals that overlap or are nested in another ("react" in "react-dom") are all
+    reported. With ``word_boundaries`` a literal must not start or end inside a word; an
+    occurrence rejected for that does not hide shorter or later ones.
+    """
+
+    def __init__(
+        self,
+        literals: Mapping[str, Iterable[str]],
+        word_boundaries: bool = False,
+        trie_threshold: int = 16,
+    ):
+        self.word_boundaries = word_boundaries
+        self._labels: Dict[str, Set[str]] = {}
+        self._trie: Dict[str, Any] = {}
+        for literal, labels in literals.items():
+            key = literal.lower()
+            if not key:
+                continue
+            self._labels.setdefault(key, set()).update(labels)
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            # Whether the literal ends in a word character, so it needs a boundary after it.
+            node[""] = key[-1] in _WORD_CHARS
+        self._starts = (
+            re.compile(_starts_pattern(self._trie)) if len(self._labels) > trie_threshold else None
+        )
+
+    def _bounded(self, text: str, start: int, end: int) -> bool:
+        """Whether ``text[start:end]`` does not start or end inside a word."""
+        if not self.word_boundaries:
+            return True
+        if start and text[start] in _WORD_CHARS and text[start - 1] in _WORD_CHARS:
+            return False
+        return end >= len(text) or text[end - 1] not in _WORD_CHARS or text[end] not in _WORD_CHARS
+
+    def scan(self, text: str) -> Set[str]:
+        """Return the labels of all literals found in ``text`` (which must be lowercase)."""
+        if self._starts is None:
+            return self._find_each(text)
+        found: Set[str] = set()
+        boundaries = self.word_boundaries
+        length = len(text)
+        for match in self._starts.finditer(text):
+            start = match.start()
+            if boundaries and start and text[start] in _WORD_CHARS and text[start - 1] in _WORD_CHARS:
+                continue
+            node = self._trie
+            end = start
+            while end < length:
+                node = node.get(text[end])
+                if node is None:
+                    break
+                end += 1
+                if "" in node and not (boundaries and node[""] and end < length and text[end] in _WORD_CHARS):
+                    found.update(self._labels[text[start:end]])
+        return found
+
+    def _find_each(self, text: str) -> Set[str]:
+        found: Set[str] = set()
+        for literal, labels in self._labels.items():
+            start = text.find(literal)
+            while start != -1 and not self._bounded(text, start, start + len(literal)):
+                start = text.find(literal, start + 1)
+            if start != -1:
+                found |= labels
+        return found
+
+
+class FingerprintEngine:
+    """Matches response headers, cookies, body and meta generator against signature data.
+
+    Signature file format::
+
+        {"technologies": {"WordPress": {"body": ["wp-content"], "meta_generator": ["wordpress"],
+                                        "headers": {"X-Powered-By": "wordpress"},
+                                        "cookies": ["wordpress_logged_in"]}}}
+
+    Header values are case-insensitive substrings; an empty value only requires the
+    header to be present. Body literals must start and end on word boundaries.
+    """
+
+    def __init__(self, technologies: Mapping[str, Mapping[str, Any]]):
+        self.order: Dict[str, int] = {name: index for index, name in enumerate(technologies)}
+        body: Dict[str, Set[str]] = {}
+        generator: Dict[str, Set[str]] = {}
+        headers: Dict[str, Dict[str, Set[str]]] = {}
+        self._header_presence: Dict[str, Set[str]] = {}
+        self._cookies: Dict[str, Set[str]] = {}
+
+        for name, rules in technologies.items():
+            for literal in rules.get("body", []):
+                body.setdefault(literal, set()).add(name)
+            for literal in rules.get("meta_generator", []):
+                generator.setdefault(literal, set()).add(name)
+            for header, literal in rules.get("headers", {}).items():
+                if literal:
+                    headers.setdefault(header, {}).setdefault(literal, set()).add(name)
+                else:
+                    self._header_presence.setdefault(header, set()).add(name)
+            for cookie in rules.get("cookies", []):
+                self._cookies.setdefault(cookie.lower(), set()).add(name)
+
+        self._body = LiteralMatcher(body, word_boundaries=True)
+        self._generator = LiteralMatcher(generator)
+        self._headers = {header: LiteralMatcher(literals) for header, literals in headers.items()}
+
+    @classmethod
+    def from_file(cls, path: Path) -> "FingerprintEngine":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data.get("technologies", {}))
+
+    @property
+    def signature_count(self) -> int:
+        return len(self.order)
+
+    def match(
+        self,
+        headers: Mapping[str, str],
+        body_text: str,
+        cookie_names: Iterable[str] = (),
+        meta_generator: Optional[str] = None,
+    ) -> List[str]:
+        found = self._body.scan(body_text.lower())
+        for header, matcher in self._headers.items():
+            value = headers.get(header)
+            if value:
+                found |= matcher.scan(value.lower())
+        for header, names in self._header_presence.items():
+            if header in headers:
+                found |= names
+        for cookie in cookie_names:
+            found |= self._cookies.get(cookie.lower(), set())
+        if meta_generator:
+            found |= self._generator.scan(meta_generator.lower())
+        return sorted(found, key=self.order.__getitem__)
+
+
+@lru_cache(maxsize=8)
+def load_fingerprint_engine(path: Optional[str] = None) -> FingerprintEngine:
+    return FingerprintEngine.from_file(Path(path) if path else DEFAULT_FINGERPRINTS_PATH)
@@ -0,0 +1,99 @@
+"""Single-pass extraction of document metadata from the head of an HTML response."""
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+HEAD_SCAN_LIMIT = 32 * 1024
+
+_FEED_CHUNK = 1024
+_HEAD_END = re.compile(r"</head\s*>|<body[\s>]", re.IGNORECASE)
+_BODY_TAGS = frozenset({"body", "main", "div", "section", "article", "header", "nav", "p", "h1", "svg"})
+
+
+@dataclass
+class HeadMetadata:
+    title: Optional[str] = None
+    generator: Optional[str] = None
+    favicon: Optional[str] = None
+    canonical: Optional[str] = None
+
+
+class _HeadParser(HTMLParser):
+    """Collects head metadata and flags ``done`` as soon as the document body begins."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.meta = HeadMetadata()
+        self.done = False
+        self._in_title = False
+        self._title_parts: List[str] = []
+        self._touch_icon = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self.done:
+            return
+        if tag == "title":
+            self._in_title = self.meta.title is None
+        elif tag == "meta":
+            values = {key: (value or "") for key, value in attrs}
+            if values.get("name", "").lower() == "generator" and self.meta.generator is None:
+                self.meta.generator = values.get("content", "").strip() or None
+        elif tag == "link":
+            values = {key: (value or "") for key, value in attrs}
+            rel = values.get("rel", "").lower().split()
+            href = values.get("href", "").strip()
+            if not href:
+                return
+            if "canonical" in rel and self.meta.canonical is None:
+                self.meta.canonical = href
+            elif "icon" in rel and (self.meta.favicon is None or self._touch_icon):
+                self.meta.favicon = href
+                self._touch_icon = False
+            elif "apple-touch-icon" in rel and self.meta.favicon is None:
+                # Only used when the page declares no regular icon.
+                self.meta.favicon = href
+                self._touch_icon = True
+        elif tag in _BODY_TAGS:
+            self._finish()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._in_title:
+            self._finish_title()
+        elif tag == "head":
+            self._finish()
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self._title_parts.append(data)
+
+    def _finish_title(self) -> None:
+        self._in_title = False
+        self.meta.title = " ".join("".join(self._title_parts).split())[:160]
+
+    def _finish(self) -> None:
+        if self._in_title:
+            self._finish_title()
+        self.done = True
+
+    def close_head(self) -> None:
+        """Keep whatever was collected when the scan limit is reached before the body."""
+        if not self.done:
+            self._finish()
+
+
+def extract_head_metadata(html: str, limit: int = HEAD_SCAN_LIMIT) -> HeadMetadata:
+    """Parse at most ``limit`` characters of ``html``, stopping at ``</head>`` or the body."""
+    parser = _HeadParser()
+    end = min(len(html), max(0, limit))
+    # Never hand the tokenizer more than the head: find its end with a cheap scan first.
+    head_end = _HEAD_END.search(html, 0, end)
+    if head_end is not None:
+        end = head_end.end()
+    for offset in range(0, end, _FEED_CHUNK):
+        parser.feed(html[offset:min(offset + _FEED_CHUNK, end)])
+        if parser.done:
+            break
+    parser.close_head()
+    return parser.meta
@@ -0,0 +1,109 @@
+"""Pooled HTTP client shared by the probe phase of a scan."""
+
+import asyncio
+import socket
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import aiohttp
+    from aiohttp.abc import AbstractResolver
+except ModuleNotFoundError:
+    aiohttp = None
+    AbstractResolver = object  # type: ignore[assignment,misc]
+
+from .dns_engine import AsyncDNSEngine
+
+PROBE_USER_AGENT = "Mozilla/5.0 (NeuroSploit Async Probe)"
+
+
+class PinnedResolver(AbstractResolver):
+    """Serves addresses already learned during the scan and resolves anything else once.
+
+    Hosts found by DNS brute-force are pinned to the address we resolved, so the probe
+    never repeats that lookup. Unknown hosts (CT log names, redirect targets) go through
+    the shared DNS engine and the answer, positive or negative, is remembered.
+    """
+
+    def __init__(self, dns_engine_factory: Optional[Callable[[], AsyncDNSEngine]] = None):
+        self._addresses: Dict[str, List[str]] = {}
+        self._dns_engine_factory = dns_engine_factory
+        self._fallback: Optional[Any] = None
+
+    def pin(self, host: str, address: str) -> None:
+        self._addresses[host.lower()] = [address]
+
+    def address_for(self, host: str) -> Optional[str]:
+        addresses = self._addresses.get(host.lower())
+        return addresses[0] if addresses else None
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict[str, Any]]:
+        addresses = self._addresses.get(host.lower())
+        if addresses is None:
+            addresses = await self._lookup(host, port, family)
+        if not addresses:
+            raise OSError(f"Could not resolve {host}")
+        return [
+            {
+                "hostname": host,
+                "host": address,
+                "port": port,
+                "family": socket.AF_INET6 if ":" in address else socket.AF_INET,
+                "proto": 0,
+                "flags": socket.AI_NUMERICHOST,
+            }
+            for address in addresses
+        ]
+
+    async def _lookup(self, host: str, port: int, family: int) -> List[str]:
+        if self._dns_engine_factory is None:
+            if self._fallback is None:
+                self._fallback = aiohttp.ThreadedResolver()
+            addresses = [item["host"] for item in await self._fallback.resolve(host, port, family)]
+        else:
+            try:
+                answer = await self._dns_engine_factory().resolve(host, "A")
+            except asyncio.TimeoutError:
+                return []
+            addresses = list(answer.addresses)
+        self._addresses[host.lower()] = addresses
+        return addresses
+
+    async def close(self) -> None:
+        if self._fallback is not None:
+            await self._fallback.close()
+            self._fallback = None
+
+
+def response_ssl_object(response: "aiohttp.ClientResponse") -> Optional[Any]:
+    """Return the TLS object of the connection that served ``response``, if still open."""
+    connection = response.connection
+    if connection is not None and connection.transport is not None:
+        return connection.transport.get_extra_info("ssl_object")
+    # Last resort, through a private attribute (checked against the aiohttp range pinned
+    # in setup.py): small bodies arrive with the headers and aiohttp hands the connection
+    # back to the pool before we see the response, but its protocol stays reachable here.
+    # If a future aiohttp drops it, the enrichment phase's separate handshake takes over.
+    protocol = getattr(response, "_protocol", None)
+    transport = getattr(protocol, "transport", None)
+    return transport.get_extra_info("ssl_object") if transport is not None else None
+
+
+def create_probe_session(
+    timeout: float,
+    pool_size: int,
+    per_host_limit: int,
+    resolver: PinnedResolver,
+) -> "aiohttp.ClientSession":
+    """Build the keep-alive session used for every probe of a scan."""
+    connector = aiohttp.TCPConnector(
+        limit=max(1, pool_size),
+        limit_per_host=max(1, per_host_limit),
+        ssl=False,
+        resolver=resolver,
+        use_dns_cache=False,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": PROBE_USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=max(2, timeout * 2)),
+    )
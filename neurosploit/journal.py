@@ -0,0 +1,190 @@
+"""Append-only journal of completed scan work, used to resume interrupted scans."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_JOURNAL_DIR = Path.home() / ".cache" / "neurosploit" / "journals"
+
+# Phase name under which stage completion markers are recorded.
+COMPLETE = "complete"
+
+
+def default_journal_path(domain: str) -> Path:
+    return DEFAULT_JOURNAL_DIR / f"{domain}.ndjson"
+
+
+class ScanJournal:
+    """NDJSON log with one ``{"phase", "key", "result"}`` line per completed unit of work.
+
+    ``record`` only buffers; a background task appends the buffer every
+    ``flush_interval`` seconds (or as soon as ``batch_size`` entries are waiting) from a
+    worker thread, so journaling never blocks the scan on disk I/O. A crash loses at
+    most the last unflushed batch, and a line torn by the crash is skipped on load.
+
+    The header stores ``fingerprint`` (of the scan settings that shape results); a
+    journal is only resumed when it matches and the scan started less than ``max_age``
+    seconds ago (0 disables the age check). Otherwise ``stale`` says why and a new
+    journal replaces it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        domain: str,
+        fingerprint: str = "",
+        max_age: float = 0,
+        flush_interval: float = 0.5,
+        batch_size: int = 512,
+    ):
+        self.path = Path(path)
+        self.domain = domain
+        self.fingerprint = fingerprint
+        self.max_age = max(0.0, max_age)
+        self.stale: Optional[str] = None
+        self.flush_interval = max(0.01, flush_interval)
+        self.batch_size = max(1, batch_size)
+        self.replay: Dict[str, Dict[str, Any]] = {}
+        self.resumed = False
+        self.recorded = 0
+        self.replayed = 0
+        self._pending: List[str] = []
+        self._file: Optional[Any] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._writer: Optional["asyncio.Task[None]"] = None
+        self._closing = False
+
+    def _load(self) -> bool:
+        """Read an existing journal of an unfinished scan of ``domain`` into ``replay``."""
+        if not self.path.exists():
+            return False
+        replay: Dict[str, Dict[str, Any]] = {}
+        with self.path.open(encoding="utf-8") as handle:
+            try:
+                header = json.loads(handle.readline())
+            except ValueError:
+                return False
+            if not isinstance(header, dict):
+                return False
+            if header.get("domain") != self.domain:
+                raise ValueError(f"Journal {self.path} belongs to {header.get('domain')!r}, not {self.domain!r}")
+            self.stale = self._staleness(header)
+            if self.stale:
+                return False
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                    replay.setdefault(entry["phase"], {})[entry["key"]] = entry["result"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+        if "scan" in replay.get(COMPLETE, {}):
+            # The scan finished; there is nothing to resume.
+            return False
+        self.replay = replay
+        return True
+
+    def _staleness(self, header: Dict[str, Any]) -> Optional[str]:
+        """Why the journal with ``header`` must not be resumed, or None if it can be."""
+        if header.get("config") != self.fingerprint:
+            return "scan settings changed"
+        if self.max_age:
+            try:
+                started = datetime.fromisoformat(str(header.get("started_at")))
+            except ValueError:
+                return "unknown start time"
+            if started.tzinfo is None:
+                started = started.replace(tzinfo=timezone.utc)
+            if (datetime.now(timezone.utc) - started).total_seconds() > self.max_age:
+                return "older than the resume age limit"
+        return None
+
+    def _open(self, resume: bool) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.resumed = resume and self._load()
+        if self.resumed:
+            self._file = self.path.open("a", encoding="utf-8")
+            if self._file.tell() and not self.path.read_bytes().endswith(b"\n"):
+                # Terminate a line torn by the crash before appending.
+                self._file.write("\n")
+            return
+        self._file = self.path.open("w", encoding="utf-8")
+        header = {
+            "domain": self.domain,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "config": self.fingerprint,
+        }
+        self._file.write(json.dumps(header) + "\n")
+        self._file.flush()
+
+    async def open(self, resume: bool = False) -> "ScanJournal":
+        """Start a new journal, or with ``resume`` continue the unfinished one at ``path``."""
+        await asyncio.to_thread(self._open, resume)
+        self._wake = asyncio.Event()
+        self._writer = asyncio.ensure_future(self._write_loop())
+        return self
+
+    def lookup(self, phase: str, key: str) -> Tuple[bool, Any]:
+        """Return ``(True, result)`` for work already recorded in the replayed journal."""
+        entries = self.replay.get(phase)
+        if entries is None or key not in entries:
+            return False, None
+        self.replayed += 1
+        return True, entries[key]
+
+    def completed(self, phase: str) -> bool:
+        return phase in self.replay.get(COMPLETE, {})
+
+    def record(self, phase: str, key: str, result: Any) -> None:
+        self._pending.append(
+            json.dumps({"phase": phase, "key": key, "result": result}, separators=(",", ":"), default=str)
+        )
+        self.recorded += 1
+        if len(self._pending) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    def mark_complete(self, phase: str) -> None:
+        self.record(COMPLETE, phase, True)
+
+    async def _write_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+            if self._closing:
+                return
+
+    async def flush(self) -> None:
+        if not self._pending or self._file is None:
+            return
+        batch, self._pending = self._pending, []
+        await asyncio.to_thread(self._write, "\n".join(batch) + "\n")
+
+    def _write(self, data: str) -> None:
+        self._file.write(data)
+        self._file.flush()
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            # Let the writer finish its last batch instead of cancelling it mid-write.
+            self._closing = True
+            self._wake.set()
+            await asyncio.shield(self._writer)
+            self._writer = None
+        await self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "resumed": self.resumed,
+            "stale": self.stale,
+            "replayed": self.replayed,
+            "recorded": self.recorded,
+        }
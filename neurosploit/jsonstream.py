@@ -0,0 +1,71 @@
+"""Incremental decoding of large top-level JSON arrays."""
+
+import json
+from typing import Any, List
+
+
+class JSONArrayStream:
+    """Decodes the elements of a top-level JSON array from text fed in arbitrary chunks.
+
+    Only the current, not yet complete element is buffered, so memory stays bounded by
+    the largest single element rather than by the size of the whole document.
+    """
+
+    MAX_PENDING_CHARS = 8 * 1024 * 1024
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+
+    def feed(self, text: str) -> List[Any]:
+        buffer = self._buffer + text if self._buffer else text
+        items: List[Any] = []
+        pos = 0
+        size = len(buffer)
+
+        while not self._finished:
+            while pos < size and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos >= size:
+                break
+            char = buffer[pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+                continue
+            if char == ",":
+                pos += 1
+                continue
+            if char == "]":
+                self._finished = True
+                pos = size
+                break
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except ValueError:
+                break
+            if not isinstance(item, (dict, list, str)):
+                # A bare number is only complete once its delimiter has arrived ("1." may become "1.5").
+                tail = end
+                while tail < size and buffer[tail] in " \t\r\n":
+                    tail += 1
+                if tail >= size or buffer[tail] not in ",]":
+                    break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        if len(self._buffer) > self.MAX_PENDING_CHARS:
+            raise ValueError("JSON array element exceeds the streaming buffer limit")
+        return items
+
+    def close(self) -> List[Any]:
+        """Flush the final element; raises ``ValueError`` if the document was truncated."""
+        items = self.feed("")
+        if not self._finished:
+            raise ValueError("Truncated JSON array")
+        return items
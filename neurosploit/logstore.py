@@ -0,0 +1,88 @@
+"""Bounded in-memory store of UI log entries."""
+
+import time
+from collections import deque
+from typing import Any, Deque, Iterator, Optional
+
+LEVELS = ("debug", "info", "warning", "error")
+_RANK = {level: rank for rank, level in enumerate(LEVELS)}
+
+_ERROR_WORDS = ("error", "failed", "exception", "traceback")
+_WARNING_WORDS = ("warning", "timeout", "timed out", "retry", "skipped")
+
+
+def guess_level(text: str) -> str:
+    """Level of an engine message, which carries none of its own."""
+    lowered = text.lower()
+    if any(word in lowered for word in _ERROR_WORDS):
+        return "error"
+    if any(word in lowered for word in _WARNING_WORDS):
+        return "warning"
+    return "info"
+
+
+class LogEntry:
+    """One log line, optionally carrying a ``detail`` (a JSON payload or renderable) shown when expanded."""
+
+    __slots__ = ("seq", "created", "source", "level", "text", "detail", "expanded")
+
+    def __init__(self, seq: int, source: str, level: str, text: str, detail: Any = None, expanded: bool = False):
+        self.seq = seq
+        self.created = time.time()
+        self.source = source
+        self.level = level
+        self.text = text
+        self.detail = detail
+        self.expanded = expanded
+
+
+class LogStore:
+    """Ring buffer of the last ``capacity`` entries; older ones are dropped as new ones arrive.
+
+    ``version`` increases on every change so views can skip redraws when nothing happened.
+    """
+
+    def __init__(self, capacity: int = 5000):
+        self.capacity = max(1, capacity)
+        self.version = 0
+        self.dropped = 0
+        self._entries: Deque[LogEntry] = deque(maxlen=self.capacity)
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(
+        self,
+        source: str,
+        text: str,
+        level: Optional[str] = None,
+        detail: Any = None,
+        expanded: bool = False,
+    ) -> LogEntry:
+        if len(self._entries) == self.capacity:
+            self.dropped += 1
+        entry = LogEntry(self._next_seq, source, level or guess_level(text), text, detail, expanded)
+        self._next_seq += 1
+        self._entries.append(entry)
+        self.version += 1
+        return entry
+
+    def entries(self, min_level: str = "debug") -> Iterator[LogEntry]:
+        """Entries at ``min_level`` or above, oldest first."""
+        floor = _RANK[min_level]
+        return (entry for entry in self._entries if _RANK[entry.level] >= floor)
+
+    def resize(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self.dropped += max(0, len(self._entries) - self.capacity)
+        self._entries = deque(self._entries, maxlen=self.capacity)
+        self.version += 1
+
+    def touch(self) -> None:
+        """Record a change made to an entry in place (such as expanding it)."""
+        self.version += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.version += 1
@@ -0,0 +1,134 @@
+"""Per-phase timing and outcome metrics collected while a scan runs."""
+
+import asyncio
+import math
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with constant memory and ~2.5% relative error."""
+
+    _FLOOR = 1e-5
+    _LOG_BASE = math.log(1.05)
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = 0 if seconds <= self._FLOOR else int(math.log(seconds / self._FLOOR) / self._LOG_BASE) + 1
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                # Report the geometric middle of the bucket, never more than the observed maximum.
+                return min(self.max, self._FLOOR * math.exp((index - 0.5) * self._LOG_BASE)) if index else 0.0
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class PhaseMetrics:
+    """Wall time, outcome counts and latency distributions of one scan phase."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.items = 0
+        self.results = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+        self.queue_wait = LatencyHistogram()
+
+    def start(self) -> None:
+        if self.started is None:
+            self.started = time.monotonic()
+
+    def finish(self) -> None:
+        self.start()
+        self.finished = time.monotonic()
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def record(self, seconds: float, has_result: bool, timed_out: bool = False, failed: bool = False) -> None:
+        self.items += 1
+        if has_result:
+            self.results += 1
+        if timed_out:
+            self.timeouts += 1
+        elif failed:
+            self.errors += 1
+        self.latency.add(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        wall = self.wall_seconds
+        return {
+            "running": self.started is not None and self.finished is None,
+            "wall_seconds": round(wall, 3),
+            "items": self.items,
+            "results": self.results,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "items_per_second": round(self.items / wall, 1) if wall > 0 else 0.0,
+            "latency": self.latency.summary(),
+            "queue_wait": self.queue_wait.summary(),
+        }
+
+
+class MetricsCollector:
+    """Phase metrics of one scan; safe to read from the TUI while the scan is running."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.phases: Dict[str, PhaseMetrics] = {}
+
+    def phase(self, name: str) -> PhaseMetrics:
+        metrics = self.phases.get(name)
+        if metrics is None:
+            metrics = self.phases[name] = PhaseMetrics(name)
+        return metrics
+
+    def snapshot(self) -> Dict[str, Any]:
+        # Stages run concurrently; listing them by first activity keeps pipeline order.
+        ordered = sorted(self.phases.values(), key=lambda metrics: (metrics.started is None, metrics.started or 0.0))
+        return {
+            "elapsed_seconds": round(time.monotonic() - self.started, 3),
+            "phases": {metrics.name: metrics.snapshot() for metrics in ordered},
+        }
+
+
+class TimedQueue(asyncio.Queue):
+    """``asyncio.Queue`` whose ``get`` returns ``(seconds_waited_in_queue, item)``."""
+
+    def _put(self, item: Any) -> None:
+        super()._put((time.monotonic(), item))
+
+    def _get(self) -> Tuple[float, Any]:
+        enqueued, item = super()._get()
+        return time.monotonic() - enqueued, item
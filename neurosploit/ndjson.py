@@ -0,0 +1,38 @@
+"""Newline-delimited JSON output of report records as a scan produces them."""
+
+import json
+from typing import Any, Dict, TextIO
+
+# Report keys streamed as individual records rather than repeated in the summary.
+STREAMED_KEYS = ("subdomains", "live_subdomains")
+
+
+def summary_record(report: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "summary", **{key: value for key, value in report.items() if key not in STREAMED_KEYS}}
+
+
+class NDJSONWriter:
+    """Record callback writing one compact JSON object per line.
+
+    Every line is flushed immediately so tools reading a pipe see hosts as they are
+    found. If the reader goes away (``| head``), further records are dropped.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.records = 0
+        self.broken = False
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        if self.broken:
+            return
+        try:
+            self.stream.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+            self.stream.flush()
+        except BrokenPipeError:
+            self.broken = True
+            return
+        self.records += 1
+
+    def write_summary(self, report: Dict[str, Any]) -> None:
+        self(summary_record(report))
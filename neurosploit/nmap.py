@@ -0,0 +1,178 @@
+"""Batched nmap execution with incremental parsing of its XML output."""
+
+import asyncio
+import shutil
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+
+def _host_result(host: ET.Element) -> Dict[str, Any]:
+    status = host.find("status")
+    open_ports: List[Dict[str, Any]] = []
+    for port in host.iterfind("ports/port"):
+        state = port.find("state")
+        if state is None or state.get("state") != "open":
+            continue
+        service = port.find("service")
+        entry: Dict[str, Any] = {
+            "port": int(port.get("portid", "0")),
+            "protocol": port.get("protocol", "tcp"),
+            "service": service.get("name", "unknown") if service is not None else "unknown",
+        }
+        if service is not None:
+            version = " ".join(filter(None, (service.get("product"), service.get("version"))))
+            if version:
+                entry["version"] = version
+        open_ports.append(entry)
+    return {
+        "state": status.get("state", "unknown") if status is not None else "unknown",
+        "open_ports": open_ports,
+    }
+
+
+def _host_addresses(host: ET.Element) -> List[str]:
+    return [
+        address.get("addr", "")
+        for address in host.iterfind("address")
+        if address.get("addrtype") in ("ipv4", "ipv6")
+    ]
+
+
+class NmapRunner:
+    """Collects IPs into batches and scans each batch with one ``nmap -oX -`` process.
+
+    Callers ``await scan(ip)`` individually; IPs submitted within ``batch_window``
+    seconds of each other (up to ``batch_size``) share a process and at most
+    ``processes`` run at once. nmap writes each host group to the XML stream as soon
+    as it is done, so with ``parallelism`` hosts per group a caller is released when
+    its group finishes rather than when the whole batch does.
+    """
+
+    def __init__(
+        self,
+        top_ports: int = 100,
+        batch_size: int = 64,
+        processes: int = 2,
+        parallelism: int = 8,
+        host_timeout: float = 120.0,
+        batch_window: float = 0.5,
+        binary: str = "nmap",
+    ):
+        self.top_ports = top_ports
+        self.batch_size = max(1, batch_size)
+        self.parallelism = max(0, parallelism)
+        self.host_timeout = host_timeout
+        self.batch_window = max(0.0, batch_window)
+        self.binary = binary
+        self.stats: Dict[str, int] = {"hosts": 0, "processes": 0, "failed_hosts": 0}
+        self._slots = asyncio.Semaphore(max(1, processes))
+        self._pending: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._queues: Dict[bool, List[str]] = {False: [], True: []}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: Set["asyncio.Task[None]"] = set()
+        self._processes: Set[asyncio.subprocess.Process] = set()
+
+    def command(self, ips: Sequence[str]) -> List[str]:
+        args = [self.binary, "-Pn", f"--top-ports={self.top_ports}", f"--host-timeout={int(self.host_timeout)}s"]
+        if self.parallelism:
+            args += [f"--min-hostgroup={self.parallelism}", f"--max-hostgroup={self.parallelism}"]
+        if any(":" in ip for ip in ips):
+            args.append("-6")
+        return args + ["-oX", "-", *ips]
+
+    async def scan(self, ip: str) -> Dict[str, Any]:
+        future = self._pending.get(ip)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[ip] = future
+            # nmap scans one address family per run.
+            queue = self._queues[":" in ip]
+            queue.append(ip)
+            if len(queue) >= self.batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for queue in self._queues.values():
+            while queue:
+                batch = queue[: self.batch_size]
+                del queue[: self.batch_size]
+                task = asyncio.ensure_future(self._run_batch(batch))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, ips: List[str]) -> None:
+        remaining = set(ips)
+        exit_code: Optional[int] = None
+        error = "nmap produced no result for this host"
+        try:
+            async with self._slots:
+                exit_code = await self._stream_batch(ips, remaining)
+        except FileNotFoundError:
+            error = "nmap not installed"
+        except (OSError, ET.ParseError) as exc:
+            error = str(exc)
+        finally:
+            for ip in remaining:
+                # Same layout as a scanned host, so consumers can always read state/open_ports.
+                self.stats["failed_hosts"] += 1
+                self._resolve(ip, {"state": "unknown", "open_ports": [], "error": error, "exit_code": exit_code})
+
+    async def _stream_batch(self, ips: List[str], remaining: Set[str]) -> int:
+        if shutil.which(self.binary) is None:
+            raise FileNotFoundError(self.binary)
+        process = await asyncio.create_subprocess_exec(
+            *self.command(ips),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.stats["processes"] += 1
+        self._processes.add(process)
+        parser = ET.XMLPullParser(events=("end",))
+        try:
+            while True:
+                chunk = await process.stdout.read(64 * 1024)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if element.tag != "host":
+                        continue
+                    result = _host_result(element)
+                    for address in _host_addresses(element):
+                        if address in remaining:
+                            remaining.discard(address)
+                            self.stats["hosts"] += 1
+                            self._resolve(address, result)
+                    element.clear()
+            return await process.wait()
+        finally:
+            self._processes.discard(process)
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    def _resolve(self, ip: str, result: Dict[str, Any]) -> None:
+        future = self._pending.get(ip)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    async def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for process in list(self._processes):
+            if process.returncode is None:
+                process.kill()
+        for task in list(self._batches):
+            task.cancel()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
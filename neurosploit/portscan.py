@@ -0,0 +1,106 @@
+"""Asyncio TCP connect scanner shared by every host of a scan."""
+
+import asyncio
+import socket
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_PORTS = [80, 443, 21, 22, 25, 53, 110, 143, 993, 995]
+
+
+class _HostRTT:
+    """Smoothed connect round-trip estimate for one host (RFC 6298 style)."""
+
+    __slots__ = ("srtt", "rttvar")
+
+    def __init__(self) -> None:
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+
+    def observe(self, sample: float) -> None:
+        if self.srtt is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - sample)
+            self.srtt = 0.875 * self.srtt + 0.125 * sample
+
+
+class AsyncPortScanner:
+    """Connect scanner probing all ports of all hosts concurrently under one socket budget.
+
+    A host starts with a conservative ``max_timeout`` on a single seed port; once a
+    connect has completed (open or refused) the remaining ports wait ``rtt_multiplier``
+    retransmission timeouts of the measured round trip, clamped to
+    ``[min_timeout, max_timeout]``. A filtered port therefore costs a few round trips
+    instead of the full timeout, and all ports of a host are in flight together.
+    """
+
+    def __init__(
+        self,
+        max_sockets: int = 512,
+        min_timeout: float = 0.25,
+        max_timeout: float = 1.5,
+        rtt_multiplier: float = 2.0,
+    ):
+        self.max_sockets = max(1, max_sockets)
+        self.min_timeout = max(0.01, min_timeout)
+        self.max_timeout = max(self.min_timeout, max_timeout)
+        self.rtt_multiplier = rtt_multiplier
+        self.stats: Dict[str, int] = {"hosts": 0, "probes": 0, "open": 0, "closed": 0, "filtered": 0, "errors": 0}
+        self._sockets = asyncio.Semaphore(self.max_sockets)
+        self._rtt: Dict[str, _HostRTT] = {}
+
+    def timeout_for(self, host: str) -> float:
+        estimate = self._rtt.get(host)
+        if estimate is None or estimate.srtt is None:
+            return self.max_timeout
+        timeout = self.rtt_multiplier * (estimate.srtt + 4 * estimate.rttvar)
+        return min(self.max_timeout, max(self.min_timeout, timeout))
+
+    async def scan(self, host: str, ports: Sequence[int], seed_ports: Iterable[int] = ()) -> List[int]:
+        """Return the open ports of ``host`` in ascending order.
+
+        ``seed_ports`` are probed first to measure the round trip; ports known to be
+        reachable (the port a live HTTP service answered on) make the best seeds.
+        """
+        pending = list(dict.fromkeys(ports))
+        if not pending:
+            return []
+        self.stats["hosts"] += 1
+        seeds = [port for port in dict.fromkeys(seed_ports) if port in pending] or pending[:1]
+        rest = [port for port in pending if port not in seeds]
+
+        open_ports: List[int] = []
+        for batch in (seeds, rest):
+            results = await asyncio.gather(*(self._probe(host, port) for port in batch))
+            open_ports.extend(port for port, is_open in zip(batch, results) if is_open)
+        return sorted(open_ports)
+
+    async def _probe(self, host: str, port: int) -> bool:
+        family = socket.AF_INET6 if ":" in host else socket.AF_INET
+        loop = asyncio.get_running_loop()
+        async with self._sockets:
+            # Read the timeout after waiting for a socket so it reflects the latest RTT.
+            timeout = self.timeout_for(host)
+            self.stats["probes"] += 1
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout)
+            except asyncio.TimeoutError:
+                self.stats["filtered"] += 1
+                return False
+            except ConnectionRefusedError:
+                self._rtt.setdefault(host, _HostRTT()).observe(time.perf_counter() - started)
+                self.stats["closed"] += 1
+                return False
+            except OSError:
+                self.stats["errors"] += 1
+                return False
+            finally:
+                sock.close()
+            self._rtt.setdefault(host, _HostRTT()).observe(time.perf_counter() - started)
+            self.stats["open"] += 1
+            return True
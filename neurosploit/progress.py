@@ -0,0 +1,68 @@
+"""Rate-limited delivery of scan progress events."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+ProgressCallback = Callable[[str, int, int, str], Optional[Awaitable[None]]]
+ProgressState = Tuple[int, int, str]
+
+
+class ProgressCoalescer:
+    """Delivers at most one progress event per phase every ``interval`` seconds.
+
+    The first event of a phase goes out immediately. Events arriving sooner only
+    replace the phase's pending state, which a timer sends once the interval has
+    passed, so the receiver always ends up with the latest counts without seeing every
+    intermediate one. An ``interval`` of 0 delivers every event.
+    """
+
+    def __init__(self, callback: Optional[ProgressCallback], interval: float = 0.1):
+        self.callback = callback
+        self.interval = max(0.0, interval)
+        self._sent_at: Dict[str, float] = {}
+        self._pending: Dict[str, ProgressState] = {}
+        self._timers: Dict[str, "asyncio.Task[None]"] = {}
+
+    async def emit(self, phase: str, current: int, total: int, message: str) -> None:
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        sent_at = self._sent_at.get(phase)
+        if not self.interval or sent_at is None or now - sent_at >= self.interval:
+            self._pending.pop(phase, None)
+            await self._deliver(phase, (current, total, message))
+            return
+        self._pending[phase] = (current, total, message)
+        if phase not in self._timers:
+            self._timers[phase] = asyncio.ensure_future(self._deliver_later(phase, sent_at + self.interval - now))
+
+    async def flush(self, phase: Optional[str] = None) -> None:
+        """Deliver the pending state of ``phase`` (or of every phase) right away."""
+        for name in [phase] if phase is not None else list(self._pending):
+            timer = self._timers.pop(name, None)
+            if timer is not None:
+                timer.cancel()
+            state = self._pending.pop(name, None)
+            if state is not None:
+                await self._deliver(name, state)
+
+    def cancel(self) -> None:
+        """Drop pending states and stop their timers."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+    async def _deliver_later(self, phase: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._timers.pop(phase, None)
+        state = self._pending.pop(phase, None)
+        if state is not None:
+            await self._deliver(phase, state)
+
+    async def _deliver(self, phase: str, state: ProgressState) -> None:
+        self._sent_at[phase] = time.monotonic()
+        maybe_awaitable = self.callback(phase, *state)
+        if maybe_awaitable:
+            await maybe_awaitable
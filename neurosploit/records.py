@@ -0,0 +1,142 @@
+"""Compact in-memory records for scan state, serialized to the report schema on output."""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+# Live-host fields in report order; any other key of a record is kept in ``extra``.
+LIVE_HOST_FIELDS = (
+    "subdomain",
+    "ip",
+    "status_code",
+    "protocol",
+    "title",
+    "server",
+    "technology",
+    "favicon",
+    "canonical_url",
+    "response_time",
+    "content_length",
+    "declared_length",
+    "body_bytes_read",
+    "body_truncated",
+    "etag",
+    "last_modified",
+    "ssl_cert",
+    "open_ports",
+    "nmap",
+)
+_FIELD_SET = frozenset(LIVE_HOST_FIELDS)
+# Low-cardinality values shared by many hosts.
+_INTERNED = frozenset(("ip", "protocol", "server"))
+
+_MISSING = object()
+
+
+class LiveHost:
+    """One live host with a slot per report field instead of a per-host dict.
+
+    Repeated strings (addresses, protocol, server, technology names) are interned and
+    ``technology`` is a tuple. Reads and writes by key (``host["ip"]``, ``host.get``)
+    behave like the report dict, except that ``technology`` reads back as a tuple;
+    ``to_dict`` produces the report record with fields that were never set left out.
+    """
+
+    __slots__ = LIVE_HOST_FIELDS + ("extra",)
+
+    def __init__(self) -> None:
+        for name in LIVE_HOST_FIELDS:
+            setattr(self, name, _MISSING)
+        self.extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, record: Mapping[str, Any]) -> "LiveHost":
+        host = cls()
+        for key, value in record.items():
+            host[key] = value
+        return host
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _FIELD_SET:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+            return
+        if key in _INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+        elif key == "technology" and value is not None:
+            value = tuple(sys.intern(item) if isinstance(item, str) else item for item in value)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        return self.extra.get(key, default) if self.extra is not None else default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def to_dict(self) -> Dict[str, Any]:
+        record: Dict[str, Any] = {}
+        for name in LIVE_HOST_FIELDS:
+            value = getattr(self, name)
+            if value is _MISSING:
+                continue
+            record[name] = list(value) if name == "technology" and value is not None else value
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+
+class CandidateSet:
+    """Set of ``(name, ip)`` candidates stored as a name -> address mapping.
+
+    A name's first address lives in one dict, so no tuple is kept per candidate; the
+    rare further addresses of the same name go to an overflow map. Addresses are
+    interned, so every name behind one IP shares a single string. Iterating yields
+    ``(name, ip)`` tuples as the report expects.
+    """
+
+    def __init__(self, candidates: Iterable[Tuple[str, str]] = ()) -> None:
+        self._first: Dict[str, str] = {}
+        self._more: Dict[str, Set[str]] = {}
+        self._size = 0
+        for candidate in candidates:
+            self.add(candidate)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, candidate: object) -> bool:
+        if not isinstance(candidate, tuple) or len(candidate) != 2:
+            return False
+        name, ip = candidate
+        first = self._first.get(name)
+        return first is not None and (first == ip or ip in self._more.get(name, ()))
+
+    def add(self, candidate: Tuple[str, str]) -> None:
+        if candidate in self:
+            return
+        name, ip = candidate
+        ip = sys.intern(ip)
+        if name in self._first:
+            self._more.setdefault(name, set()).add(ip)
+        else:
+            self._first[name] = ip
+        self._size += 1
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for name, ip in self._first.items():
+            yield name, ip
+            for extra in self._more.get(name, ()):
+                yield name, extra
+
+    def sorted_pairs(self) -> List[Tuple[str, str]]:
+        """Candidates sorted by name, the layout of the report's ``subdomains``."""
+        return sorted(self, key=lambda candidate: candidate[0])
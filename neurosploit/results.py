@@ -0,0 +1,99 @@
+"""Incrementally maintained, sorted table of live hosts across scans."""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+RowKey = Tuple[str, str]
+
+
+def result_row(target: str, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one live-host record into the display row of the results table."""
+    return {
+        "target": target,
+        "subdomain": str(record.get("subdomain") or "-"),
+        "ip": str(record.get("ip") or "-"),
+        "status_code": int(record.get("status_code", 0) or 0),
+        "protocol": str(record.get("protocol") or "-"),
+        "server": str(record.get("server") or "-"),
+        "technology": ", ".join(record.get("technology", [])[:3]) if record.get("technology") else "-",
+        "ports": ", ".join(str(p) for p in record.get("open_ports", [])) if record.get("open_ports") else "-",
+    }
+
+
+class ResultsModel:
+    """Rows keyed by ``(target, subdomain)`` with a sort index kept up to date on every change.
+
+    Inserting or updating a row costs a binary search plus one list insertion, so rows
+    can be applied as scans produce them. Reversing the order only changes how
+    positions are read; only picking a different sort column re-sorts everything.
+    ``version`` increases whenever the visible content changes.
+    """
+
+    def __init__(self, sort_column: str = "status_code", reverse: bool = False):
+        self.sort_column = sort_column
+        self.reverse = reverse
+        self.version = 0
+        self._rows: Dict[RowKey, Dict[str, Any]] = {}
+        self._by_target: Dict[str, Set[RowKey]] = {}
+        self._order: List[Tuple[Any, RowKey]] = []
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _entry(self, key: RowKey, row: Dict[str, Any]) -> Tuple[Any, RowKey]:
+        return row.get(self.sort_column, ""), key
+
+    def upsert(self, target: str, record: Dict[str, Any]) -> bool:
+        """Insert or update the row of ``record``; return whether anything changed."""
+        row = result_row(target, record)
+        key = (target, row["subdomain"])
+        previous = self._rows.get(key)
+        if previous == row:
+            return False
+        if previous is not None:
+            self._unindex(key, previous)
+        self._rows[key] = row
+        self._by_target.setdefault(target, set()).add(key)
+        insort(self._order, self._entry(key, row))
+        self.version += 1
+        return True
+
+    def replace_target(self, target: str, records: Iterable[Dict[str, Any]]) -> None:
+        """Make ``target``'s rows match ``records``, touching only rows that differ."""
+        keep: Set[RowKey] = set()
+        for record in records:
+            self.upsert(target, record)
+            keep.add((target, str(record.get("subdomain") or "-")))
+        for key in self._by_target.get(target, set()) - keep:
+            self.remove(key)
+
+    def remove(self, key: RowKey) -> None:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        self._unindex(key, row)
+        keys = self._by_target[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._by_target[key[0]]
+        self.version += 1
+
+    def _unindex(self, key: RowKey, row: Dict[str, Any]) -> None:
+        del self._order[bisect_left(self._order, self._entry(key, row))]
+
+    def sort(self, column: str, reverse: bool) -> None:
+        if column != self.sort_column:
+            self.sort_column = column
+            self._order = sorted(self._entry(key, row) for key, row in self._rows.items())
+        self.reverse = reverse
+        self.version += 1
+
+    def row_at(self, index: int) -> Dict[str, Any]:
+        """Row at display position ``index`` under the current sort."""
+        _, key = self._order[len(self._order) - 1 - index if self.reverse else index]
+        return self._rows[key]
+
+    def window(self, start: int, count: int) -> List[Dict[str, Any]]:
+        """Rows at display positions ``start`` to ``start + count``; only these are ever rendered."""
+        stop = min(len(self._order), start + count)
+        return [self.row_at(index) for index in range(max(0, start), stop)]
@@ -4,17 +4,26 @@ from collections import deque
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from rich import box
+from rich.cells import set_cell_size
+from rich.console import RenderableType
+from rich.errors import MarkupError
+from rich.segment import Segment
+from rich.style import Style
 from rich.syntax import Syntax
 from rich.table import Table
+from rich.text import Text
 from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
+from textual.geometry import Size
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.widget import Widget
 from textual.widgets import (
     Button,
@@ -24,7 +33,6 @@ from textual.widgets import (
     Label,
     ListItem,
     ListView,
-    RichLog,
     Static,
     TabbedContent,
     TabPane,
@@ -36,6 +44,10 @@ except ImportError:  # pragma: no cover - compatibility fallback
     from textual.work import work  # type: ignore
 
 from .core import ScanConfig, export_report, run_enhanced_recon_async
+from .journal import default_journal_path
+from .logstore import LEVELS, LogEntry, LogStore
+from .metrics import MetricsCollector
+from .results import ResultsModel
 from .targets import is_valid_domain, normalize_domain
 
 
@@ -155,6 +167,63 @@ def block_sparkline(values: List[float], width: int = 18) -> str:
     return "".join(chars)
 
 
+class History(deque):
+    """Fixed-length series behind a sparkline; ``version`` changes only when its contents do."""
+
+    def __init__(self, values: Iterable[float], maxlen: int) -> None:
+        super().__init__(values, maxlen)
+        self.version = 0
+        # Length of the trailing run of equal values.
+        self._run = 0
+        for value in reversed(self):
+            if value != self[-1]:
+                break
+            self._run += 1
+
+    def append(self, value: float) -> None:
+        same = bool(self) and value == self[-1]
+        self._run = self._run + 1 if same else 1
+        # Appending to a full series of identical values leaves it unchanged.
+        if self._run <= (self.maxlen or 0):
+            self.version += 1
+        super().append(value)
+
+
+class TaskCounters:
+    """Status counts and summed progress of scan tasks, adjusted on each state transition."""
+
+    def __init__(self) -> None:
+        self.by_status: Dict[str, int] = {}
+        self._ratio_sum = 0.0
+        self._ratios = 0
+
+    @staticmethod
+    def _ratio(state: Dict[str, Any]) -> Optional[float]:
+        total = int(state.get("total", 0))
+        return int(state.get("current", 0)) / total if total > 0 else None
+
+    def _apply(self, state: Dict[str, Any], sign: int) -> None:
+        status = str(state.get("status", "-"))
+        self.by_status[status] = self.by_status.get(status, 0) + sign
+        ratio = self._ratio(state)
+        if ratio is not None:
+            self._ratio_sum += sign * ratio
+            self._ratios += sign
+
+    def replace(self, previous: Optional[Dict[str, Any]], state: Dict[str, Any]) -> None:
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(state, 1)
+
+    def count(self, status: str) -> int:
+        return self.by_status.get(status, 0)
+
+    @property
+    def progress(self) -> float:
+        """Mean completion of the tasks that report a total."""
+        return max(0.0, min(1.0, self._ratio_sum / self._ratios)) if self._ratios else 0.0
+
+
 class ScanLog(Message):
     def __init__(self, target: str, text: str) -> None:
         super().__init__()
@@ -180,6 +249,286 @@ class ScanFinished(Message):
         self.error = error
 
 
+class ScanRecord(Message):
+    def __init__(self, target: str, record: Dict[str, Any]) -> None:
+        self.target = target
+        self.record = record
+        super().__init__()
+
+
+class ResultsTable(ScrollView, can_focus=True):
+    """Results table over a :class:`ResultsModel` that only renders the rows in view.
+
+    Unlike ``DataTable`` it holds no copy of the rows, so applying a change to the
+    model and calling ``sync`` costs the same with ten rows or a hundred thousand.
+    """
+
+    COLUMNS = [
+        ("target", "Target", 22),
+        ("subdomain", "Subdomain", 34),
+        ("ip", "IP", 16),
+        ("status_code", "Status", 7),
+        ("protocol", "Proto", 6),
+        ("server", "Server", 18),
+        ("technology", "Tech", 26),
+        ("ports", "Ports", 18),
+    ]
+
+    BINDINGS = [
+        Binding("up", "cursor(-1)", show=False),
+        Binding("down", "cursor(1)", show=False),
+        Binding("pageup", "page(-1)", show=False),
+        Binding("pagedown", "page(1)", show=False),
+        Binding("home", "jump(0)", show=False),
+        Binding("end", "jump(-1)", show=False),
+    ]
+
+    HEADER_STYLE = Style(color="#66d9ef", bold=True)
+    ROW_STYLES = (Style(color="#f8f8f2"), Style(color="#f8f8f2", bgcolor="#1a2040"))
+    CURSOR_STYLE = Style(color="#121731", bgcolor="#66d9ef", bold=True)
+
+    class HeaderSelected(Message):
+        def __init__(self, table: "ResultsTable", column_key: str) -> None:
+            self.table = table
+            self.column_key = column_key
+            super().__init__()
+
+    def __init__(self, model: ResultsModel, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.model = model
+        self.cursor_row = 0
+        self._synced_version = -1
+        self._line_width = sum(width + 1 for _, _, width in self.COLUMNS)
+
+    def on_mount(self) -> None:
+        super().on_mount()
+        self.sync()
+
+    def sync(self) -> None:
+        """Pick up model changes; does nothing if the model is unchanged."""
+        if self._synced_version == self.model.version:
+            return
+        self._synced_version = self.model.version
+        self.cursor_row = min(self.cursor_row, max(0, len(self.model) - 1))
+        self.virtual_size = Size(self._line_width, len(self.model) + 1)
+        self.refresh()
+
+    def _strip(self, values: List[str], style: Style) -> Strip:
+        text = "".join(set_cell_size(value, width) + " " for value, (_, _, width) in zip(values, self.COLUMNS))
+        return Strip([Segment(text, style)], self._line_width)
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        if y == 0:
+            arrow = " ▼" if self.model.reverse else " ▲"
+            labels = [label + (arrow if key == self.model.sort_column else "") for key, label, _ in self.COLUMNS]
+            strip = self._strip(labels, self.HEADER_STYLE)
+        else:
+            index = scroll_y + y - 1
+            if index >= len(self.model):
+                return Strip.blank(self.size.width, self.rich_style)
+            row = self.model.row_at(index)
+            style = self.CURSOR_STYLE if index == self.cursor_row else self.ROW_STYLES[index % 2]
+            strip = self._strip([str(row[key]) for key, _, _ in self.COLUMNS], style)
+        return strip.crop_extend(scroll_x, scroll_x + self.size.width, self.rich_style)
+
+    def on_click(self, event: events.Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        if offset.y == 0:
+            x = offset.x + self.scroll_offset.x
+            for key, _, width in self.COLUMNS:
+                if x <= width:
+                    self.post_message(self.HeaderSelected(self, key))
+                    return
+                x -= width + 1
+            return
+        self._move_to(self.scroll_offset.y + offset.y - 1)
+
+    def _move_to(self, index: int) -> None:
+        if not len(self.model):
+            return
+        self.cursor_row = max(0, min(len(self.model) - 1, index))
+        visible = max(1, self.scrollable_content_region.height - 1)
+        top = self.scroll_offset.y
+        if self.cursor_row < top:
+            self.scroll_to(y=self.cursor_row, animate=False, force=True)
+        elif self.cursor_row >= top + visible:
+            self.scroll_to(y=self.cursor_row - visible + 1, animate=False, force=True)
+        self.refresh()
+
+    def action_cursor(self, delta: int) -> None:
+        self._move_to(self.cursor_row + delta)
+
+    def action_page(self, direction: int) -> None:
+        self._move_to(self.cursor_row + direction * max(1, self.scrollable_content_region.height - 1))
+
+    def action_jump(self, index: int) -> None:
+        self._move_to(index if index >= 0 else len(self.model) - 1)
+
+
+class LogView(ScrollView, can_focus=True):
+    """Virtualized view over a :class:`LogStore`, filtered to ``min_level`` and above.
+
+    Every entry takes one line. Enter or a click expands the selected entry: long lines
+    wrap, and entries carrying a detail (JSON payloads, summary tables) render it below.
+    Details are only rendered while expanded, and JSON is highlighted one line at a time
+    as it scrolls into view, so even a huge payload opens instantly.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor(-1)", show=False),
+        Binding("down", "cursor(1)", show=False),
+        Binding("pageup", "page(-1)", show=False),
+        Binding("pagedown", "page(1)", show=False),
+        Binding("home", "jump(0)", show=False),
+        Binding("end", "jump(-1)", show=False),
+        Binding("enter", "toggle", "Expand", show=False),
+    ]
+
+    LEVEL_COLORS = {"debug": "#6f7aa8", "info": "#66d9ef", "warning": "#ffd866", "error": "#ff6188"}
+    CURSOR_STYLE = Style(bgcolor="#1a2040")
+
+    def __init__(self, store: LogStore, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.store = store
+        self.min_level = "debug"
+        self.cursor = 0
+        self._entries: List[LogEntry] = []
+        # (entry index, line of its expansion or -1 for the collapsed line) per visible line.
+        self._lines: List[tuple[int, int]] = []
+        self._first_line: List[int] = []
+        # Expanded entries' lines; JSON source lines are replaced by strips once drawn.
+        self._expansions: Dict[int, tuple[int, List[Union[Strip, str]]]] = {}
+        self._json = Syntax("", "json")
+        self._synced: Optional[tuple[int, str, int]] = None
+
+    def on_mount(self) -> None:
+        super().on_mount()
+        self.sync()
+
+    def on_resize(self, event: events.Resize) -> None:
+        self.sync()
+
+    def set_min_level(self, level: str) -> None:
+        self.min_level = level
+        self.sync()
+
+    def sync(self) -> None:
+        """Pick up store changes; does nothing if the store, filter and width are unchanged."""
+        width = self._width()
+        state = (self.store.version, self.min_level, width)
+        if state == self._synced:
+            return
+        self._synced = state
+        following = self.scroll_offset.y >= self.max_scroll_y
+        self._entries = list(self.store.entries(self.min_level))
+        self._lines = []
+        self._first_line = []
+        expanded = set()
+        for index, entry in enumerate(self._entries):
+            self._first_line.append(len(self._lines))
+            if entry.expanded:
+                expanded.add(entry.seq)
+                self._lines.extend((index, part) for part in range(len(self._expansion(entry, width))))
+            else:
+                self._lines.append((index, -1))
+        self._expansions = {seq: lines for seq, lines in self._expansions.items() if seq in expanded}
+        self.cursor = min(self.cursor, max(0, len(self._entries) - 1))
+        self.virtual_size = Size(width, len(self._lines))
+        if following:
+            self.scroll_end(animate=False, force=True, immediate=True)
+        self.refresh()
+
+    def _width(self) -> int:
+        return max(1, self.scrollable_content_region.width)
+
+    def _text(self, entry: LogEntry) -> Text:
+        marker = "" if entry.detail is None else ("▾ " if entry.expanded else "▸ ")
+        color = self.LEVEL_COLORS.get(entry.level, "#66d9ef")
+        try:
+            body = Text.from_markup(entry.text)
+        except MarkupError:
+            body = Text(entry.text)
+        return Text.assemble((f"{entry.source:<10} ", color), marker, body)
+
+    def _expansion(self, entry: LogEntry, width: int) -> List[Union[Strip, str]]:
+        cached = self._expansions.get(entry.seq)
+        if cached is not None and cached[0] == width:
+            return cached[1]
+        console = self.app.console
+        options = console.options.update_width(width)
+        renderables: List[RenderableType] = [self._text(entry)]
+        if entry.detail is not None and not isinstance(entry.detail, (dict, list)):
+            renderables.append(entry.detail)
+        lines: List[Union[Strip, str]] = [
+            Strip(line) for renderable in renderables for line in console.render_lines(renderable, options, pad=False)
+        ]
+        if isinstance(entry.detail, (dict, list)):
+            lines.extend(json.dumps(entry.detail, indent=2, default=str).splitlines())
+        self._expansions[entry.seq] = (width, lines)
+        return lines
+
+    def render_line(self, y: int) -> Strip:
+        line = self.scroll_offset.y + y
+        if line >= len(self._lines):
+            return Strip.blank(self.size.width, self.rich_style)
+        index, part = self._lines[line]
+        entry = self._entries[index]
+        if part < 0:
+            strip = Strip(self._text(entry).render(self.app.console))
+        else:
+            lines = self._expansion(entry, self._width())
+            strip = lines[part]
+            if isinstance(strip, str):
+                text = self._json.highlight(strip)
+                text.rstrip()
+                strip = lines[part] = Strip(text.render(self.app.console))
+        if index == self.cursor and self.has_focus:
+            strip = strip.apply_style(self.CURSOR_STYLE)
+        return strip.crop_extend(0, self.size.width, self.rich_style)
+
+    def on_click(self, event: events.Click) -> None:
+        offset = event.get_content_offset(self)
+        line = None if offset is None else self.scroll_offset.y + offset.y
+        if line is None or line >= len(self._lines):
+            return
+        self.cursor = self._lines[line][0]
+        self.action_toggle()
+
+    def _move_to(self, index: int) -> None:
+        if not self._entries:
+            return
+        self.cursor = max(0, min(len(self._entries) - 1, index))
+        first = self._first_line[self.cursor]
+        visible = max(1, self.scrollable_content_region.height)
+        top = self.scroll_offset.y
+        if first < top:
+            self.scroll_to(y=first, animate=False, force=True)
+        elif first >= top + visible:
+            self.scroll_to(y=first - visible + 1, animate=False, force=True)
+        self.refresh()
+
+    def action_cursor(self, delta: int) -> None:
+        self._move_to(self.cursor + delta)
+
+    def action_page(self, direction: int) -> None:
+        self._move_to(self.cursor + direction * max(1, self.scrollable_content_region.height))
+
+    def action_jump(self, index: int) -> None:
+        self._move_to(index if index >= 0 else len(self._entries) - 1)
+
+    def action_toggle(self) -> None:
+        if not self._entries:
+            return
+        entry = self._entries[self.cursor]
+        entry.expanded = not entry.expanded
+        self.store.touch()
+        self.sync()
+        self._move_to(self.cursor)
+
+
 class AddTargetModal(ModalScreen[Optional[str]]):
     BINDINGS = [Binding("escape", "cancel", "Cancel")]
 
@@ -279,6 +628,10 @@ class NeuroSploitTUI(App[None]):
 
     MIN_WIDTH = 110
     MIN_HEIGHT = 34
+    # Log entries kept in memory; older ones are dropped. Change at runtime with :loglimit.
+    LOG_CAPACITY = 5000
+    # Task table and status bar redraws per second, however fast progress arrives.
+    RENDER_FPS = 10
 
     INTENSITY_PRESETS: Dict[str, Dict[str, int]] = {
         "low": {"max_concurrency": 20, "timeout": 8},
@@ -301,19 +654,26 @@ class NeuroSploitTUI(App[None]):
         self.targets: List[str] = self._load_targets_from_file()
         self.scan_config = ScanConfig()
         self.scan_intensity = "medium"
+        # Off by default: journaled scans are resumed from ~/.cache the next time they run.
+        self.journal_scans = False
         self.ui_theme = "monokai"
 
         self.reports: Dict[str, Dict[str, Any]] = {}
         self.tasks: Dict[str, Dict[str, Any]] = {}
-        self.result_rows: List[Dict[str, Any]] = []
-
-        self.sort_column = "status_code"
-        self.sort_reverse = False
-
-        self.ports_history: Deque[float] = deque([0.0] * 64, maxlen=160)
-        self.latency_history: Deque[float] = deque([0.0] * 64, maxlen=160)
-        self.progress_history: Deque[float] = deque([0.0] * 64, maxlen=160)
+        self.scan_metrics: Dict[str, MetricsCollector] = {}
+        self.results = ResultsModel(sort_column="status_code")
+        self.logs = LogStore(self.LOG_CAPACITY)
+
+        self.task_counters = TaskCounters()
+        self.ports_history = History([0.0] * 64, maxlen=160)
+        self.latency_history = History([0.0] * 64, maxlen=160)
+        self.progress_history = History([0.0] * 64, maxlen=160)
+        # Last render key per dashboard widget; a widget is only redrawn when its key changes.
+        self._render_keys: Dict[str, Any] = {}
         self.layout_profile = ""
+        # Progress events only update state; ``_render_frame`` draws it.
+        self._tasks_dirty = False
+        self._pending_status: Optional[str] = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -348,7 +708,7 @@ class NeuroSploitTUI(App[None]):
                 with Container(id="results-panel", classes="card panel"):
                     yield Static(id="results-title", classes="panel-title")
                     yield Static(id="results-graph", classes="graph-line")
-                    yield DataTable(id="results-view", zebra_stripes=True)
+                    yield ResultsTable(self.results, id="results-view")
 
                 with Container(id="tasks-panel", classes="card panel"):
                     yield Static(id="tasks-title", classes="panel-title")
@@ -367,7 +727,7 @@ class NeuroSploitTUI(App[None]):
                 with Container(id="logs-panel", classes="card panel"):
                     yield Static(id="logs-title", classes="panel-title")
                     yield Static(id="quote-blurb")
-                    yield RichLog(id="log-view", highlight=True, markup=True, wrap=True)
+                    yield LogView(self.logs, id="log-view")
                     with Horizontal(classes="panel-actions"):
                         yield Button("Clear Logs", id="btn-clear-logs", classes="panel-btn")
 
@@ -408,21 +768,11 @@ class NeuroSploitTUI(App[None]):
             self.query_one("#target-list", ListView).index = 0
 
         self.set_interval(0.5, self._refresh_stats_panel)
+        self.set_interval(1 / self.RENDER_FPS, self._render_frame)
         self._set_status("Ready. [S]can selected target or [A]dd new domain.")
         self._log("system", "[bold #89ffb5]NeuroSploit btop UI online[/]")
 
     def _init_tables(self) -> None:
-        results = self.query_one("#results-view", DataTable)
-        results.add_column("Target", key="target")
-        results.add_column("Subdomain", key="subdomain")
-        results.add_column("IP", key="ip")
-        results.add_column("Status", key="status_code")
-        results.add_column("Proto", key="protocol")
-        results.add_column("Server", key="server")
-        results.add_column("Tech", key="technology")
-        results.add_column("Ports", key="ports")
-        results.cursor_type = "row"
-
         tasks = self.query_one("#task-view", DataTable)
         tasks.add_column("Target", key="target")
         tasks.add_column("Phase", key="phase")
@@ -528,51 +878,19 @@ class NeuroSploitTUI(App[None]):
         stamp = datetime.now().strftime("%H:%M:%S")
         self.query_one("#status-bar", Static).update(f"[{stamp}] {text}")
 
-    def _log(self, source: str, text: str) -> None:
-        self.query_one("#log-view", RichLog).write(f"[#66d9ef]{source:<10}[/] {text}")
+    def _log(self, source: str, text: str, level: Optional[str] = None) -> None:
+        self.logs.append(source, text, level)
 
     def _log_json(self, source: str, payload: Dict[str, Any]) -> None:
-        syntax = Syntax(json.dumps(payload, indent=2, default=str), "json", word_wrap=True)
-        log = self.query_one("#log-view", RichLog)
-        log.write(f"[#66d9ef]{source:<10}[/] [bold #a6e22e]summary[/]")
-        log.write(syntax)
-
-    def _flatten_results(self) -> List[Dict[str, Any]]:
-        rows: List[Dict[str, Any]] = []
-        for target, report in self.reports.items():
-            for sub in report.get("live_subdomains", []):
-                rows.append(
-                    {
-                        "target": target,
-                        "subdomain": sub.get("subdomain", "-"),
-                        "ip": sub.get("ip", "-"),
-                        "status_code": int(sub.get("status_code", 0) or 0),
-                        "protocol": sub.get("protocol", "-"),
-                        "server": sub.get("server", "-"),
-                        "technology": ", ".join(sub.get("technology", [])[:3]) if sub.get("technology") else "-",
-                        "ports": ", ".join(str(p) for p in sub.get("open_ports", [])) if sub.get("open_ports") else "-",
-                    }
-                )
-
-        if self.sort_column:
-            rows.sort(key=lambda row: row.get(self.sort_column, ""), reverse=self.sort_reverse)
-        return rows
+        # Kept collapsed: the JSON is only formatted if the entry is expanded.
+        self.logs.append(source, "[bold #a6e22e]summary[/]", "info", detail=payload)
 
     def _refresh_results_table(self) -> None:
-        self.result_rows = self._flatten_results()
-        table = self.query_one("#results-view", DataTable)
-        table.clear(columns=False)
-        for row in self.result_rows:
-            table.add_row(
-                row["target"],
-                row["subdomain"],
-                row["ip"],
-                str(row["status_code"]),
-                row["protocol"],
-                row["server"],
-                row["technology"],
-                row["ports"],
-            )
+        self.query_one("#results-view", ResultsTable).sync()
+
+    def _set_task(self, target: str, state: Dict[str, Any]) -> None:
+        self.task_counters.replace(self.tasks.get(target), state)
+        self.tasks[target] = state
 
     def _refresh_tasks_table(self) -> None:
         table = self.query_one("#task-view", DataTable)
@@ -598,18 +916,30 @@ class NeuroSploitTUI(App[None]):
             return fallback
         return max(16, min(90, width - 4 if width > 6 else fallback))
 
+    PHASE_LABELS = {"ct_logs": "ct", "dns_revalidate": "reval", "dns_bruteforce": "dns", "http_probe": "probe", "deep_analysis": "deep"}
+
+    def _phase_metrics_markup(self, target: Optional[str]) -> str:
+        collector = self.scan_metrics.get(target) if target else None
+        if collector is None:
+            return ""
+        lines: List[str] = []
+        for name, phase in collector.snapshot()["phases"].items():
+            latency = phase["latency"]
+            marker = "[#a6e22e]●[/]" if phase["running"] else "[#75715e]○[/]"
+            lines.append(
+                f"{marker} [#66d9ef]{self.PHASE_LABELS.get(name, name):<5}[/] "
+                f"[#f8f8f2]{phase['items']:>6,}[/] [#9ea6cc]@ {phase['items_per_second']:>7,.0f}/s[/]  "
+                f"[#9ea6cc]p50[/] {latency['p50_ms']:.0f}ms [#9ea6cc]p95[/] {latency['p95_ms']:.0f}ms  "
+                f"[#9ea6cc]wait[/] {phase['queue_wait']['p95_ms']:.0f}ms  "
+                f"[#ff6188]{phase['timeouts']} t/o[/] [#ffd866]{phase['errors']} err[/]"
+            )
+        return "\n" + "\n".join(lines) if lines else ""
+
     def _refresh_stats_panel(self) -> None:
-        active = sum(1 for item in self.tasks.values() if item.get("status") == "running")
-        done = sum(1 for item in self.tasks.values() if item.get("status") == "done")
-        failed = sum(1 for item in self.tasks.values() if item.get("status") == "failed")
-
-        percents: List[float] = []
-        for item in self.tasks.values():
-            total = int(item.get("total", 0))
-            current = int(item.get("current", 0))
-            if total > 0:
-                percents.append(current / total)
-        progress = sum(percents) / len(percents) if percents else 0.0
+        active = self.task_counters.count("running")
+        done = self.task_counters.count("done")
+        failed = self.task_counters.count("failed")
+        progress = self.task_counters.progress
 
         self.progress_history.append(progress * 100)
 
@@ -622,7 +952,6 @@ class NeuroSploitTUI(App[None]):
         live_hosts = int(report.get("live_subdomains_count", 0)) if report else 0
         issues = len(report.get("summary", {}).get("security_issues", [])) if report else 0
 
-        bar = gradient_bar(progress, width=34)
         stats_markup = (
             f"[bold #f8f8f2]Theme:[/] [#ffd866]{self.ui_theme}[/]   "
             f"[bold #f8f8f2]Intensity:[/] [#ffd866]{self.scan_intensity}[/]   "
@@ -630,47 +959,73 @@ class NeuroSploitTUI(App[None]):
             f"[bold #f8f8f2]Active:[/] [#66d9ef]{active}[/]   "
             f"[bold #f8f8f2]Done:[/] [#a6e22e]{done}[/]   "
             f"[bold #f8f8f2]Failed:[/] [#ff6188]{failed}[/]"
+            f"{self._phase_metrics_markup(selected)}"
         )
-        self.query_one("#stats-body", Static).update(stats_markup)
-        self.query_one("#finance-grid", Static).update(
+        self._update_static("#stats-body", stats_markup)
+        self._update_static(
+            "#finance-grid",
             f"[#9ea6cc]Ending Cash Balance[/]      [#9ea6cc]Current Runway[/]\n"
             f"[bold #5fffb4]{total_subdomains:,} subdomains[/]          [bold #ff79c6]{live_hosts} live hosts[/]\n"
             f"[#9ea6cc]Net Burn[/]                 [#9ea6cc]Risk Flags[/]\n"
-            f"[bold #5fffb4]{done - failed:+d} completed[/]              [bold #ffd866]{issues} findings[/]"
+            f"[bold #5fffb4]{done - failed:+d} completed[/]              [bold #ffd866]{issues} findings[/]",
         )
-        self.query_one("#company-form", Static).update(
+        self._update_static(
+            "#company-form",
             f"[#9ea6cc]Company Name[/]\\n[bold #d8dcff]{selected or 'Acme Inc'}[/]\\n\\n"
             f"[#9ea6cc]Legal Entity[/]\\n[bold #d8dcff]C Corp[/]\\n\\n"
             f"[#9ea6cc]Industry[/]\\n[bold #d8dcff]B2B / SaaS[/]\\n\\n"
-            f"[#9ea6cc]Saved Targets[/] [bold #66d9ef]{len(self.targets)}[/]"
+            f"[#9ea6cc]Saved Targets[/] [bold #66d9ef]{len(self.targets)}[/]",
         )
 
-        ports_graph = braille_sparkline(list(self.ports_history), width=self._graph_width("#ports-graph"))
-        latency_graph = braille_sparkline(list(self.latency_history), width=self._graph_width("#latency-graph"))
-        results_graph = braille_sparkline(list(self.progress_history), width=self._graph_width("#results-graph", 50))
-        revenue_graph = block_sparkline(list(self.ports_history), width=self._graph_width("#revenue-graph", 20))
-
-        self.query_one("#ports-graph", Static).update(
-            f"[bold #72f1b8]Ports Found Over Time[/]\n{gradient_text(ports_graph, '#66d9ef', '#a6e22e')}"
+        # Sparklines and gradients are only rebuilt when their series or width changed.
+        ports_width = self._graph_width("#ports-graph")
+        self._update_static(
+            "#ports-graph",
+            (self.ports_history.version, ports_width),
+            lambda: f"[bold #72f1b8]Ports Found Over Time[/]\n"
+            f"{gradient_text(braille_sparkline(list(self.ports_history), width=ports_width), '#66d9ef', '#a6e22e')}",
         )
-        self.query_one("#latency-graph", Static).update(
-            f"[bold #ffb86c]Latency (ms) Over Time[/]\n{gradient_text(latency_graph, '#66d9ef', '#ff79c6')}"
+        latency_width = self._graph_width("#latency-graph")
+        self._update_static(
+            "#latency-graph",
+            (self.latency_history.version, latency_width),
+            lambda: f"[bold #ffb86c]Latency (ms) Over Time[/]\n"
+            f"{gradient_text(braille_sparkline(list(self.latency_history), width=latency_width), '#66d9ef', '#ff79c6')}",
         )
-        self.query_one("#results-graph", Static).update(
-            f"[bold #9ee8ff]Runway Burn Rate[/]\n{gradient_text(results_graph, '#f4d35e', '#5fffb4')}\n"
-            f"[#9ea6cc]Pipeline:[/] {bar} [#f8f8f2]{int(progress * 100)}%[/]"
+        results_width = self._graph_width("#results-graph", 50)
+        percent = int(progress * 100)
+        self._update_static(
+            "#results-graph",
+            (self.progress_history.version, results_width, percent),
+            lambda: f"[bold #9ee8ff]Runway Burn Rate[/]\n"
+            f"{gradient_text(braille_sparkline(list(self.progress_history), width=results_width), '#f4d35e', '#5fffb4')}\n"
+            f"[#9ea6cc]Pipeline:[/] {gradient_bar(progress, width=34)} [#f8f8f2]{percent}%[/]",
         )
-        self.query_one("#revenue-graph", Static).update(
-            f"[bold #8fe7ff]{revenue_graph}[/]\n[#9ea6cc]Real-time key metrics[/]"
+        revenue_width = self._graph_width("#revenue-graph", 20)
+        self._update_static(
+            "#revenue-graph",
+            (self.ports_history.version, revenue_width),
+            lambda: f"[bold #8fe7ff]{block_sparkline(list(self.ports_history), width=revenue_width)}[/]\n"
+            f"[#9ea6cc]Real-time key metrics[/]",
         )
-        self.query_one("#instant-body", Static).update(
+        self._update_static(
+            "#instant-body",
             f"[#8fe7ff]◉[/] [bold #f8f8f2]{(live_hosts * 7) or 0}%[/] of dollar volume\\n"
-            f"[#b987ff]◉[/] [bold #f8f8f2]{(100 - min(99, issues * 9)) if live_hosts else 0}%[/] finalized"
+            f"[#b987ff]◉[/] [bold #f8f8f2]{(100 - min(99, issues * 9)) if live_hosts else 0}%[/] finalized",
         )
-        self.query_one("#compare-graph", Static).update(
-            f"[bold #72f1b8]{block_sparkline(list(self.ports_history), width=26)}[/]"
+        self._update_static(
+            "#compare-graph",
+            self.ports_history.version,
+            lambda: f"[bold #72f1b8]{block_sparkline(list(self.ports_history), width=26)}[/]",
         )
 
+    def _update_static(self, widget_id: str, key: Any, render: Optional[Callable[[], str]] = None) -> None:
+        """Update ``widget_id`` with ``render()`` (or ``key`` itself) unless ``key`` is unchanged."""
+        if self._render_keys.get(widget_id) == key:
+            return
+        self._render_keys[widget_id] = key
+        self.query_one(widget_id, Static).update(render() if render is not None else key)
+
     def _update_history_from_report(self, report: Dict[str, Any]) -> None:
         live = report.get("live_subdomains", [])
         ports_found = sum(len(item.get("open_ports", [])) for item in live if isinstance(item, dict))
@@ -711,13 +1066,13 @@ class NeuroSploitTUI(App[None]):
             self._set_status(f"Scan already running for {target}")
             return
 
-        self.tasks[target] = {
+        self._set_task(target, {
             "phase": "queued",
             "current": 0,
             "total": 0,
             "status": "running",
             "text": "Queued",
-        }
+        })
         self._refresh_tasks_table()
         self._set_status(f"Starting scan for {target}")
         self._run_scan_worker(target)
@@ -732,7 +1087,17 @@ class NeuroSploitTUI(App[None]):
         async def progress_callback(phase: str, current: int, total: int, text: str) -> None:
             self.post_message(ScanProgress(target, phase, current, total, text))
 
+        def record_callback(record: Dict[str, Any]) -> None:
+            if record["type"] in ("live", "enriched"):
+                self.post_message(ScanRecord(target, record))
+
         config_snapshot = ScanConfig(**self.scan_config.to_dict())
+        if self.journal_scans:
+            # A scan cut short by quitting picks up where it stopped the next time it runs.
+            config_snapshot.journal_path = str(default_journal_path(target))
+            config_snapshot.resume = True
+        metrics = MetricsCollector()
+        self.scan_metrics[target] = metrics
 
         try:
             report = await run_enhanced_recon_async(
@@ -740,6 +1105,8 @@ class NeuroSploitTUI(App[None]):
                 config=config_snapshot,
                 log_callback=log_callback,
                 progress_callback=progress_callback,
+                metrics=metrics,
+                record_callback=record_callback,
             )
             self.post_message(ScanFinished(target, report, None))
         except Exception as exc:
@@ -752,7 +1119,7 @@ class NeuroSploitTUI(App[None]):
         summary.add_row("Subdomains", str(report.get("total_subdomains_found", 0)))
         summary.add_row("Live Hosts", str(report.get("live_subdomains_count", 0)))
         summary.add_row("Duration", f"{report.get('duration_seconds', 0)}s")
-        self.query_one("#log-view", RichLog).write(summary)
+        self.logs.append(target, "[bold #a6e22e]scan complete[/]", "info", detail=summary, expanded=True)
         self._log_json(target, report.get("summary", {}))
 
     def _find_panel_id(self, widget: Optional[Widget]) -> Optional[str]:
@@ -784,10 +1151,10 @@ class NeuroSploitTUI(App[None]):
             self.query_one("#task-view", DataTable).focus()
             self._set_status("Tasks panel focused")
         elif panel_id == "results-panel":
-            self.query_one("#results-view", DataTable).focus()
+            self.query_one("#results-view", ResultsTable).focus()
             self._set_status("Results panel focused")
         elif panel_id == "logs-panel":
-            self.query_one("#log-view", RichLog).focus()
+            self.query_one("#log-view", LogView).focus()
             self._set_status("Log panel focused")
         elif panel_id == "stats-panel":
             self._set_status("Metrics panel selected")
@@ -834,7 +1201,7 @@ class NeuroSploitTUI(App[None]):
         self.push_screen(SettingsOverlay(self.ui_theme, self.scan_intensity), self._on_settings_result)
 
     def action_clear_logs(self) -> None:
-        self.query_one("#log-view", RichLog).clear()
+        self.logs.clear()
         self._set_status("Log pane cleared")
 
     def action_export_selected(self) -> None:
@@ -893,8 +1260,8 @@ class NeuroSploitTUI(App[None]):
             self._log(
                 "system",
                 "commands: add <domain>, scan [domain], theme <monokai|dracula>, "
-                "intensity <low|medium|high>, threads <n>, timeout <n>, nmap <on|off>, "
-                "clear, export [domain]",
+                "intensity <low|medium|high>, threads <n>, timeout <n>, nmap <on|off>, journal <on|off>, "
+                "level <debug|info|warning|error>, loglimit <n>, clear, export [domain]",
             )
             return
 
@@ -949,6 +1316,15 @@ class NeuroSploitTUI(App[None]):
                 self._set_status("nmap must be on|off")
             return
 
+        if action == "journal" and args:
+            flag = args[0].lower()
+            if flag in {"on", "off"}:
+                self.journal_scans = flag == "on"
+                self._set_status(f"journaling set to {flag}")
+            else:
+                self._set_status("journal must be on|off")
+            return
+
         if action == "export":
             if args:
                 target = normalize_domain(args[0])
@@ -957,6 +1333,23 @@ class NeuroSploitTUI(App[None]):
             self.action_export_selected()
             return
 
+        if action == "level" and args:
+            level = args[0].lower()
+            if level in LEVELS:
+                self.query_one("#log-view", LogView).set_min_level(level)
+                self._set_status(f"Showing {level} logs and above")
+            else:
+                self._set_status("level must be debug|info|warning|error")
+            return
+
+        if action == "loglimit" and args:
+            try:
+                self.logs.resize(max(100, int(args[0])))
+                self._set_status(f"Keeping the last {self.logs.capacity} log entries")
+            except ValueError:
+                self._set_status("Invalid log limit")
+            return
+
         if action == "clear":
             self.action_clear_logs()
             return
@@ -989,16 +1382,11 @@ class NeuroSploitTUI(App[None]):
         if target:
             self._set_status(f"Selected target: {target}")
 
-    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
-        if event.data_table.id != "results-view":
-            return
-        if event.column_key is None:
-            return
-        self.sort_column = str(event.column_key)
-        self.sort_reverse = not self.sort_reverse
+    def on_results_table_header_selected(self, event: ResultsTable.HeaderSelected) -> None:
+        self.results.sort(event.column_key, not self.results.reverse)
         self._refresh_results_table()
-        direction = "desc" if self.sort_reverse else "asc"
-        self._set_status(f"Sorted results by {self.sort_column} ({direction})")
+        direction = "desc" if self.results.reverse else "asc"
+        self._set_status(f"Sorted results by {self.results.sort_column} ({direction})")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id != "command-input":
@@ -1020,42 +1408,59 @@ class NeuroSploitTUI(App[None]):
         self._log(message.target, message.text)
 
     def on_scan_progress(self, message: ScanProgress) -> None:
-        self.tasks[message.target] = {
+        self._set_task(message.target, {
             "phase": message.phase,
             "current": message.current,
             "total": message.total,
             "status": "running",
             "text": message.text,
-        }
+        })
         if message.total > 0:
             self.progress_history.append((message.current / message.total) * 100)
 
-        self._refresh_tasks_table()
-        self._set_status(f"{message.target}: {message.text}")
+        self._tasks_dirty = True
+        self._pending_status = f"{message.target}: {message.text}"
+
+    def on_scan_record(self, message: ScanRecord) -> None:
+        # Hosts appear as they are found; the next frame draws them.
+        self.results.upsert(message.target, message.record)
+
+    def _render_frame(self) -> None:
+        self._refresh_results_table()
+        self.query_one("#log-view", LogView).sync()
+        if self._tasks_dirty:
+            self._tasks_dirty = False
+            self._refresh_tasks_table()
+        if self._pending_status is not None:
+            self._set_status(self._pending_status)
+            self._pending_status = None
 
     def on_scan_finished(self, message: ScanFinished) -> None:
+        # Progress not yet drawn is superseded by the outcome.
+        self._pending_status = None
         if message.error:
-            self.tasks[message.target] = {
+            self._set_task(message.target, {
                 "phase": "error",
                 "current": 0,
                 "total": 0,
                 "status": "failed",
                 "text": message.error,
-            }
+            })
             self._refresh_tasks_table()
             self._set_status(f"Scan failed for {message.target}")
-            self._log(message.target, f"[bold #ff6188]error:[/] {message.error}")
+            self._log(message.target, f"[bold #ff6188]error:[/] {message.error}", "error")
             return
 
         report = message.report or {}
         self.reports[message.target] = report
-        self.tasks[message.target] = {
+        self.results.replace_target(message.target, report.get("live_subdomains", []))
+        self._set_task(message.target, {
             "phase": "complete",
             "current": 1,
             "total": 1,
             "status": "done",
             "text": "Completed",
-        }
+        })
 
         self._update_history_from_report(report)
         self._refresh_tasks_table()
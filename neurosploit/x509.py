@@ -0,0 +1,219 @@
+"""Minimal DER decoding of X.509 certificates into the ``ssl.getpeercert()`` layout.
+
+``getpeercert()`` only returns parsed fields for verified peers, but the probe runs with
+verification disabled. Decoding the DER form ourselves keeps the report identical to
+what the standard library would produce without a second, verifying handshake.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_SEQUENCE = 0x30
+_SET = 0x31
+_INTEGER = 0x02
+_OCTET_STRING = 0x04
+_OID = 0x06
+_UTC_TIME = 0x17
+_GENERALIZED_TIME = 0x18
+_VERSION = 0xA0
+_EXTENSIONS = 0xA3
+
+_SUBJECT_ALT_NAME = "2.5.29.17"
+
+# OpenSSL long names, as used by ``ssl.getpeercert()``.
+_ATTRIBUTE_NAMES = {
+    "2.5.4.3": "commonName",
+    "2.5.4.4": "surname",
+    "2.5.4.5": "serialNumber",
+    "2.5.4.6": "countryName",
+    "2.5.4.7": "localityName",
+    "2.5.4.8": "stateOrProvinceName",
+    "2.5.4.9": "streetAddress",
+    "2.5.4.10": "organizationName",
+    "2.5.4.11": "organizationalUnitName",
+    "2.5.4.12": "title",
+    "2.5.4.15": "businessCategory",
+    "2.5.4.17": "postalCode",
+    "2.5.4.13": "description",
+    "2.5.4.41": "name",
+    "2.5.4.42": "givenName",
+    "2.5.4.43": "initials",
+    "2.5.4.46": "dnQualifier",
+    "2.5.4.65": "pseudonym",
+    "2.5.4.97": "organizationIdentifier",
+    "1.2.840.113549.1.9.1": "emailAddress",
+    "0.9.2342.19200300.100.1.1": "userId",
+    "0.9.2342.19200300.100.1.25": "domainComponent",
+    "1.3.6.1.4.1.311.60.2.1.1": "jurisdictionLocalityName",
+    "1.3.6.1.4.1.311.60.2.1.2": "jurisdictionStateOrProvinceName",
+    "1.3.6.1.4.1.311.60.2.1.3": "jurisdictionCountryName",
+}
+
+_STRING_CODECS = {
+    0x0C: "utf-8",  # UTF8String
+    0x12: "ascii",  # NumericString
+    0x13: "ascii",  # PrintableString
+    0x14: "latin-1",  # T61String
+    0x16: "ascii",  # IA5String
+    0x1A: "ascii",  # VisibleString
+    0x1C: "utf-32-be",  # UniversalString
+    0x1E: "utf-16-be",  # BMPString
+}
+
+_GENERAL_NAMES = {0x81: "email", 0x82: "DNS", 0x86: "URI", 0x87: "IP Address"}
+
+
+class CertificateError(ValueError):
+    """Raised when certificate bytes are not a well-formed X.509 structure."""
+
+
+def _read(data: bytes, pos: int) -> Tuple[int, bytes, int]:
+    """Return ``(tag, value, next_pos)`` for the DER element starting at ``pos``."""
+    if pos + 2 > len(data):
+        raise CertificateError("truncated DER element")
+    tag = data[pos]
+    length = data[pos + 1]
+    pos += 2
+    if length & 0x80:
+        count = length & 0x7F
+        if not count or count > 4 or pos + count > len(data):
+            raise CertificateError("unsupported DER length")
+        length = int.from_bytes(data[pos:pos + count], "big")
+        pos += count
+    end = pos + length
+    if end > len(data):
+        raise CertificateError("truncated DER element")
+    return tag, data[pos:end], end
+
+
+def _children(data: bytes) -> Iterator[Tuple[int, bytes]]:
+    pos = 0
+    while pos < len(data):
+        tag, value, pos = _read(data, pos)
+        yield tag, value
+
+
+def _expect(element: Tuple[int, bytes], tag: int) -> bytes:
+    if element[0] != tag:
+        raise CertificateError(f"expected DER tag 0x{tag:02x}, got 0x{element[0]:02x}")
+    return element[1]
+
+
+def _oid(value: bytes) -> str:
+    if not value:
+        raise CertificateError("empty OID")
+    arcs = [min(value[0] // 40, 2), value[0] - 40 * min(value[0] // 40, 2)]
+    current = 0
+    for byte in value[1:]:
+        current = (current << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            arcs.append(current)
+            current = 0
+    return ".".join(map(str, arcs))
+
+
+def _string(tag: int, value: bytes) -> str:
+    return value.decode(_STRING_CODECS.get(tag, "latin-1"), errors="replace")
+
+
+def _name(value: bytes) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+    rdns: List[Tuple[Tuple[str, str], ...]] = []
+    for rdn in _children(value):
+        attributes: List[Tuple[str, str]] = []
+        for attribute in _children(_expect(rdn, _SET)):
+            parts = list(_children(_expect(attribute, _SEQUENCE)))
+            if len(parts) != 2:
+                raise CertificateError("malformed name attribute")
+            oid = _oid(_expect(parts[0], _OID))
+            attributes.append((_ATTRIBUTE_NAMES.get(oid, oid), _string(*parts[1])))
+        rdns.append(tuple(attributes))
+    return tuple(rdns)
+
+
+# English month abbreviations as ssl.getpeercert() writes them; %b would follow the locale.
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _time(element: Tuple[int, bytes]) -> str:
+    tag, value = element
+    text = value.decode("ascii", errors="replace").rstrip("Z")
+    if tag == _UTC_TIME:
+        parsed = datetime.strptime(text, "%y%m%d%H%M%S")
+        # RFC 5280: two-digit years 50-99 are 19xx.
+        if parsed.year >= 2050:
+            parsed = parsed.replace(year=parsed.year - 100)
+    elif tag == _GENERALIZED_TIME:
+        parsed = datetime.strptime(text[:14], "%Y%m%d%H%M%S")
+    else:
+        raise CertificateError("unsupported time encoding")
+    return f"{_MONTHS[parsed.month - 1]} {parsed.day:2d} {parsed:%H:%M:%S} {parsed.year} GMT"
+
+
+def _serial(value: bytes) -> str:
+    value = value.lstrip(b"\x00") or b"\x00"
+    return value.hex().upper()
+
+
+def _subject_alt_names(value: bytes) -> Tuple[Tuple[str, str], ...]:
+    names: List[Tuple[str, str]] = []
+    for tag, item in _children(_expect(_read(value, 0)[:2], _SEQUENCE)):
+        kind = _GENERAL_NAMES.get(tag)
+        if kind is None:
+            continue
+        if kind == "IP Address":
+            if len(item) == 4:
+                text = ".".join(str(byte) for byte in item)
+            elif len(item) == 16:
+                # OpenSSL prints every IPv6 group, uncompressed and without leading zeros.
+                text = ":".join(f"{int.from_bytes(item[i:i + 2], 'big'):X}" for i in range(0, 16, 2))
+            else:
+                continue
+        else:
+            text = item.decode("ascii", errors="replace")
+        names.append((kind, text))
+    return tuple(names)
+
+
+def decode_certificate(der: bytes) -> Dict[str, Any]:
+    """Decode a DER certificate into the dictionary layout of ``ssl.getpeercert()``."""
+    certificate = list(_children(_expect(_read(der, 0)[:2], _SEQUENCE)))
+    if not certificate:
+        raise CertificateError("empty certificate")
+    tbs = list(_children(_expect(certificate[0], _SEQUENCE)))
+
+    version = 1
+    if tbs and tbs[0][0] == _VERSION:
+        version = int.from_bytes(_expect(_read(tbs[0][1], 0)[:2], _INTEGER), "big") + 1
+        tbs = tbs[1:]
+    if len(tbs) < 6:
+        raise CertificateError("incomplete TBSCertificate")
+
+    not_before, not_after = list(_children(_expect(tbs[3], _SEQUENCE)))[:2]
+    decoded: Dict[str, Any] = {
+        "subject": _name(_expect(tbs[4], _SEQUENCE)),
+        "issuer": _name(_expect(tbs[2], _SEQUENCE)),
+        "version": version,
+        "serialNumber": _serial(_expect(tbs[0], _INTEGER)),
+        "notBefore": _time(not_before),
+        "notAfter": _time(not_after),
+    }
+
+    for tag, value in tbs[6:]:
+        if tag != _EXTENSIONS:
+            continue
+        for extension in _children(_expect(_read(value, 0)[:2], _SEQUENCE)):
+            parts = list(_children(_expect(extension, _SEQUENCE)))
+            if parts and _oid(_expect(parts[0], _OID)) == _SUBJECT_ALT_NAME:
+                decoded["subjectAltName"] = _subject_alt_names(_expect(parts[-1], _OCTET_STRING))
+    return decoded
+
+
+def peer_certificate(ssl_object: Any) -> Optional[Dict[str, Any]]:
+    """Return the decoded peer certificate of an ``ssl.SSLObject``/``SSLSocket``, if any."""
+    if ssl_object is None:
+        return None
+    try:
+        der = ssl_object.getpeercert(binary_form=True)
+        return decode_certificate(der) if der else None
+    except (CertificateError, ValueError):
+        return None
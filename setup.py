@@ -10,9 +10,8 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        "requests",
+        "aiohttp>=3.9,<4",
         "dnspython",
-        "urllib3",
         "textual>=0.58.0",
         "rich>=13.7.0",
     ],
@@ -22,7 +21,7 @@ setup(
         ],
     },
     package_data={
-        "neurosploit": ["data/*.txt", "prompts/*.txt", "*.tcss"],
+        "neurosploit": ["data/*.txt", "data/*.json", "prompts/*.txt", "*.tcss"],
     },
     author="Kamalesh",
     author_email="ragavhrxh@gmail.com",
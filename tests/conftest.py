@@ -0,0 +1,46 @@
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+TESTS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TESTS.parent))
+
+
+def free_port() -> int:
+    """A TCP port on 127.0.0.1 that nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def unused_port():
+    """Factory for free local TCP ports."""
+    return free_port
+
+
+@pytest.fixture
+def fake_nmap(tmp_path: Path) -> Path:
+    """Executable that behaves like ``nmap -oX -`` (see ``fake_nmap.py``)."""
+    binary = tmp_path / "nmap"
+    binary.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{TESTS / "fake_nmap.py"}" "$@"\n', encoding="utf-8")
+    binary.chmod(binary.stat().st_mode | stat.S_IXUSR)
+    return binary
+
+
+@pytest.fixture
+def nmap_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "runs.ndjson"
+    monkeypatch.setenv("FAKE_NMAP_LOG", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clean_fake_nmap_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in list(os.environ):
+        if name.startswith("FAKE_NMAP_"):
+            monkeypatch.delenv(name)
@@ -0,0 +1,66 @@
+"""Stand-in for ``nmap -oX -`` used by the tests.
+
+Writes one ``<host>`` element per address and host group, flushing after each group
+the way nmap does. Behavior is controlled through the environment:
+
+- ``FAKE_NMAP_LOG``: file that receives a JSON line when a run starts and ends.
+- ``FAKE_NMAP_SKIP``: comma-separated addresses left out of the output.
+- ``FAKE_NMAP_GATE``: file that must exist before groups after the first are written.
+- ``FAKE_NMAP_DELAY``: seconds to wait before exiting.
+"""
+
+import json
+import os
+import sys
+import time
+
+HOST = """<host><status state="up" reason="user-set"/>
+<address addr="{ip}" addrtype="{family}"/>
+<ports><port protocol="tcp" portid="22"><state state="open"/><service name="ssh" product="OpenSSH" version="9.6"/></port>
+<port protocol="tcp" portid="25"><state state="closed"/><service name="smtp"/></port>
+<port protocol="tcp" portid="80"><state state="open"/><service name="http"/></port></ports>
+</host>
+"""
+
+
+def log(event: str, ips: list) -> None:
+    path = os.environ.get("FAKE_NMAP_LOG")
+    if path:
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"event": event, "pid": os.getpid(), "ips": ips, "time": time.time()}) + "\n")
+
+
+def wait_for(path: str) -> None:
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def main(argv: list) -> None:
+    group_size = 0
+    for arg in argv:
+        if arg.startswith("--max-hostgroup="):
+            group_size = int(arg.split("=", 1)[1])
+    ips = argv[argv.index("-") + 1 :]
+    skip = set(filter(None, os.environ.get("FAKE_NMAP_SKIP", "").split(",")))
+    group_size = group_size or len(ips)
+    log("start", ips)
+
+    out = sys.stdout
+    out.write('<?xml version="1.0"?>\n<nmaprun scanner="nmap">\n')
+    out.flush()
+    for index in range(0, len(ips), group_size):
+        if index and os.environ.get("FAKE_NMAP_GATE"):
+            wait_for(os.environ["FAKE_NMAP_GATE"])
+        for ip in ips[index : index + group_size]:
+            if ip not in skip:
+                out.write(HOST.format(ip=ip, family="ipv6" if ":" in ip else "ipv4"))
+        out.flush()
+    time.sleep(float(os.environ.get("FAKE_NMAP_DELAY", "0")))
+    out.write("</nmaprun>\n")
+    out.flush()
+    log("end", ips)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
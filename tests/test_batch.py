@@ -0,0 +1,41 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from neurosploit.batch import run_batch
+from neurosploit.cli import main
+from neurosploit.core import AsyncNeuroRecon, ScanConfig
+
+OFFLINE = dict(enable_ct_logs=False, enable_dns_bruteforce=False, enable_http_probe=False, dns_cache_enabled=False)
+
+
+def test_shared_pool_counters_are_reported_once_per_batch(tmp_path: Path) -> None:
+    index = asyncio.run(run_batch(["a.example", "b.example"], ScanConfig(**OFFLINE), tmp_path, parallel_targets=2))
+
+    assert index["completed"] == 2
+    assert set(index["shared_resources"]) == {"dns_cache", "port_scan", "nmap_processes"}
+    for domain in ("a.example", "b.example"):
+        report = json.loads((tmp_path / f"{domain}.json").read_text(encoding="utf-8"))
+        assert report["port_scan"] == {"ports": report["scan_config"]["ports"], "max_sockets": 512, "shared": True}
+        assert report["dns_cache"] == {"enabled": False, "shared": True}
+        assert report["deep_analysis"]["nmap_processes"] is None
+
+
+def test_a_standalone_scan_reports_its_own_pools() -> None:
+    report = asyncio.run(AsyncNeuroRecon("a.example", config=ScanConfig(**OFFLINE)).run_full_recon())
+    assert "shared" not in report["port_scan"]
+    assert "shared" not in report["dns_cache"]
+    assert report["deep_analysis"]["nmap_processes"] == 0
+
+
+def test_targets_file_requires_headless(tmp_path: Path, monkeypatch, capsys) -> None:
+    targets = tmp_path / "scope.txt"
+    targets.write_text("a.example\n", encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["neurosploit", "--targets-file", str(targets)])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
+    assert "--targets-file is only supported with --headless" in capsys.readouterr().err
@@ -0,0 +1,287 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from neurosploit import concurrency
+from neurosploit.concurrency import AdaptiveLimiter, WorkerPool, gather_or_cancel, note_timeout
+from neurosploit.core import AsyncNeuroRecon, ScanConfig
+
+
+def test_gather_or_cancel_returns_results_in_order() -> None:
+    async def value(delay: float, result: int) -> int:
+        await asyncio.sleep(delay)
+        return result
+
+    assert asyncio.run(gather_or_cancel(value(0.02, 1), value(0, 2))) == [1, 2]
+
+
+def test_a_failure_cancels_the_siblings() -> None:
+    cancelled = []
+
+    async def blocked() -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def failing() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("stage failed")
+
+    async def scenario() -> None:
+        await asyncio.wait_for(gather_or_cancel(blocked(), failing(), blocked()), 5)
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        asyncio.run(scenario())
+    assert cancelled == [True, True]
+
+
+def test_a_failing_stage_does_not_leave_the_pipeline_blocked() -> None:
+    # With a one-slot queue the feeder is blocked on a full queue when the consumer
+    # fails; without cancellation the run would never finish.
+    async def worker(item: int) -> int:
+        return item + 1
+
+    async def on_result(result: int) -> None:
+        if result == 3:
+            raise RuntimeError("consumer failed")
+
+    async def scenario() -> None:
+        recon = AsyncNeuroRecon("example.test", config=ScanConfig(pipeline_queue_size=1, dns_cache_enabled=False))
+        try:
+            with pytest.raises(RuntimeError, match="consumer failed"):
+                await asyncio.wait_for(
+                    recon._bounded_run("test", range(10000), worker, 1, "test", on_result=on_result), 5
+                )
+            # The feeder and the other workers are gone, not left waiting on the queue.
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+        finally:
+            await recon.close()
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Manual clock for the limiter, so measured latencies are exact."""
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(concurrency, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def run_sequentially(limiter: AdaptiveLimiter, clock: SimpleNamespace, count: int, latency: float = 0.01, timeouts: int = 0) -> None:
+    async def scenario() -> None:
+        for index in range(count):
+            async with limiter.slot():
+                clock.now += latency
+                if index < timeouts:
+                    note_timeout()
+
+    asyncio.run(scenario())
+
+
+def test_slow_start_doubles_once_per_window(clock: SimpleNamespace) -> None:
+    limiter = AdaptiveLimiter(floor=1, ceiling=100, initial=4)
+    # Windows hold at least MIN_WINDOW (8) completions, otherwise ``limit`` of them.
+    run_sequentially(limiter, clock, 7)
+    assert limiter.limit == 4
+    run_sequentially(limiter, clock, 1)
+    assert limiter.limit == 8
+    run_sequentially(limiter, clock, 8 + 16)
+    assert limiter.limit == 32
+    run_sequentially(limiter, clock, 32 + 64)
+    assert limiter.limit == 100
+    assert limiter.stats["increases"] == 5
+
+
+def test_timeouts_halve_the_limit_and_end_slow_start(clock: SimpleNamespace) -> None:
+    limiter = AdaptiveLimiter(floor=2, ceiling=100, initial=16)
+    run_sequentially(limiter, clock, 16, timeouts=1)
+    # One timeout in 16 exceeds the 5% tolerance.
+    assert limiter.limit == 8
+    run_sequentially(limiter, clock, 8)
+    assert limiter.limit == 9
+    run_sequentially(limiter, clock, 9)
+    assert limiter.limit == 10
+    assert limiter.stats["timeouts"] == 1 and limiter.stats["decreases"] == 1
+
+
+def test_decreases_stop_at_the_floor(clock: SimpleNamespace) -> None:
+    limiter = AdaptiveLimiter(floor=3, ceiling=100, initial=8)
+    for _ in range(4):
+        run_sequentially(limiter, clock, 8, timeouts=8)
+    assert limiter.limit == 3
+    assert limiter.stats["decreases"] == 2
+
+
+def test_slow_windows_hold_the_limit(clock: SimpleNamespace) -> None:
+    limiter = AdaptiveLimiter(floor=1, ceiling=100, initial=8)
+    run_sequentially(limiter, clock, 8, latency=0.01)
+    assert limiter.limit == 16
+    run_sequentially(limiter, clock, 16, latency=0.05)
+    assert limiter.limit == 16
+    # Slow start has ended, so a healthy window now only adds one.
+    run_sequentially(limiter, clock, 16, latency=0.01)
+    assert limiter.limit == 17
+
+
+def test_latency_is_measured_from_start_clock(clock: SimpleNamespace) -> None:
+    limiter = AdaptiveLimiter(floor=1, ceiling=100, initial=8)
+    run_sequentially(limiter, clock, 8, latency=0.01)
+    assert limiter.limit == 16
+
+    async def scenario() -> None:
+        for _ in range(16):
+            async with limiter.slot() as outcome:
+                # A long wait for another resource, such as the shared batch budget.
+                clock.now += 1.0
+                outcome.start_clock()
+                clock.now += 0.01
+
+    asyncio.run(scenario())
+    # Measured from the slot, the window would look 100x slower and hold the limit.
+    assert limiter.limit == 32
+
+
+def test_errors_count_against_their_own_tolerance(clock: SimpleNamespace) -> None:
+    limiter = AdaptiveLimiter(floor=1, ceiling=100, initial=10)
+
+    async def scenario(failures: int) -> None:
+        for index in range(10):
+            try:
+                async with limiter.slot():
+                    clock.now += 0.01
+                    if index < failures:
+                        raise OSError("connection reset")
+            except OSError:
+                pass
+
+    asyncio.run(scenario(2))
+    assert limiter.limit == 20
+    asyncio.run(scenario(10))
+    # The window is max(MIN_WINDOW, limit) = 20 completions long.
+    asyncio.run(scenario(10))
+    assert limiter.limit == 10
+    assert limiter.stats["errors"] == 22
+
+
+def test_note_timeout_only_marks_the_current_slot() -> None:
+    note_timeout()  # No slot: nothing to mark, and no error.
+    limiter = AdaptiveLimiter(floor=1, ceiling=4, initial=2)
+
+    async def scenario() -> list:
+        outcomes = []
+
+        async def operation(times_out: bool) -> None:
+            async with limiter.slot() as outcome:
+                outcomes.append(outcome)
+                await asyncio.sleep(0)
+                if times_out:
+                    note_timeout()
+
+        await asyncio.gather(operation(True), operation(False))
+        return outcomes
+
+    timed_out, healthy = asyncio.run(scenario())
+    assert timed_out.timed_out and not healthy.timed_out
+    assert limiter.stats["timeouts"] == 1
+
+
+def test_a_burst_of_timeouts_halves_the_limit_once() -> None:
+    limiter = AdaptiveLimiter(floor=1, ceiling=64, initial=16)
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def operation() -> None:
+            async with limiter.slot():
+                await release.wait()
+                note_timeout()
+
+        tasks = [asyncio.ensure_future(operation()) for _ in range(32)]
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 16
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    # Operations admitted before the decrease are left out of the next window.
+    assert limiter.stats["timeouts"] == 32
+    assert limiter.stats["decreases"] == 1
+    assert limiter.limit == 8
+
+
+def test_worker_pool_starts_workers_as_its_size_grows() -> None:
+    size = {"value": 2}
+    started = []
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def worker() -> None:
+            started.append(True)
+            await release.wait()
+
+        pool = WorkerPool(worker, lambda: size["value"])
+        run = asyncio.ensure_future(pool.run())
+        await asyncio.sleep(0)
+        assert len(pool) == 2
+        size["value"] = 5
+        pool.grow()
+        await asyncio.sleep(0)
+        assert len(started) == 5
+        release.set()
+        await asyncio.wait_for(run, 5)
+
+    asyncio.run(scenario())
+
+
+def test_worker_pool_failure_cancels_the_other_workers() -> None:
+    cancelled = []
+
+    async def scenario() -> None:
+        calls = []
+
+        async def worker() -> None:
+            calls.append(True)
+            if len(calls) == 3:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("worker failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        await asyncio.wait_for(WorkerPool(worker, lambda: 3).run(), 5)
+
+    with pytest.raises(RuntimeError, match="worker failed"):
+        asyncio.run(scenario())
+    assert cancelled == [True, True]
+
+
+def test_stage_starts_workers_up_to_the_limit_not_the_ceiling() -> None:
+    peak = 0
+
+    async def worker(item: int) -> int:
+        nonlocal peak
+        peak = max(peak, len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        return item
+
+    async def scenario() -> int:
+        recon = AsyncNeuroRecon("example.test", config=ScanConfig(dns_cache_enabled=False))
+        try:
+            # The DNS phases start at 20 here and may grow to a ceiling of 1000.
+            results = await recon._bounded_run("dns_bruteforce", range(1, 101), worker, 20, "test")
+            assert sorted(results) == list(range(1, 101))
+            return recon._limiters["dns_bruteforce"].peak
+        finally:
+            await recon.close()
+
+    limit = asyncio.run(scenario())
+    assert 20 < limit < 1000
+    # One worker per slot of the highest limit, plus the test, the feeder and the stage.
+    assert peak <= limit + 3
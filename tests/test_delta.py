@@ -0,0 +1,77 @@
+from neurosploit.delta import PreviousScan, compute_delta
+
+
+def host(name: str, **fields) -> dict:
+    record = {
+        "subdomain": name,
+        "ip": "192.0.2.1",
+        "status_code": 200,
+        "protocol": "https",
+        "title": "Home",
+        "server": "nginx",
+        "technology": ["Nginx", "React"],
+        "open_ports": [443, 80],
+        "ssl_cert": {"serialNumber": "01"},
+    }
+    record.update(fields)
+    return record
+
+
+PREVIOUS = {
+    "timestamp": "2026-10-01T00:00:00+00:00",
+    "subdomains": [
+        ["www.example.test", "192.0.2.1"],
+        ["api.example.test", "192.0.2.1"],
+        ["old.example.test", "192.0.2.9"],
+    ],
+    "live_subdomains": [host("www.example.test"), host("api.example.test"), host("old.example.test")],
+    "scan_config": {"ports": [443, 80], "enable_nmap": False},
+}
+
+
+def test_new_disappeared_and_changed_hosts() -> None:
+    live = [
+        # Order-only differences in lists are not changes.
+        host("WWW.example.test", technology=["React", "Nginx"], open_ports=[80, 443]),
+        host("api.example.test", status_code=503, ssl_cert={"serialNumber": "02"}),
+        host("new.example.test"),
+    ]
+    names = [("www.example.test", "192.0.2.1"), ("api.example.test", "192.0.2.1"), ("new.example.test", "192.0.2.1")]
+    delta = compute_delta(PreviousScan(PREVIOUS), live, names)
+
+    assert delta["previous_scan"] == PREVIOUS["timestamp"]
+    assert delta["new_hosts"] == ["new.example.test"]
+    assert delta["disappeared_hosts"] == ["old.example.test"]
+    assert delta["changed_hosts"] == [
+        {
+            "subdomain": "api.example.test",
+            "changes": {
+                "status_code": {"before": 200, "after": 503},
+                "certificate_serial": {"before": "01", "after": "02"},
+            },
+        }
+    ]
+    assert delta["unchanged_hosts"] == 1
+    assert delta["new_names"] == ["new.example.test"]
+    assert delta["disappeared_names"] == ["old.example.test"]
+
+
+def test_enrichment_is_reused_only_for_unchanged_hosts_with_the_same_ports() -> None:
+    previous = PreviousScan(PREVIOUS)
+    unchanged = host("www.example.test", open_ports=None)
+    assert previous.reusable_enrichment(unchanged, [80, 443], nmap=False)["open_ports"] == [443, 80]
+    assert previous.reusable_enrichment(unchanged, [80, 443, 8080], nmap=False) is None
+    assert previous.reusable_enrichment(host("www.example.test", title="New"), [80, 443], nmap=False) is None
+    # The previous scan ran without nmap, so there is nothing to reuse for an nmap scan.
+    assert previous.reusable_enrichment(unchanged, [80, 443], nmap=True) is None
+
+
+def test_conditional_headers_need_the_same_address() -> None:
+    validated = host("www.example.test", etag='"abc"', last_modified="Mon, 05 Oct 2026 00:00:00 GMT")
+    previous = PreviousScan(dict(PREVIOUS, live_subdomains=[validated]))
+    assert previous.conditional_headers("www.example.test", "192.0.2.1") == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 05 Oct 2026 00:00:00 GMT",
+    }
+    assert previous.conditional_headers("www.example.test", "192.0.2.7") == {}
+    assert previous.conditional_headers("new.example.test", "192.0.2.1") == {}
@@ -0,0 +1,75 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from neurosploit import dns_cache
+from neurosploit.dns_cache import ResolutionCache
+from neurosploit.dns_engine import DNSAnswer
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Manual wall clock for cache expiry."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(dns_cache, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    cache = ResolutionCache(tmp_path / "cache.sqlite3", negative_ttl=300, max_ttl=3600)
+    yield cache
+    cache.close()
+
+
+def test_positive_answers_expire_with_their_ttl(cache: ResolutionCache, clock: SimpleNamespace) -> None:
+    cache.put(DNSAnswer("www.example.test", "A", "NOERROR", ("192.0.2.1", "192.0.2.2"), ("edge.example.net",), 60))
+    clock.now += 59
+    answer = cache.get("www.example.test", "A")
+    assert answer == DNSAnswer("www.example.test", "A", "NOERROR", ("192.0.2.1", "192.0.2.2"), ("edge.example.net",), 1)
+    clock.now += 1
+    assert cache.get("www.example.test", "A") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttls_are_capped(cache: ResolutionCache, clock: SimpleNamespace) -> None:
+    cache.put(DNSAnswer("www.example.test", "A", "NOERROR", ("192.0.2.1",), ttl=7 * 86400))
+    clock.now += 3600
+    assert cache.get("www.example.test", "A") is None
+
+
+def test_negative_answers_are_cached_for_negative_ttl(cache: ResolutionCache, clock: SimpleNamespace) -> None:
+    cache.put(DNSAnswer("missing.example.test", "A", "NXDOMAIN"))
+    cache.put(DNSAnswer("empty.example.test", "A", "NOERROR", ttl=86400))
+    clock.now += 299
+    assert cache.get("missing.example.test", "A").rcode == "NXDOMAIN"
+    assert cache.get("empty.example.test", "A").addresses == ()
+    clock.now += 1
+    assert cache.get("missing.example.test", "A") is None
+    assert cache.get("empty.example.test", "A") is None
+
+
+def test_transient_failures_are_not_cached(cache: ResolutionCache) -> None:
+    cache.put(DNSAnswer("flaky.example.test", "A", "SERVFAIL"))
+    cache.put(DNSAnswer("zero.example.test", "A", "NOERROR", ("192.0.2.1",), ttl=0))
+    assert cache.get("flaky.example.test", "A") is None
+    assert cache.get("zero.example.test", "A") is None
+
+
+def test_answers_persist_across_instances(tmp_path: Path, clock: SimpleNamespace) -> None:
+    path = tmp_path / "cache.sqlite3"
+    first = ResolutionCache(path)
+    first.put(DNSAnswer("www.example.test", "AAAA", "NOERROR", ("2001:db8::1",), ttl=600))
+    first.close()
+    assert first.stats()["stored"] == 1
+
+    second = ResolutionCache(path)
+    try:
+        assert second.get("www.example.test", "AAAA").addresses == ("2001:db8::1",)
+        assert second.get("www.example.test", "A") is None
+        second.purge()
+        assert second.get("www.example.test", "AAAA") is None
+        assert second.stats()["purged"] is True
+    finally:
+        second.close()
@@ -0,0 +1,60 @@
+import asyncio
+import socket
+
+import dns.message
+import dns.rrset
+import pytest
+
+from neurosploit.dns_engine import AsyncDNSEngine
+
+
+class Nameserver(asyncio.DatagramProtocol):
+    """Answers A queries, after a forged answer sent from another port."""
+
+    def __init__(self, genuine: bool) -> None:
+        self.genuine = genuine
+        self.spoofer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.spoofer.bind(("127.0.0.1", 0))
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def answer(self, query: dns.message.Message, address: str) -> bytes:
+        response = dns.message.make_response(query)
+        response.answer.append(dns.rrset.from_text(query.question[0].name, 60, "IN", "A", address))
+        return response.to_wire()
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        query = dns.message.from_wire(data)
+        # Same query id, wrong source: what an off-path attacker who guessed the id sends.
+        self.spoofer.sendto(self.answer(query, "192.0.2.66"), addr)
+        if self.genuine:
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, self.transport.sendto, self.answer(query, "192.0.2.1"), addr)
+
+
+def resolve(genuine: bool):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        transport, server = await loop.create_datagram_endpoint(
+            lambda: Nameserver(genuine), local_addr=("127.0.0.1", 0)
+        )
+        port = transport.get_extra_info("sockname")[1]
+        engine = AsyncDNSEngine(timeout=0.5, retries=0, nameservers=["127.0.0.1"], port=port)
+        try:
+            return await engine.resolve("www.example.test", use_cache=False)
+        finally:
+            await engine.close()
+            transport.close()
+            server.spoofer.close()
+
+    return asyncio.run(scenario())
+
+
+def test_answers_from_another_address_are_ignored() -> None:
+    assert resolve(genuine=True).addresses == ("192.0.2.1",)
+
+
+def test_only_a_forged_answer_is_a_timeout() -> None:
+    with pytest.raises(asyncio.TimeoutError):
+        resolve(genuine=False)
@@ -0,0 +1,52 @@
+import pytest
+
+from neurosploit.fingerprints import LiteralMatcher, load_fingerprint_engine
+
+# 0 always uses the prefix-tree scan, the large value always the per-literal search.
+PATHS = pytest.mark.parametrize("trie_threshold", [0, 1000])
+
+
+@PATHS
+def test_nested_and_overlapping_literals_are_all_reported(trie_threshold: int) -> None:
+    matcher = LiteralMatcher(
+        {"react": {"React"}, "react-dom": {"ReactDOM"}, "abcd": {"A"}, "cdef": {"C"}},
+        trie_threshold=trie_threshold,
+    )
+    assert matcher.scan("<script src=react-dom.js>") == {"React", "ReactDOM"}
+    assert matcher.scan("abcdef") == {"A", "C"}
+
+
+@PATHS
+def test_boundary_rejection_does_not_hide_other_matches(trie_threshold: int) -> None:
+    matcher = LiteralMatcher({"a.js": {"Outer"}, "js": {"Inner"}, "vue": {"Vue"}}, True, trie_threshold)
+    # "a.js" starts inside a word, but "js" inside it starts after a dot.
+    assert matcher.scan("xa.js") == {"Inner"}
+    # The first "vue" runs into "vuex"; the later standalone one still counts.
+    assert matcher.scan("vuex vue") == {"Vue"}
+    assert matcher.scan("vuex") == set()
+
+
+@PATHS
+def test_both_paths_agree(trie_threshold: int) -> None:
+    literals = {"wp-content": {"WordPress"}, "content": {"Content"}, "ng-app": {"Angular"}, "app": {"App"}}
+    text = "<div ng-app><img src=/wp-contents/x> content app-shell"
+    expected = LiteralMatcher(literals, True, 1000).scan(text)
+    assert expected == {"Angular", "Content", "App"}
+    assert LiteralMatcher(literals, True, trie_threshold).scan(text) == expected
+
+
+@PATHS
+def test_single_character_literals(trie_threshold: int) -> None:
+    matcher = LiteralMatcher({"$": {"Dollar"}, "$.ajax": {"Ajax"}, "_": {"Underscore"}}, True, trie_threshold)
+    assert matcher.scan("$.ajax(url)") == {"Dollar", "Ajax"}
+    assert matcher.scan("a_b") == {"Underscore"}
+
+
+def test_engine_reports_overlapping_body_signatures() -> None:
+    engine = load_fingerprint_engine()
+    found = engine.match({"Server": "nginx/1.25"}, '<link href="/wp-content/themes/x.css"><script src=jquery.min.js>')
+    assert {"Nginx", "WordPress", "jQuery"} <= set(found)
+
+
+def test_shipped_body_literals_use_the_single_pass_matcher() -> None:
+    assert load_fingerprint_engine()._body._starts is not None
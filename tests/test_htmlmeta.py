@@ -0,0 +1,66 @@
+import pytest
+
+from neurosploit import htmlmeta
+from neurosploit.htmlmeta import HeadMetadata, extract_head_metadata
+
+HEAD = """<!doctype html><html><head>
+<meta charset="utf-8"><title>
+  Example &amp;   Co
+</title>
+<meta name="Generator" content=" WordPress 6.6 ">
+<link rel="apple-touch-icon" href="/touch.png">
+<link rel="shortcut icon" href="/favicon.ico">
+<link rel="canonical" href="https://www.example.test/">
+"""
+
+
+@pytest.fixture
+def fed(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Characters handed to the HTML tokenizer, per ``feed`` call."""
+    sizes: list = []
+    original = htmlmeta._HeadParser.feed
+
+    def feed(self, data: str) -> None:
+        sizes.append(len(data))
+        original(self, data)
+
+    monkeypatch.setattr(htmlmeta._HeadParser, "feed", feed)
+    return sizes
+
+
+def test_head_metadata_is_extracted() -> None:
+    assert extract_head_metadata(HEAD + "</head><body></body></html>") == HeadMetadata(
+        title="Example & Co",
+        generator="WordPress 6.6",
+        favicon="/favicon.ico",
+        canonical="https://www.example.test/",
+    )
+
+
+def test_touch_icon_is_only_a_fallback() -> None:
+    assert extract_head_metadata('<link rel="apple-touch-icon" href="/touch.png">').favicon == "/touch.png"
+
+
+def test_parsing_stops_at_the_end_of_the_head(fed: list) -> None:
+    body = "<p>" + "filler " * 10000 + "</p>"
+    html = HEAD + "</head><body><title>Not this</title><meta name=generator content=Other>" + body
+    meta = extract_head_metadata(html, limit=len(html))
+    assert meta.title == "Example & Co" and meta.generator == "WordPress 6.6"
+    # Only the head, up to and including "</head>", reached the tokenizer.
+    assert sum(fed) == len(HEAD) + len("</head>")
+
+
+def test_a_body_tag_ends_a_head_without_closing_tag(fed: list) -> None:
+    html = "<title>Open</title><body>" + "<div>x</div>" * 5000 + "<meta name=generator content=Late>"
+    meta = extract_head_metadata(html)
+    assert meta.title == "Open" and meta.generator is None
+    assert sum(fed) == len("<title>Open</title><body>")
+
+
+def test_nothing_past_the_limit_is_parsed(fed: list) -> None:
+    html = "<head><title>" + "t" * 400 + "</title>" + "<meta name=generator content=Late></head>"
+    meta = extract_head_metadata(html, limit=300)
+    assert sum(fed) == 300
+    # A title cut off by the limit keeps what was read, capped at 160 characters.
+    assert meta.title == "t" * 160
+    assert meta.generator is None
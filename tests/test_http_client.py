@@ -0,0 +1,41 @@
+import asyncio
+import ssl
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from neurosploit.http_client import response_ssl_object  # noqa: E402
+from neurosploit.x509 import peer_certificate  # noqa: E402
+
+DATA = Path(__file__).resolve().parent / "data"
+
+
+@pytest.mark.parametrize("size", [16, 4 * 1024 * 1024])
+def test_ssl_object_of_the_serving_connection(size: int, unused_port) -> None:
+    # Small bodies hand the connection back to the pool before the response is read;
+    # large ones keep it attached. Both must expose the server's certificate.
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(body=b"x" * size)
+
+    async def scenario() -> dict:
+        app = web.Application()
+        app.router.add_get("/", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(DATA / "localhost.pem", DATA / "localhost.key")
+        port = unused_port()
+        await web.TCPSite(runner, "127.0.0.1", port, ssl_context=context).start()
+        try:
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
+                async with session.get(f"https://127.0.0.1:{port}/") as response:
+                    return peer_certificate(response_ssl_object(response))
+        finally:
+            await runner.cleanup()
+
+    certificate = asyncio.run(scenario())
+    assert certificate is not None
+    assert certificate["subject"][-1] == (("commonName", "localhost"),)
@@ -0,0 +1,62 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from neurosploit.core import ScanConfig
+from neurosploit.journal import ScanJournal
+
+
+async def write_unfinished(path: Path, fingerprint: str) -> None:
+    journal = await ScanJournal(path, "example.com", fingerprint=fingerprint).open()
+    journal.record("http_probe", "www.example.com", {"status_code": 200})
+    await journal.close()
+
+
+def reopen(path: Path, fingerprint: str, max_age: float = 0) -> ScanJournal:
+    async def scenario() -> ScanJournal:
+        journal = await ScanJournal(path, "example.com", fingerprint=fingerprint, max_age=max_age).open(resume=True)
+        await journal.close()
+        return journal
+
+    return asyncio.run(scenario())
+
+
+def test_resumes_a_journal_with_the_same_settings(tmp_path: Path) -> None:
+    path = tmp_path / "scan.ndjson"
+    asyncio.run(write_unfinished(path, "abc"))
+    journal = reopen(path, "abc", max_age=3600)
+    assert journal.resumed and journal.stale is None
+    assert journal.lookup("http_probe", "www.example.com") == (True, {"status_code": 200})
+
+
+def test_changed_settings_start_a_new_journal(tmp_path: Path) -> None:
+    path = tmp_path / "scan.ndjson"
+    asyncio.run(write_unfinished(path, "abc"))
+    journal = reopen(path, "def")
+    assert not journal.resumed
+    assert journal.stale == "scan settings changed"
+    assert journal.lookup("http_probe", "www.example.com") == (False, None)
+    assert json.loads(path.read_text(encoding="utf-8").splitlines()[0])["config"] == "def"
+
+
+def test_old_journals_are_not_resumed(tmp_path: Path) -> None:
+    path = tmp_path / "scan.ndjson"
+    asyncio.run(write_unfinished(path, "abc"))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    header = json.loads(lines[0])
+    header["started_at"] = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+    path.write_text("\n".join([json.dumps(header)] + lines[1:]) + "\n", encoding="utf-8")
+    aged = path.read_text(encoding="utf-8")
+
+    assert reopen(path, "abc", max_age=0).resumed
+    path.write_text(aged, encoding="utf-8")
+    assert reopen(path, "abc", max_age=86400).stale == "older than the resume age limit"
+
+
+def test_fingerprint_ignores_pacing_but_not_scope() -> None:
+    base = ScanConfig()
+    assert ScanConfig(max_concurrency=5, progress_interval=0, resume=True).fingerprint() == base.fingerprint()
+    assert ScanConfig(ports=[22]).fingerprint() != base.fingerprint()
+    assert ScanConfig(enable_nmap=True).fingerprint() != base.fingerprint()
+    assert ScanConfig(wordlist_path="words.txt").fingerprint() != base.fingerprint()
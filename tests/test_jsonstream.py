@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from neurosploit.jsonstream import JSONArrayStream
+
+DOCUMENT = json.dumps(
+    [
+        {"name_value": "a.example.com\n*.b.example.com", "id": 1},
+        {"text": 'brackets ] and commas , and "quotes" inside', "escaped": "\\u00e9\\\\"},
+        [1, [2, [3]], {"nested": []}],
+        "plain string",
+        12345,
+        -1.5e3,
+        0.25,
+        True,
+        None,
+        {"unicode": "café ☃ \U0001f600"},
+    ],
+    ensure_ascii=False,
+    indent=1,
+)
+
+
+def decode(chunks) -> list:
+    stream = JSONArrayStream()
+    items = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    return items + stream.close()
+
+
+def test_every_split_point_decodes_the_same() -> None:
+    expected = json.loads(DOCUMENT)
+    for split in range(len(DOCUMENT) + 1):
+        assert decode([DOCUMENT[:split], DOCUMENT[split:]]) == expected, split
+
+
+def test_single_character_chunks() -> None:
+    assert decode(DOCUMENT) == json.loads(DOCUMENT)
+
+
+def test_numbers_wait_for_their_delimiter() -> None:
+    stream = JSONArrayStream()
+    assert stream.feed("[1") == []
+    assert stream.feed(".") == []
+    assert stream.feed("5") == []
+    assert stream.feed(" ,2") == [1.5]
+    assert stream.feed("]") == [2]
+    assert stream.close() == []
+
+
+def test_elements_are_released_as_soon_as_they_are_complete() -> None:
+    stream = JSONArrayStream()
+    assert stream.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    assert stream.feed(": 2}") == [{"b": 2}]
+
+
+def test_empty_array() -> None:
+    assert decode(["[", " ", "]"]) == []
+
+
+def test_truncated_document_raises_on_close() -> None:
+    stream = JSONArrayStream()
+    stream.feed('[{"a": 1}, {"b": ')
+    with pytest.raises(ValueError, match="Truncated"):
+        stream.close()
+
+
+def test_rejects_documents_that_are_not_arrays() -> None:
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        JSONArrayStream().feed('{"a": 1}')
+
+
+def test_oversized_element_is_rejected() -> None:
+    stream = JSONArrayStream()
+    stream.MAX_PENDING_CHARS = 16
+    with pytest.raises(ValueError, match="buffer limit"):
+        stream.feed('["' + "x" * 32)
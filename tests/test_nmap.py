@@ -0,0 +1,108 @@
+import asyncio
+import json
+from pathlib import Path
+
+from neurosploit.nmap import NmapRunner
+
+
+def runs(log: Path) -> list:
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_results_follow_the_xml_layout(fake_nmap: Path) -> None:
+    async def scenario() -> dict:
+        runner = NmapRunner(binary=str(fake_nmap), batch_window=0.01)
+        try:
+            return await runner.scan("10.0.0.1")
+        finally:
+            await runner.close()
+
+    result = asyncio.run(scenario())
+    assert result == {
+        "state": "up",
+        "open_ports": [
+            {"port": 22, "protocol": "tcp", "service": "ssh", "version": "OpenSSH 9.6"},
+            {"port": 80, "protocol": "tcp", "service": "http"},
+        ],
+    }
+
+
+def test_each_host_group_is_released_as_it_streams(fake_nmap: Path, tmp_path: Path, monkeypatch) -> None:
+    gate = tmp_path / "gate"
+    monkeypatch.setenv("FAKE_NMAP_GATE", str(gate))
+
+    async def scenario() -> None:
+        runner = NmapRunner(binary=str(fake_nmap), parallelism=1, batch_window=0.01)
+        try:
+            first = asyncio.ensure_future(runner.scan("10.0.0.1"))
+            second = asyncio.ensure_future(runner.scan("10.0.0.2"))
+            # The second group is held back until the gate opens, so the first result
+            # can only arrive here if it is parsed while nmap is still running.
+            assert (await asyncio.wait_for(first, 5))["state"] == "up"
+            assert not second.done()
+            assert len(runner._processes) == 1
+            gate.touch()
+            assert (await asyncio.wait_for(second, 5))["state"] == "up"
+            assert runner.stats["processes"] == 1
+        finally:
+            await runner.close()
+
+    asyncio.run(scenario())
+
+
+def test_hosts_missing_from_the_xml_are_unknown(fake_nmap: Path, monkeypatch) -> None:
+    monkeypatch.setenv("FAKE_NMAP_SKIP", "10.0.0.2")
+
+    async def scenario() -> list:
+        runner = NmapRunner(binary=str(fake_nmap), batch_window=0.01)
+        try:
+            results = await asyncio.gather(runner.scan("10.0.0.1"), runner.scan("10.0.0.2"))
+            assert runner.stats["failed_hosts"] == 1
+            return results
+        finally:
+            await runner.close()
+
+    found, missing = asyncio.run(scenario())
+    assert found["state"] == "up"
+    assert missing["state"] == "unknown"
+    assert missing["open_ports"] == []
+    assert missing["exit_code"] == 0
+    assert "no result" in missing["error"]
+
+
+def test_missing_binary_degrades_gracefully(tmp_path: Path) -> None:
+    async def scenario() -> list:
+        runner = NmapRunner(binary=str(tmp_path / "no-such-nmap"), batch_window=0.01)
+        try:
+            return await asyncio.gather(runner.scan("10.0.0.1"), runner.scan("10.0.0.2"))
+        finally:
+            await runner.close()
+
+    for result in asyncio.run(scenario()):
+        assert result == {"state": "unknown", "open_ports": [], "error": "nmap not installed", "exit_code": None}
+
+
+def test_batch_size_and_process_caps(fake_nmap: Path, nmap_log: Path, monkeypatch) -> None:
+    monkeypatch.setenv("FAKE_NMAP_DELAY", "0.2")
+    ips = [f"10.0.0.{index}" for index in range(1, 8)]
+
+    async def scenario() -> list:
+        runner = NmapRunner(binary=str(fake_nmap), batch_size=2, processes=2, batch_window=0.01)
+        try:
+            results = await asyncio.gather(*(runner.scan(ip) for ip in ips + ips[:2]))
+            assert runner.stats == {"hosts": 7, "processes": 4, "failed_hosts": 0}
+            return results
+        finally:
+            await runner.close()
+
+    assert all(result["state"] == "up" for result in asyncio.run(scenario()))
+    events = runs(nmap_log)
+    starts = [event for event in events if event["event"] == "start"]
+    assert sorted(ip for event in starts for ip in event["ips"]) == sorted(ips)
+    assert all(len(event["ips"]) <= 2 for event in starts)
+
+    running = peak = 0
+    for event in sorted(events, key=lambda event: (event["time"], event["event"] == "start")):
+        running += 1 if event["event"] == "start" else -1
+        peak = max(peak, running)
+    assert peak == 2
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from neurosploit.portscan import AsyncPortScanner, _HostRTT
+
+
+def scanner_with_rtt(*samples: float, min_timeout: float = 0.25) -> AsyncPortScanner:
+    scanner = AsyncPortScanner(min_timeout=min_timeout, max_timeout=1.5, rtt_multiplier=2.0)
+    estimate = scanner._rtt.setdefault("192.0.2.1", _HostRTT())
+    for sample in samples:
+        estimate.observe(sample)
+    return scanner
+
+
+def test_unmeasured_hosts_get_the_full_timeout() -> None:
+    assert AsyncPortScanner(max_timeout=1.5).timeout_for("192.0.2.1") == 1.5
+
+
+@pytest.mark.parametrize(
+    "samples, expected",
+    [
+        # 2 * (srtt + 4 * rttvar) with rttvar = srtt / 2 after the first sample.
+        ((0.1,), 0.6),
+        ((0.001,), 0.25),
+        ((0.5,), 1.5),
+    ],
+)
+def test_timeouts_follow_the_rtt_within_bounds(samples: tuple, expected: float) -> None:
+    assert scanner_with_rtt(*samples).timeout_for("192.0.2.1") == pytest.approx(expected)
+
+
+def test_steady_samples_shrink_the_variance() -> None:
+    scanner = scanner_with_rtt(*([0.1] * 20), min_timeout=0.01)
+    # The variance decays toward zero, so the timeout approaches 2 * srtt.
+    assert scanner.timeout_for("192.0.2.1") == pytest.approx(0.2, abs=0.005)
+
+
+def test_scan_reports_open_ports_and_measures_the_rtt(unused_port) -> None:
+    async def scenario() -> tuple:
+        server = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+        open_port = server.sockets[0].getsockname()[1]
+        closed_port = unused_port()
+        scanner = AsyncPortScanner(min_timeout=0.25, max_timeout=1.5)
+        try:
+            found = await scanner.scan("127.0.0.1", [closed_port, open_port, open_port], seed_ports=[closed_port])
+            return found, open_port, scanner
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    found, open_port, scanner = asyncio.run(scenario())
+    assert found == [open_port]
+    assert scanner.stats == {"hosts": 1, "probes": 2, "open": 1, "closed": 1, "filtered": 0, "errors": 0}
+    # Loopback answers in well under a millisecond, so later probes get the floor.
+    assert scanner.timeout_for("127.0.0.1") == 0.25
@@ -0,0 +1,158 @@
+import asyncio
+import ssl
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from neurosploit.concurrency import AdaptiveLimiter  # noqa: E402
+from neurosploit.core import AsyncNeuroRecon, ScanConfig  # noqa: E402
+
+DATA = Path(__file__).resolve().parent / "data"
+PAGE = b"<html><head><title>Sized</title></head><body>" + b"x" * 4000 + b"</body></html>"
+
+
+async def chunked(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse()
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    for _ in range(8):
+        await response.write(PAGE)
+    return response
+
+
+async def sized(request: web.Request) -> web.Response:
+    return web.Response(body=PAGE, content_type="text/html")
+
+
+def probe(handler, body_limit: int, unused_port) -> dict:
+    async def scenario() -> dict:
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        port = unused_port()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        config = ScanConfig(http_port=port, https_port=unused_port(), probe_body_limit=body_limit, dns_cache_enabled=False)
+        recon = AsyncNeuroRecon("example.test", config=config)
+        try:
+            return await recon.check_subdomain_alive(("www.example.test", "127.0.0.1"))
+        finally:
+            await recon.close()
+            await runner.cleanup()
+
+    return asyncio.run(scenario())
+
+
+def test_truncated_chunked_response_keeps_its_size(unused_port) -> None:
+    result = probe(chunked, 1024, unused_port)
+    assert result["body_truncated"] is True
+    assert result["content_length"] == result["body_bytes_read"] == 1024
+    assert result["declared_length"] is None
+
+
+def test_truncated_sized_response_reports_the_declared_size(unused_port) -> None:
+    result = probe(sized, 1024, unused_port)
+    assert result["title"] == "Sized"
+    assert result["body_truncated"] is True
+    assert result["body_bytes_read"] == 1024
+    assert result["content_length"] == result["declared_length"] == len(PAGE)
+
+    result = probe(sized, 64 * 1024, unused_port)
+    assert result["body_truncated"] is False
+    assert result["content_length"] == result["declared_length"] == len(PAGE)
+
+
+def probe_https(subdomain: str, unused_port) -> dict:
+    """Probe ``subdomain`` against a local HTTPS server that redirects some hosts elsewhere."""
+
+    async def page(request: web.Request) -> web.Response:
+        host = request.host.split(":")[0]
+        if host.startswith("sso.") and request.path == "/":
+            # Another origin: same server, but reached through a different host name.
+            raise web.HTTPFound(f"https://127.0.0.1:{request.url.port}/login")
+        if host.startswith("home.") and request.path == "/":
+            raise web.HTTPFound("/home")
+        return web.Response(body=PAGE, content_type="text/html")
+
+    async def scenario() -> dict:
+        app = web.Application()
+        app.router.add_get("/{path:.*}", page)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(DATA / "localhost.pem", DATA / "localhost.key")
+        port = unused_port()
+        await web.TCPSite(runner, "127.0.0.1", port, ssl_context=context).start()
+        config = ScanConfig(https_port=port, http_port=unused_port(), dns_cache_enabled=False)
+        recon = AsyncNeuroRecon("example.test", config=config)
+        try:
+            return await recon.check_subdomain_alive((subdomain, "127.0.0.1"))
+        finally:
+            await recon.close()
+            await runner.cleanup()
+
+    return asyncio.run(scenario())
+
+
+def test_certificate_is_kept_for_the_probed_origin(unused_port) -> None:
+    direct = probe_https("www.example.test", unused_port)
+    assert direct["protocol"] == "https"
+    assert direct["ssl_cert"]["subject"][-1] == (("commonName", "localhost"),)
+    # A redirect that stays on the same host and port still describes this host.
+    assert "ssl_cert" in probe_https("home.example.test", unused_port)
+
+
+def test_certificate_of_a_redirect_target_is_dropped(unused_port) -> None:
+    result = probe_https("sso.example.test", unused_port)
+    assert result["protocol"] == "https" and result["status_code"] == 200
+    # Left unset so enrichment makes its own handshake with the probed host.
+    assert "ssl_cert" not in result
+
+
+def probe_in_slot(http_answers: bool, unused_port) -> tuple:
+    """Probe with an HTTPS port that accepts connections but never answers."""
+
+    async def hang(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.read()
+        writer.close()
+
+    async def scenario() -> tuple:
+        silent = await asyncio.start_server(hang, "127.0.0.1", 0)
+        silent_port = silent.sockets[0].getsockname()[1]
+        app = web.Application()
+        app.router.add_get("/", sized)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        http_port = unused_port()
+        if http_answers:
+            await web.TCPSite(runner, "127.0.0.1", http_port).start()
+        else:
+            http_port = silent_port
+        config = ScanConfig(timeout=1, https_port=silent_port, http_port=http_port, dns_cache_enabled=False)
+        recon = AsyncNeuroRecon("example.test", config=config)
+        limiter = AdaptiveLimiter(floor=1, ceiling=1)
+        try:
+            async with limiter.slot() as outcome:
+                result = await recon.check_subdomain_alive(("www.example.test", "127.0.0.1"))
+            return result, outcome.timed_out
+        finally:
+            await recon.close()
+            await runner.cleanup()
+            silent.close()
+
+    return asyncio.run(scenario())
+
+
+def test_https_timeout_before_a_working_http_site_is_not_congestion(unused_port) -> None:
+    result, timed_out = probe_in_slot(True, unused_port)
+    assert result["protocol"] == "http"
+    assert timed_out is False
+
+
+def test_a_host_that_times_out_on_every_protocol_is(unused_port) -> None:
+    result, timed_out = probe_in_slot(False, unused_port)
+    assert result is None
+    assert timed_out is True
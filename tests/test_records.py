@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+
+from neurosploit.records import LIVE_HOST_FIELDS, CandidateSet, LiveHost
+
+
+def test_live_host_round_trips_to_the_report_record() -> None:
+    record = {
+        "subdomain": "www.example.test",
+        "ip": "192.0.2.1",
+        "status_code": 200,
+        "technology": ["Nginx", "React"],
+        "favicon": None,
+        "custom": {"kept": True},
+    }
+    host = LiveHost.from_dict(record)
+    # Fields that were never set stay out of the output, unknown keys are kept.
+    assert host.to_dict() == record
+    assert list(host.to_dict()) == [name for name in LIVE_HOST_FIELDS if name in record] + ["custom"]
+
+
+def test_live_host_reads_like_a_dict() -> None:
+    host = LiveHost.from_dict({"subdomain": "www.example.test", "favicon": None, "technology": ["PHP"]})
+    assert host["technology"] == ("PHP",)
+    assert "favicon" in host and "title" not in host and 1 not in host
+    assert host.get("title", "No Title") == "No Title"
+    assert host.get("favicon", "unset") is None
+    with pytest.raises(KeyError):
+        host["title"]
+    host["nmap"] = {"state": "up"}
+    host["extra"] = 1
+    assert host["nmap"] == {"state": "up"} and host["extra"] == 1
+
+
+def test_repeated_strings_are_interned() -> None:
+    first = LiveHost.from_dict({"ip": "".join(["192.0.2.", "1"]), "technology": ["".join(["Ng", "inx"])]})
+    second = LiveHost.from_dict({"ip": "".join(["192.0.2", ".1"]), "technology": ["".join(["Ngi", "nx"])]})
+    assert first["ip"] is second["ip"] is sys.intern("192.0.2.1")
+    assert first["technology"][0] is second["technology"][0]
+
+
+def test_candidate_set_behaves_like_a_set_of_pairs() -> None:
+    candidates = CandidateSet([("b.example.test", "192.0.2.1"), ("a.example.test", "192.0.2.1")])
+    candidates.add(("b.example.test", "192.0.2.1"))
+    candidates.add(("b.example.test", "192.0.2.2"))
+    assert len(candidates) == 3
+    assert ("b.example.test", "192.0.2.2") in candidates
+    assert ("b.example.test", "192.0.2.3") not in candidates
+    assert ("c.example.test", "192.0.2.1") not in candidates
+    assert "a.example.test" not in candidates
+    assert set(candidates) == {
+        ("a.example.test", "192.0.2.1"),
+        ("b.example.test", "192.0.2.1"),
+        ("b.example.test", "192.0.2.2"),
+    }
+    assert [name for name, _ in candidates.sorted_pairs()] == ["a.example.test", "b.example.test", "b.example.test"]
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from neurosploit import core
+from neurosploit.core import AsyncNeuroRecon, ScanConfig
+from neurosploit.dns_engine import DNSAnswer
+
+OFFLINE = dict(enable_ct_logs=False, enable_http_probe=False, dns_cache_enabled=False)
+
+
+class FakeEngine:
+    def __init__(self, answer):
+        self.answer = answer
+
+    async def resolve(self, name: str, rdtype: str = "A", use_cache: bool = True) -> DNSAnswer:
+        if isinstance(self.answer, BaseException):
+            raise self.answer
+        return DNSAnswer(name, rdtype, *self.answer)
+
+    async def close(self) -> None:
+        pass
+
+
+def wildcard_section(answer, monkeypatch, tmp_path) -> dict:
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("www\n", encoding="utf-8")
+    recon = AsyncNeuroRecon("example.test", config=ScanConfig(wordlist_path=str(wordlist), **OFFLINE))
+    monkeypatch.setattr(recon.resources, "dns_engine", lambda: FakeEngine(answer))
+    return asyncio.run(recon.run_full_recon())["wildcard_dns"]
+
+
+def test_checked_when_the_probes_were_answered(monkeypatch, tmp_path) -> None:
+    section = wildcard_section(("NXDOMAIN",), monkeypatch, tmp_path)
+    assert section["checked"] is True and section["detected"] is False
+
+    section = wildcard_section(("NOERROR", ("192.0.2.1",)), monkeypatch, tmp_path)
+    assert section["checked"] is True and section["addresses"] == ["192.0.2.1"]
+
+
+@pytest.mark.parametrize("answer", [asyncio.TimeoutError(), ("SERVFAIL",)])
+def test_not_checked_when_no_probe_got_an_answer(answer, monkeypatch, tmp_path) -> None:
+    assert wildcard_section(answer, monkeypatch, tmp_path)["checked"] is False
+
+
+def test_not_checked_without_dnspython(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(core, "dns_resolver", None)
+    assert wildcard_section(("NXDOMAIN",), monkeypatch, tmp_path)["checked"] is False
@@ -0,0 +1,51 @@
+import asyncio
+from pathlib import Path
+
+from neurosploit.core import AsyncNeuroRecon, ScanConfig
+
+
+def test_custom_wordlist_is_deduplicated_in_file_order(tmp_path: Path) -> None:
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("www\n# comment\nAPI\nmail\n\napi\nnot a label\nwww\ndev\n", encoding="utf-8")
+    recon = AsyncNeuroRecon("example.test", config=ScanConfig(wordlist_path=str(wordlist), dns_cache_enabled=False))
+    assert list(recon.iter_subdomain_wordlist()) == ["www", "api", "mail", "dev"]
+
+
+def test_built_in_wordlist_has_no_duplicates() -> None:
+    words = AsyncNeuroRecon("example.test", config=ScanConfig(dns_cache_enabled=False)).load_subdomain_wordlist()
+    assert words and len(words) == len(set(words))
+
+
+def test_generators_are_pulled_no_further_than_the_queue() -> None:
+    pulled = []
+
+    def items():
+        for index in range(100000):
+            pulled.append(index)
+            yield index
+
+    async def done(result: int) -> None:
+        pass
+
+    async def scenario() -> None:
+        release = asyncio.Event()
+
+        async def worker(item: int) -> int:
+            await release.wait()
+            return item
+
+        config = ScanConfig(pipeline_queue_size=4, adaptive_concurrency=False, dns_cache_enabled=False)
+        recon = AsyncNeuroRecon("example.test", config=config)
+        try:
+            run = asyncio.ensure_future(recon._bounded_run("test", items(), worker, 2, "test", on_result=done))
+            for _ in range(20):
+                await asyncio.sleep(0)
+            # Two items held by the workers, four queued and one waiting to be put.
+            assert len(pulled) <= 7
+            release.set()
+            await asyncio.wait_for(run, 30)
+        finally:
+            await recon.close()
+
+    asyncio.run(scenario())
+    assert len(pulled) == 100000
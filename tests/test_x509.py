@@ -0,0 +1,63 @@
+import locale
+import ssl
+from pathlib import Path
+
+import pytest
+
+from neurosploit.x509 import _UTC_TIME, CertificateError, _time, decode_certificate
+
+CERTIFICATE = Path(__file__).resolve().parent / "data" / "localhost.pem"
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def test_dates_use_english_month_names() -> None:
+    for month, name in enumerate(MONTHS, start=1):
+        assert _time((_UTC_TIME, f"24{month:02d}05093000Z".encode())) == f"{name}  5 09:30:00 2024 GMT"
+
+
+def test_dates_do_not_follow_the_locale() -> None:
+    previous = locale.setlocale(locale.LC_TIME)
+    for name in ("de_DE.UTF-8", "fr_FR.UTF-8", "de_DE", "fr_FR"):
+        try:
+            locale.setlocale(locale.LC_TIME, name)
+            break
+        except locale.Error:
+            continue
+    else:
+        pytest.skip("no non-English locale installed")
+    try:
+        assert _time((_UTC_TIME, b"241205093000Z")) == "Dec  5 09:30:00 2024 GMT"
+    finally:
+        locale.setlocale(locale.LC_TIME, previous)
+
+
+def der() -> bytes:
+    return ssl.PEM_cert_to_DER_cert(CERTIFICATE.read_text(encoding="ascii"))
+
+
+def test_decodes_a_known_certificate() -> None:
+    name = ((("countryName", "US"),), (("organizationName", "NeuroSploit Tests"),), (("commonName", "localhost"),))
+    assert decode_certificate(der()) == {
+        "subject": name,
+        "issuer": name,
+        "version": 3,
+        "serialNumber": "C0FFEE",
+        "notBefore": "Oct 18 08:04:01 2026 GMT",
+        # After 2049 the validity uses GeneralizedTime instead of UTCTime.
+        "notAfter": "Sep 24 08:04:01 2126 GMT",
+        "subjectAltName": (("DNS", "localhost"), ("DNS", "*.example.test"), ("IP Address", "127.0.0.1")),
+    }
+
+
+def test_matches_the_standard_library_decoder() -> None:
+    reference = getattr(getattr(ssl, "_ssl", None), "_test_decode_cert", None)
+    if reference is None:
+        pytest.skip("this Python has no reference certificate decoder")
+    assert decode_certificate(der()) == reference(str(CERTIFICATE))
+
+
+@pytest.mark.parametrize("data", [b"", b"\x30\x00", b"\x04\x03abc", der()[:200]])
+def test_malformed_input_raises_certificate_error(data: bytes) -> None:
+    with pytest.raises(CertificateError):
+        decode_certificate(data)